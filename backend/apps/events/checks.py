@@ -0,0 +1,30 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+# Cache backends whose entries only exist in the current process
+PROCESS_LOCAL_CACHES = [
+     'django.core.cache.backends.locmem.LocMemCache',
+     'django.core.cache.backends.dummy.DummyCache',
+]
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+     """
+     Public event ETags and Last-Modified come from version keys in the default cache
+
+     With a process-local cache every worker has its own versions, so validators
+     differ between workers and conditional requests stop returning 304.
+     """
+     backend = settings.CACHES.get('default', {}).get('BACKEND')
+
+     if settings.DEBUG or backend not in PROCESS_LOCAL_CACHES:
+          return []
+
+     return [
+          Warning(
+               f"The default cache ({backend}) is not shared between processes.",
+               hint="Public event ETags and cache invalidation need a shared cache such as Redis (REDIS_CACHE_URL).",
+               id='events.W001',
+          )
+     ]
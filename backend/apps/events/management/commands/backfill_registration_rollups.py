@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+from apps.events.models import Event
+from services.analytics.registration_rollup_service import RegistrationRollupService
+
+
+class Command(BaseCommand):
+     help = 'Rebuild the hourly registration rollups from attendee rows'
+
+     def add_arguments(self, parser):
+          parser.add_argument(
+               '--event-id',
+               type=int,
+               help='Only rebuild rollups for this event'
+          )
+
+     def handle(self, *args, **options):
+          event_ids = Event.objects.all().order_by('id').values_list('id', flat=True)
+          
+          if options['event_id']:
+               event_ids = event_ids.filter(id=options['event_id'])
+          
+          events = 0
+          rows = 0
+          for event_id in event_ids.iterator():
+               rows += RegistrationRollupService.backfill_event(event_id)
+               events += 1
+          
+          self.stdout.write(
+               self.style.SUCCESS(f'Successfully rebuilt {rows} rollup rows for {events} events')
+          )
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+from django.db.models import F
+from apps.events.models import Event, EventStatus
+from services.attendee.waitlist_service import WaitlistService
+
+
+class Command(BaseCommand):
+     help = 'Promote waitlisted attendees into free seats for all active events'
+
+     def add_arguments(self, parser):
+          parser.add_argument(
+               '--no-notify',
+               action='store_true',
+               help='Promote without sending promotion emails'
+          )
+
+     def handle(self, *args, **options):
+          # Counters make this a cheap scan: only events with both free seats and a waitlist
+          event_ids = Event.objects.filter(
+               status__in=[EventStatus.PUBLISHED, EventStatus.ONGOING],
+               waitlisted_count__gt=0,
+               confirmed_count__lt=F('capacity')
+          ).values_list('id', flat=True)
+          
+          promoted_total = 0
+          for event_id in event_ids:
+               promoted = WaitlistService.promote_waitlisted_attendees(
+                    event_id, send_notifications=not options['no_notify']
+               )
+               
+               if promoted:
+                    promoted_total += len(promoted)
+                    self.stdout.write(f"Event {event_id}: promoted {len(promoted)} attendees")
+          
+          self.stdout.write(
+               self.style.SUCCESS(f'Successfully promoted {promoted_total} waitlisted attendees')
+          )
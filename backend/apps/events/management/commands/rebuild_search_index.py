@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from services.search.event_search_service import EventSearchService
+
+
+class Command(BaseCommand):
+     help = 'Rebuild the full-text search index for public events'
+
+     def handle(self, *args, **options):
+          indexed = EventSearchService.rebuild_index()
+          
+          self.stdout.write(
+               self.style.SUCCESS(f'Successfully indexed {indexed} events')
+          )
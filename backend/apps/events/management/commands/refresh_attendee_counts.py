@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from apps.events.models import Event
+
+
+class Command(BaseCommand):
+     help = 'Recalculate the denormalized attendee counters on events'
+
+     def add_arguments(self, parser):
+          parser.add_argument(
+               '--event-id',
+               type=int,
+               help='Only recalculate counters for this event'
+          )
+
+     def handle(self, *args, **options):
+          events = Event.objects.all().order_by('id')
+          
+          if options['event_id']:
+               events = events.filter(id=options['event_id'])
+          
+          refreshed = 0
+          for event in events.iterator():
+               event.refresh_attendee_counts()
+               refreshed += 1
+          
+          self.stdout.write(
+               self.style.SUCCESS(f'Successfully refreshed attendee counters for {refreshed} events')
+          )
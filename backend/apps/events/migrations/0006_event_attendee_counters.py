@@ -0,0 +1,47 @@
+# Generated by Django 5.1.1 on 2026-10-18 04:55
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def backfill_attendee_counters(apps, schema_editor):
+    Event = apps.get_model('events', 'Event')
+    Attendee = apps.get_model('events', 'Attendee')
+
+    counts = Attendee.objects.values('event_id').annotate(
+        confirmed=Count('id', filter=Q(status='confirmed')),
+        pending=Count('id', filter=Q(status='pending')),
+        waitlisted=Count('id', filter=Q(status='waitlisted')),
+    )
+    for row in counts:
+        Event.objects.filter(pk=row['event_id']).update(
+            confirmed_count=row['confirmed'],
+            pending_count=row['pending'],
+            waitlisted_count=row['waitlisted'],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0005_attendeeinvitation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='confirmed_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of confirmed attendees'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='pending_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of attendees pending approval'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='waitlisted_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of waitlisted attendees'),
+        ),
+        migrations.RunPython(backfill_attendee_counters, migrations.RunPython.noop),
+    ]
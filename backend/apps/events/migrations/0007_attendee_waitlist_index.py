@@ -0,0 +1,19 @@
+# Generated by Django 5.1.1 on 2026-10-18 04:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0006_event_attendee_counters'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attendee',
+            index=models.Index(fields=['event', 'status', 'registered_at'], name='events_atte_event_i_b7a9c5_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.1 on 2026-10-18 04:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0007_attendee_waitlist_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['status', 'is_public', 'start_datetime', 'id'], name='events_even_status_6f39c6_idx'),
+        ),
+    ]
@@ -0,0 +1,91 @@
+# Generated by Django 5.1.1 on 2026-10-18 04:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE events_eventsearch_fts USING fts5(
+        title, body,
+        content='events_eventsearchdocument', content_rowid='event_id',
+        tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER events_eventsearch_ai AFTER INSERT ON events_eventsearchdocument BEGIN
+        INSERT INTO events_eventsearch_fts(rowid, title, body) VALUES (new.event_id, new.title, new.body);
+    END
+    """,
+    """
+    CREATE TRIGGER events_eventsearch_ad AFTER DELETE ON events_eventsearchdocument BEGIN
+        INSERT INTO events_eventsearch_fts(events_eventsearch_fts, rowid, title, body) VALUES ('delete', old.event_id, old.title, old.body);
+    END
+    """,
+    """
+    CREATE TRIGGER events_eventsearch_au AFTER UPDATE ON events_eventsearchdocument BEGIN
+        INSERT INTO events_eventsearch_fts(events_eventsearch_fts, rowid, title, body) VALUES ('delete', old.event_id, old.title, old.body);
+        INSERT INTO events_eventsearch_fts(rowid, title, body) VALUES (new.event_id, new.title, new.body);
+    END
+    """,
+]
+
+SQLITE_REVERSE = [
+    'DROP TRIGGER IF EXISTS events_eventsearch_au',
+    'DROP TRIGGER IF EXISTS events_eventsearch_ad',
+    'DROP TRIGGER IF EXISTS events_eventsearch_ai',
+    'DROP TABLE IF EXISTS events_eventsearch_fts',
+]
+
+POSTGRESQL_FORWARD = [
+    """
+    ALTER TABLE events_eventsearchdocument ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(body, '')), 'B')
+    ) STORED
+    """,
+    'CREATE INDEX events_eventsearch_vector_idx ON events_eventsearchdocument USING GIN (search_vector)',
+]
+
+POSTGRESQL_REVERSE = [
+    'DROP INDEX IF EXISTS events_eventsearch_vector_idx',
+    'ALTER TABLE events_eventsearchdocument DROP COLUMN IF EXISTS search_vector',
+]
+
+
+def _run_vendor_sql(schema_editor, statements_by_vendor):
+    for statement in statements_by_vendor.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(statement)
+
+
+def create_fulltext_index(apps, schema_editor):
+    _run_vendor_sql(schema_editor, {'sqlite': SQLITE_FORWARD, 'postgresql': POSTGRESQL_FORWARD})
+
+
+def drop_fulltext_index(apps, schema_editor):
+    _run_vendor_sql(schema_editor, {'sqlite': SQLITE_REVERSE, 'postgresql': POSTGRESQL_REVERSE})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0008_event_public_listing_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventSearchDocument',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('status', models.BooleanField(default=True)),
+                ('event', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='events.event')),
+                ('title', models.CharField(max_length=255)),
+                ('body', models.TextField(blank=True)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.RunPython(create_fulltext_index, drop_fulltext_index),
+    ]
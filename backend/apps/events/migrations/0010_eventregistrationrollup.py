@@ -0,0 +1,38 @@
+# Generated by Django 5.1.1 on 2026-10-18 05:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0009_eventsearchdocument'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventRegistrationRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('status', models.BooleanField(default=True)),
+                ('bucket_start', models.DateTimeField(help_text='Start of the hour this row covers')),
+                ('registrations', models.PositiveIntegerField(default=0)),
+                ('cancellations', models.PositiveIntegerField(default=0)),
+                ('pending_entries', models.PositiveIntegerField(default=0, help_text='Attendees that entered pending approval')),
+                ('approvals', models.PositiveIntegerField(default=0, help_text='Pending attendees that were confirmed')),
+                ('promotions', models.PositiveIntegerField(default=0, help_text='Waitlisted attendees that were confirmed')),
+                ('rejections', models.PositiveIntegerField(default=0)),
+                ('confirmed_delta', models.IntegerField(default=0)),
+                ('pending_delta', models.IntegerField(default=0)),
+                ('waitlisted_delta', models.IntegerField(default=0)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='registration_rollups', to='events.event')),
+            ],
+            options={
+                'ordering': ['bucket_start'],
+                'unique_together': {('event', 'bucket_start')},
+            },
+        ),
+    ]
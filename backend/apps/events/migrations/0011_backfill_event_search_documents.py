@@ -0,0 +1,40 @@
+# Generated by Django 5.1.1 on 2026-10-18 12:10
+
+from django.db import migrations
+
+
+def backfill_search_documents(apps, schema_editor):
+    Event = apps.get_model('events', 'Event')
+    EventSearchDocument = apps.get_model('events', 'EventSearchDocument')
+
+    # Same document as EventSearchService.index_event, built with the historical models
+    documents = []
+    events = Event.objects.filter(status='published', is_public=True).prefetch_related('speakers', 'sessions')
+    for event in events.iterator(chunk_size=500):
+        body_parts = [event.description, event.venue_name, event.venue_address]
+        body_parts.extend(
+            ' '.join(part for part in (speaker.full_name, speaker.title, speaker.company) if part)
+            for speaker in event.speakers.all()
+        )
+        body_parts.extend(
+            ' '.join(part for part in (session.title, session.description) if part)
+            for session in event.sessions.all()
+        )
+        documents.append(EventSearchDocument(
+            event_id=event.pk,
+            title=event.name,
+            body='\n'.join(part for part in body_parts if part)
+        ))
+
+    EventSearchDocument.objects.bulk_create(documents, batch_size=500, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0010_eventregistrationrollup'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_search_documents, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,7 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, Value, Count, Q
+from django.db.models.functions import Greatest
+from django.dispatch import Signal
 from django.utils.text import slugify
 from timezone_field import TimeZoneField
 from core.abstract_models import TimeStampModel
@@ -16,6 +19,42 @@ class RegistrationType(models.TextChoices):
      INVITATION_ONLY = 'invitation_only', 'Invitation Only'
      APPROVAL_REQUIRED = 'approval_required', 'Approval Required'
 
+class EventQuerySet(models.QuerySet):
+     def public(self):
+          """Published events visible in public listings"""
+          return self.filter(status=EventStatus.PUBLISHED, is_public=True)
+
+     def with_availability(self):
+          """Annotate remaining seats for every row in the same query"""
+          return self.annotate(
+               spots_remaining=Greatest(F('capacity') - F('confirmed_count'), Value(0))
+          )
+
+     def with_open_spots(self):
+          """Only events that still have confirmed seats left"""
+          return self.filter(confirmed_count__lt=F('capacity'))
+
+     def with_attendee_stats(self):
+          """Annotate attendee counts per status with one conditional aggregate"""
+          return self.annotate(
+               attendee_total=Count('attendees'),
+               attendee_confirmed=Count('attendees', filter=Q(attendees__status=AttendeeStatus.CONFIRMED)),
+               attendee_pending=Count('attendees', filter=Q(attendees__status=AttendeeStatus.PENDING)),
+               attendee_rejected=Count('attendees', filter=Q(attendees__status=AttendeeStatus.REJECTED)),
+               attendee_waitlisted=Count('attendees', filter=Q(attendees__status=AttendeeStatus.WAITLISTED)),
+          )
+
+     def with_invitation_stats(self):
+          """Annotate invitation counts per status with one conditional aggregate"""
+          # Kept separate from with_attendee_stats: joining both relations would multiply the counts
+          return self.annotate(
+               invitation_total=Count('invitations'),
+               invitation_pending=Count('invitations', filter=Q(invitations__status=AttendeeInvitationStatus.PENDING)),
+               invitation_accepted=Count('invitations', filter=Q(invitations__status=AttendeeInvitationStatus.ACCEPTED)),
+               invitation_rejected=Count('invitations', filter=Q(invitations__status=AttendeeInvitationStatus.REJECTED)),
+               invitation_expired=Count('invitations', filter=Q(invitations__status=AttendeeInvitationStatus.EXPIRED)),
+          )
+
 class Event(TimeStampModel):
      name = models.CharField(max_length=255)
      slug = models.SlugField(unique=True, blank=True)
@@ -40,6 +79,11 @@ class Event(TimeStampModel):
      registration_closes = models.DateTimeField(null=True, blank=True, help_text="When registration closes (optional)")
      requires_approval = models.BooleanField(default=False, help_text="Whether registrations need manual approval")
 
+     # Denormalized attendee counters (kept in sync by Event.apply_attendee_transitions)
+     confirmed_count = models.PositiveIntegerField(default=0, help_text="Number of confirmed attendees")
+     pending_count = models.PositiveIntegerField(default=0, help_text="Number of attendees pending approval")
+     waitlisted_count = models.PositiveIntegerField(default=0, help_text="Number of waitlisted attendees")
+
      # Organizer
      created_by = models.ForeignKey(
           'users.CustomUser',
@@ -47,6 +91,14 @@ class Event(TimeStampModel):
           null=True,
           related_name='created_events'
      )
+
+     objects = EventQuerySet.as_manager()
+
+     class Meta:
+          indexes = [
+               # Public listing filter + keyset pagination order
+               models.Index(fields=['status', 'is_public', 'start_datetime', 'id']),
+          ]
      
      def save(self, *args, **kwargs):
           if not self.slug:
@@ -66,6 +118,14 @@ class Event(TimeStampModel):
                from datetime import timedelta
                total_hours = float(self.duration_hours) + (self.duration_days * 24)
                self.end_datetime = self.start_datetime + timedelta(hours=total_hours)
+          
+          # The attendee counters are only written with F() updates; a full save of an
+          # instance loaded earlier must not overwrite them with stale values
+          if not self._state.adding and kwargs.get('update_fields') is None:
+               kwargs['update_fields'] = [
+                    field.name for field in self._meta.concrete_fields
+                    if not field.primary_key and field.name not in ATTENDEE_COUNTER_FIELDS.values()
+               ]
                
           super().save(*args, **kwargs)
 
@@ -96,8 +156,10 @@ class Event(TimeStampModel):
      @property
      def available_spots(self):
           """Get number of available spots"""
-          confirmed_count = self.attendees.filter(status='confirmed').count()
-          return max(0, self.capacity - confirmed_count)
+          # Prefer the value computed by EventQuerySet.with_availability()
+          if hasattr(self, 'spots_remaining'):
+               return self.spots_remaining
+          return max(0, self.capacity - self.confirmed_count)
 
      @property
      def is_full(self):
@@ -114,9 +176,69 @@ class Event(TimeStampModel):
                not self.is_full
           )
 
+     @classmethod
+     def apply_attendee_transitions(cls, event_id, transitions: dict) -> None:
+          """
+          Apply attendee status transitions to the denormalized counters
+          
+          Args:
+               event_id: The ID of the event
+               transitions: Mapping of (old_status, new_status) to number of attendees.
+                    old_status is None for new registrations, new_status is None for removals.
+          """
+          deltas = {}
+          transitions = {
+               transition: count for transition, count in transitions.items()
+               if transition[0] != transition[1] and count
+          }
+          
+          for (old_status, new_status), count in transitions.items():
+               if old_status in ATTENDEE_COUNTER_FIELDS:
+                    field = ATTENDEE_COUNTER_FIELDS[old_status]
+                    deltas[field] = deltas.get(field, 0) - count
+               if new_status in ATTENDEE_COUNTER_FIELDS:
+                    field = ATTENDEE_COUNTER_FIELDS[new_status]
+                    deltas[field] = deltas.get(field, 0) + count
+          
+          updates = {field: F(field) + delta for field, delta in deltas.items() if delta}
+          if updates:
+               cls.objects.filter(pk=event_id).update(**updates)
+          
+          if transitions:
+               attendee_counts_changed.send(sender=cls, event_id=event_id, transitions=transitions)
+
+     def refresh_attendee_counts(self) -> None:
+          """Recalculate the denormalized counters from the attendee rows (repair tool)"""
+          from django.db.models import Count, Q
+          
+          counts = self.attendees.aggregate(
+               confirmed_count=Count('id', filter=Q(status=AttendeeStatus.CONFIRMED)),
+               pending_count=Count('id', filter=Q(status=AttendeeStatus.PENDING)),
+               waitlisted_count=Count('id', filter=Q(status=AttendeeStatus.WAITLISTED)),
+          )
+          Event.objects.filter(pk=self.pk).update(**counts)
+          for field, value in counts.items():
+               setattr(self, field, value)
+          attendee_counts_changed.send(sender=Event, event_id=self.pk, transitions={})
+
      def __str__(self):
           return self.name
 
+class EventSearchDocument(TimeStampModel):
+     """
+     Denormalized search text for a published public event.
+     
+     Maintained incrementally by signals (see services.search.event_search_service).
+     The full-text index over it is vendor specific and created in the migration:
+     an FTS5 table on SQLite and a generated tsvector column with a GIN index on PostgreSQL.
+     """
+     event = models.OneToOneField(Event, on_delete=models.CASCADE, primary_key=True, related_name='search_document')
+     title = models.CharField(max_length=255)
+     body = models.TextField(blank=True)
+
+     def __str__(self):
+          return f"Search document for {self.title}"
+
 class Speaker(TimeStampModel):
      full_name = models.CharField(max_length=100)
      title = models.CharField(max_length=100)
@@ -153,6 +275,18 @@ class AttendeeStatus(models.TextChoices):
      REJECTED = 'rejected', 'Rejected'
      WAITLISTED = 'waitlisted', 'Waitlisted'
 
+# Attendee statuses that have a denormalized counter on Event
+ATTENDEE_COUNTER_FIELDS = {
+     AttendeeStatus.CONFIRMED: 'confirmed_count',
+     AttendeeStatus.PENDING: 'pending_count',
+     AttendeeStatus.WAITLISTED: 'waitlisted_count',
+}
+
+# Sent with event_id and the applied transitions whenever attendees of an event change status
+# (or the counters are recalculated, with empty transitions). Counter updates use
+# queryset.update(), so post_save is not emitted for them.
+attendee_counts_changed = Signal()
+
 class Attendee(TimeStampModel):
      event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='attendees')
      email = models.EmailField()
@@ -166,19 +300,83 @@ class Attendee(TimeStampModel):
      registered_at = models.DateTimeField(auto_now_add=True)
      confirmed_at = models.DateTimeField(null=True, blank=True)
 
+     # Status as last loaded from / written to the database, used to keep Event counters in sync
+     _persisted_status = None
+
      class Meta:
           unique_together = ['event', 'email']  # Prevent duplicate registrations
+          indexes = [
+               models.Index(fields=['event', 'status', 'registered_at']),  # FIFO waitlist lookups
+          ]
+
+     @classmethod
+     def from_db(cls, db, field_names, values):
+          instance = super().from_db(db, field_names, values)
+          instance._persisted_status = instance.__dict__.get('status')
+          return instance
           
      def save(self, *args, **kwargs):
           # Auto-set confirmed_at when status changes to confirmed
           if self.status == AttendeeStatus.CONFIRMED and not self.confirmed_at:
                from django.utils import timezone
                self.confirmed_at = timezone.now()
-          super().save(*args, **kwargs)
+          
+          adding = self._state.adding
+          old_status = None if adding else self._persisted_status
+          update_fields = kwargs.get('update_fields')
+          status_written = update_fields is None or 'status' in update_fields
+          
+          # Counter update runs in the same transaction as the row write
+          with transaction.atomic():
+               super().save(*args, **kwargs)
+               if adding or (status_written and old_status is not None and old_status != self.status):
+                    Event.apply_attendee_transitions(self.event_id, {(old_status, self.status): 1})
+          
+          if status_written:
+               self._persisted_status = self.status
+
+     def delete(self, *args, **kwargs):
+          with transaction.atomic():
+               result = super().delete(*args, **kwargs)
+               if self._persisted_status is not None:
+                    Event.apply_attendee_transitions(self.event_id, {(self._persisted_status, None): 1})
+          
+          self._persisted_status = None
+          return result
 
      def __str__(self):
           return f"{self.full_name} - {self.event.name} ({self.status})"
 
+class EventRegistrationRollup(TimeStampModel):
+     """
+     Hourly registration activity of an event.
+     
+     Updated incrementally from attendee_counts_changed (see services.analytics.registration_rollup_service),
+     so time-series analytics never scan attendee rows.
+     """
+     event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='registration_rollups')
+     bucket_start = models.DateTimeField(help_text="Start of the hour this row covers")
+     
+     # Flows within the hour
+     registrations = models.PositiveIntegerField(default=0)
+     cancellations = models.PositiveIntegerField(default=0)
+     pending_entries = models.PositiveIntegerField(default=0, help_text="Attendees that entered pending approval")
+     approvals = models.PositiveIntegerField(default=0, help_text="Pending attendees that were confirmed")
+     promotions = models.PositiveIntegerField(default=0, help_text="Waitlisted attendees that were confirmed")
+     rejections = models.PositiveIntegerField(default=0)
+     
+     # Net change of each status within the hour (running sums give the totals over time)
+     confirmed_delta = models.IntegerField(default=0)
+     pending_delta = models.IntegerField(default=0)
+     waitlisted_delta = models.IntegerField(default=0)
+
+     class Meta:
+          unique_together = ['event', 'bucket_start']
+          ordering = ['bucket_start']
+
+     def __str__(self):
+          return f"{self.event.name} @ {self.bucket_start:%Y-%m-%d %H:00}"
+
 class AttendeeInvitationStatus(models.TextChoices):
      PENDING = 'pending', 'Pending'
      ACCEPTED = 'accepted', 'Accepted'
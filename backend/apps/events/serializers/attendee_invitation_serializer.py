@@ -25,8 +25,8 @@ class SendAttendeeInvitationSerializer(serializers.ModelSerializer):
         if not value:
             raise serializers.ValidationError("At least one email address is required.")
         
-        if len(value) > 100:  # Prevent abuse
-            raise serializers.ValidationError("Cannot send more than 100 invitations at once.")
+        if len(value) > 5000:  # Prevent abuse
+            raise serializers.ValidationError("Cannot send more than 5000 invitations at once.")
         
         # Remove duplicates while preserving order
         unique_emails = []
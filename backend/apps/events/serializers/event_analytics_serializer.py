@@ -2,23 +2,12 @@ from rest_framework import serializers
 from apps.events.models import Event
 
 class EventAnalyticsSerializer(serializers.ModelSerializer):
-     total_attendees = serializers.SerializerMethodField()
-     confirmed_attendees = serializers.SerializerMethodField()
-     waitlisted_attendees = serializers.SerializerMethodField()
-     pending_attendees = serializers.SerializerMethodField()
+     # Expects an event annotated with Event.objects.with_attendee_stats()
+     total_attendees = serializers.IntegerField(source='attendee_total', read_only=True)
+     confirmed_attendees = serializers.IntegerField(source='attendee_confirmed', read_only=True)
+     waitlisted_attendees = serializers.IntegerField(source='attendee_waitlisted', read_only=True)
+     pending_attendees = serializers.IntegerField(source='attendee_pending', read_only=True)
 
      class Meta:
           model = Event
           fields = ['id', 'name', 'total_attendees', 'confirmed_attendees', 'waitlisted_attendees', 'pending_attendees']
-
-     def get_total_attendees(self, obj):
-          return obj.attendees.count()
-
-     def get_confirmed_attendees(self, obj):
-          return obj.attendees.filter(status='confirmed').count()
-
-     def get_waitlisted_attendees(self, obj):
-          return obj.attendees.filter(status='waitlisted').count()
-
-     def get_pending_attendees(self, obj):
-          return obj.attendees.filter(status='pending').count()
@@ -205,6 +205,59 @@ class AttendeeSerializer(serializers.ModelSerializer):
           fields = ['id', 'full_name', 'email', 'phone', 'status', 'registered_at', 'confirmed_at']
           read_only_fields = ['id', 'registered_at', 'confirmed_at']
 
+class AttendeeBulkImportSerializer(serializers.Serializer):
+     """Serializer for bulk attendee import (CSV upload or JSON array)"""
+     MAX_ROWS = 10000
+     CSV_COLUMNS = ['full_name', 'email', 'phone']
+
+     attendees = serializers.ListField(
+          child=serializers.DictField(),
+          required=False,
+          help_text="List of attendees with full_name, email and optional phone"
+     )
+     file = serializers.FileField(
+          required=False,
+          help_text="CSV file with full_name, email and optional phone columns"
+     )
+     send_notifications = serializers.BooleanField(default=True)
+
+     def validate(self, attrs):
+          """Normalize the CSV upload or JSON array into a list of rows"""
+          attendees = attrs.pop('attendees', None)
+          upload = attrs.pop('file', None)
+          
+          if (attendees is None) == (upload is None):
+               raise serializers.ValidationError("Provide either an attendees list or a CSV file.")
+          
+          rows = attendees if attendees is not None else self._read_csv(upload)
+          
+          if not rows:
+               raise serializers.ValidationError("At least one attendee is required.")
+          
+          if len(rows) > self.MAX_ROWS:
+               raise serializers.ValidationError(f"Cannot import more than {self.MAX_ROWS} attendees at once.")
+          
+          attrs['rows'] = rows
+          return attrs
+
+     def _read_csv(self, upload):
+          import csv
+          import io
+          
+          try:
+               text = io.TextIOWrapper(upload.file, encoding='utf-8-sig')
+               reader = csv.DictReader(text)
+               
+               if not reader.fieldnames or 'email' not in reader.fieldnames:
+                    raise serializers.ValidationError("CSV file must have a header row with an email column.")
+               
+               return [
+                    {column: (row.get(column) or '').strip() for column in self.CSV_COLUMNS}
+                    for row in reader
+               ]
+          except (UnicodeDecodeError, csv.Error):
+               raise serializers.ValidationError("CSV file could not be read.")
+
 class AttendeeStatusUpdateSerializer(serializers.ModelSerializer):
      class Meta:
           model = Attendee
@@ -0,0 +1,77 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from apps.events.models import Event, Speaker, Session, attendee_counts_changed
+from services.search.event_search_service import EventSearchService
+from services.cache.public_event_cache_service import PublicEventCacheService
+from services.analytics.registration_rollup_service import RegistrationRollupService
+
+
+def _schedule_search_reindex(event_id):
+     # Reindex after commit so the document reflects committed rows only
+     transaction.on_commit(lambda: EventSearchService.index_event(event_id))
+
+
+@receiver(post_save, sender=Event)
+def reindex_event_on_save(sender, instance, **kwargs):
+     """
+     Keep the search document in sync with the event
+     """
+     _schedule_search_reindex(instance.pk)
+
+
+@receiver(post_save, sender=Speaker)
+@receiver(post_delete, sender=Speaker)
+@receiver(post_save, sender=Session)
+@receiver(post_delete, sender=Session)
+def reindex_event_on_child_change(sender, instance, **kwargs):
+     """
+     Speakers and sessions are part of their event's search document
+     """
+     _schedule_search_reindex(instance.event_id)
+
+
+def _schedule_cache_invalidation(event_id, include_list=True, scopes=None):
+     # Bump after commit so a concurrent request can't re-cache the pre-commit rows
+     def invalidate():
+          PublicEventCacheService.invalidate_event(event_id, scopes)
+          if include_list:
+               PublicEventCacheService.invalidate_list()
+
+     transaction.on_commit(invalidate)
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def invalidate_public_cache_on_event_change(sender, instance, **kwargs):
+     """
+     Event fields appear in the public listing, detail and schedule responses
+     """
+     _schedule_cache_invalidation(instance.pk)
+
+
+@receiver(post_save, sender=Speaker)
+@receiver(post_delete, sender=Speaker)
+@receiver(post_save, sender=Session)
+@receiver(post_delete, sender=Session)
+def invalidate_public_cache_on_child_change(sender, instance, **kwargs):
+     """
+     Speakers and sessions only appear in the per-event responses
+     """
+     _schedule_cache_invalidation(instance.event_id, include_list=False)
+
+
+@receiver(attendee_counts_changed)
+def invalidate_public_cache_on_counts_change(sender, event_id, **kwargs):
+     """
+     Available spots are part of the public listing and detail responses, not the schedule
+     """
+     _schedule_cache_invalidation(event_id, scopes=['detail'])
+
+
+@receiver(attendee_counts_changed)
+def record_registration_rollup(sender, event_id, transitions, **kwargs):
+     """
+     Add the transitions to the hourly rollup in the same transaction as the status change
+     """
+     RegistrationRollupService.record_transitions(event_id, transitions)
@@ -4,6 +4,8 @@ from apps.events.views.event_view import (
     EventAnalyticsAPIView, 
     EventDetailAPIView, 
     EventListAPIView,
+    EventStatsAPIView,
+    EventRegistrationTimeseriesAPIView,
     EventUpdateStatusAPIView,
     EventManageAPIView
 )
@@ -20,6 +22,8 @@ from apps.events.views.session_view import (
 from apps.events.views.attendee_view import (
     AttendeeRegistrationAPIView,
     AttendeeListAPIView,
+    AttendeeExportAPIView,
+    AttendeeBulkImportAPIView,
     AttendeeManagementAPIView,
     AttendeeStatsAPIView,
     AttendeeRegistrationLookupAPIView,
@@ -41,9 +45,11 @@ urlpatterns = [
     # Event management endpoints (authenticated)
     path('', EventListAPIView.as_view(), name='event-list'),
     path('create/', CreateEventAPIView.as_view(), name='event-create'),
+    path('stats/', EventStatsAPIView.as_view(), name='event-stats'),
     path('<int:event_id>/details/', EventDetailAPIView.as_view(), name='event-detail'),
     path('<int:event_id>/update-status/', EventUpdateStatusAPIView.as_view(), name='event-status'),
     path('<int:event_id>/analytics/', EventAnalyticsAPIView.as_view(), name='event-analytics'),
+    path('<int:event_id>/analytics/timeseries/', EventRegistrationTimeseriesAPIView.as_view(), name='event-analytics-timeseries'),
     path('<int:event_id>/', EventManageAPIView.as_view(), name='event-update'),
 
     # Public event discovery endpoints (no auth)
@@ -55,6 +61,8 @@ urlpatterns = [
     # Attendee endpoints
     path('<int:event_id>/register/', AttendeeRegistrationAPIView.as_view(), name='attendee-register'),
     path('<int:event_id>/attendees/', AttendeeListAPIView.as_view(), name='attendee-list'),
+    path('<int:event_id>/attendees/export/', AttendeeExportAPIView.as_view(), name='attendee-export'),
+    path('<int:event_id>/attendees/import/', AttendeeBulkImportAPIView.as_view(), name='attendee-import'),
     path('<int:event_id>/attendees/<int:attendee_id>/', AttendeeManagementAPIView.as_view(), name='attendee-management'),
     path('<int:event_id>/attendees/stats/', AttendeeStatsAPIView.as_view(), name='attendee-stats'),
     path('<int:event_id>/registration-lookup/', AttendeeRegistrationLookupAPIView.as_view(), name='registration-lookup'),
@@ -1,9 +1,10 @@
 from rest_framework import status
+from django.http import StreamingHttpResponse
 from core.middleware.authentication import TokenAuthentication
 from core.middleware.permission import IsEventCreatorOrOrgAdmin
 from services.attendee.attendee_service import AttendeeService
 from utils.view.custom_api_views import CustomAPIView
-from apps.events.serializers.event_serializer import AttendeeRegistrationSerializer, AttendeeStatusUpdateSerializer
+from apps.events.serializers.event_serializer import AttendeeRegistrationSerializer, AttendeeStatusUpdateSerializer, AttendeeBulkImportSerializer
 from apps.events.models import Event
 from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import extend_schema
@@ -53,6 +54,58 @@ class AttendeeListAPIView(CustomAPIView):
           )
 
 
+@extend_schema(tags=["Attendees"])
+class AttendeeExportAPIView(CustomAPIView):
+     """Streaming attendee export (organizers only)"""
+     authentication_classes = [TokenAuthentication]
+     permission_classes = [IsEventCreatorOrOrgAdmin]
+
+     def perform_content_negotiation(self, request, force=False):
+          # The body is not rendered by DRF, so don't reject `Accept: text/csv` clients with 406
+          return super().perform_content_negotiation(request, force=True)
+
+     def get(self, request, event_id):
+          """Export all attendees for an event as CSV or NDJSON"""
+          export_format = request.query_params.get('export_format', 'csv').lower()
+          
+          # Use service to build the row stream
+          stream, content_type = AttendeeService.export_event_attendees(
+               event=request.event,
+               export_format=export_format
+          )
+          
+          response = StreamingHttpResponse(stream, content_type=content_type)
+          response['Content-Disposition'] = f'attachment; filename="attendees-{request.event.slug}.{export_format}"'
+          
+          return response
+
+
+@extend_schema(tags=["Attendees"])
+class AttendeeBulkImportAPIView(CustomAPIView):
+     """Bulk attendee import (organizers only)"""
+     authentication_classes = [TokenAuthentication]
+     permission_classes = [IsEventCreatorOrOrgAdmin]
+
+     @extend_schema(request=AttendeeBulkImportSerializer)
+     def post(self, request, event_id):
+          """Import attendees from a CSV upload or a JSON array"""
+          serializer = AttendeeBulkImportSerializer(data=request.data)
+          serializer.is_valid(raise_exception=True)
+          
+          # Use service to import attendees
+          data = AttendeeService.bulk_import_attendees(
+               event=request.event,
+               rows=serializer.validated_data['rows'],
+               send_notifications=serializer.validated_data['send_notifications']
+          )
+          
+          return self.success_response(
+               message=f"Imported {data['created_count']} of {data['total_rows']} attendees.",
+               data=data,
+               status_code=status.HTTP_201_CREATED
+          )
+
+
 @extend_schema(tags=["Attendees"])
 class AttendeeManagementAPIView(CustomAPIView):
      """Attendee status management (organizers only)"""
@@ -3,11 +3,14 @@ from apps.events.models import Event
 from apps.events.serializers.event_analytics_serializer import EventAnalyticsSerializer
 from apps.events.serializers.event_serializer import AttendeeRegistrationSerializer, EventCreateSerializer, EventUpdateSerializer
 from services.event.event_service import EventService
+from services.analytics.registration_rollup_service import RegistrationRollupService
 from services.attendee.attendee_service import AttendeeService
+from services.attendee.waitlist_service import WaitlistService
 from services.notification.notification_service import EventNotificationService
 from utils.view.custom_api_views import CustomAPIView
+from utils.pagination.page import PageUtil
 from core.middleware.authentication import TokenAuthentication
-from core.middleware.permission import CanCreateEvents, OwnerOrAdminPermission
+from core.middleware.permission import CanCreateEvents, OwnerOrAdminPermission, IsEventCreatorOrOrgAdmin
 from drf_spectacular.utils import extend_schema
 
 @extend_schema(tags=["Events"])
@@ -37,7 +40,13 @@ class EventListAPIView(CustomAPIView):
      success_message = "Event list fetched successfully"
 
      def get(self, request):
-          events = EventService.get_event_list_for_each_organization(request.user)
+          page, page_size = PageUtil.get_page_params(request.query_params)
+          
+          events = EventService.get_event_list_for_each_organization(
+               request.user,
+               page=page,
+               page_size=page_size
+          )
           
           return self.success_response(data=events)
 
@@ -84,7 +93,7 @@ class EventAnalyticsAPIView(CustomAPIView):
 
      def get(self, request, event_id):
           try:
-               event = Event.objects.get(id=event_id)
+               event = Event.objects.with_attendee_stats().get(id=event_id)
           except Event.DoesNotExist:
                return self.error_response(message="Event not found", status_code=status.HTTP_404_NOT_FOUND)
 
@@ -92,6 +101,56 @@ class EventAnalyticsAPIView(CustomAPIView):
           
           return self.success_response(data=serializer.data)
 
+@extend_schema(tags=["Events"])
+class EventRegistrationTimeseriesAPIView(CustomAPIView):
+     """Registration time series from the hourly rollups (organizers only)"""
+     authentication_classes = [TokenAuthentication]
+     permission_classes = [IsEventCreatorOrOrgAdmin]
+     success_message = "Registration time series fetched successfully"
+
+     def get(self, request, event_id):
+          """Get registrations, approvals, promotions and status totals per hour or day"""
+          from datetime import datetime
+          from django.utils import timezone
+          from rest_framework.exceptions import ValidationError
+          
+          date_range = {}
+          for param in ('date_from', 'date_to'):
+               value = request.query_params.get(param)
+               if not value:
+                    continue
+               try:
+                    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+               except ValueError:
+                    raise ValidationError(f"{param} must be an ISO 8601 datetime.")
+               date_range[param] = parsed if timezone.is_aware(parsed) else timezone.make_aware(parsed)
+          
+          data = RegistrationRollupService.get_timeseries(
+               event=request.event,
+               interval=request.query_params.get('interval', 'hour').lower(),
+               **date_range
+          )
+          
+          return self.success_response(data=data)
+
+@extend_schema(tags=["Events"])
+class EventStatsAPIView(CustomAPIView):
+     """Registration and invitation statistics for many events (organizers only)"""
+     authentication_classes = [TokenAuthentication]
+     permission_classes = [OwnerOrAdminPermission]
+     success_message = "Event statistics fetched successfully"
+
+     def get(self, request):
+          """Get statistics for the events given as ?event_ids=1,2,3"""
+          event_ids = request.query_params.get('event_ids', '')
+          
+          data = EventService.get_event_stats_for_organization(
+               request.user,
+               event_ids=[event_id for event_id in event_ids.split(',') if event_id.strip()]
+          )
+          
+          return self.success_response(data=data)
+
 @extend_schema(tags=["Events"])
 class EventUpdateStatusAPIView(CustomAPIView):
      """Event status management (organizers only)"""
@@ -141,10 +200,15 @@ class EventManageAPIView(CustomAPIView):
                )
 
           # Todo: TO fix EventUpdateSerializer
+          old_capacity = event.capacity
           serializer = EventUpdateSerializer(event, data=request.data, partial=True)
           serializer.is_valid(raise_exception=True)
           serializer.save()
           
+          # Extra capacity goes to the waitlist first
+          if event.capacity > old_capacity:
+               WaitlistService.promote_waitlisted_attendees(event.id)
+          
           return self.success_response(
                message="Event updated successfully",
                data=serializer.data
@@ -170,8 +234,16 @@ class EventManageAPIView(CustomAPIView):
           event.save()
           
           # Send cancellation emails to all confirmed attendees
-          EventNotificationService.send_event_cancellation_notification(event)
+          report = EventNotificationService.send_event_cancellation_notification(event)
           
           return self.success_response(
-               message="Event cancelled successfully"
+               message="Event cancelled successfully",
+               data={
+                    'notifications': {
+                         'total': report['total'],
+                         'queued': report['queued'],
+                         'sent': report['sent'],
+                         'failed': report['failed']
+                    }
+               }
           )
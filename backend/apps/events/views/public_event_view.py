@@ -1,6 +1,11 @@
 from django.db.models import Q
 from django.utils import timezone
+from django.utils.cache import get_conditional_response
 from utils.view.custom_api_views import CustomAPIView
+from utils.pagination.cursor import CursorUtil
+from utils.pagination.page import PageUtil
+from services.search.event_search_service import EventSearchService
+from services.cache.public_event_cache_service import PublicEventCacheService
 from apps.events.serializers.event_serializer import PublicEventSerializer, EventSerializer
 from apps.events.models import Event, EventStatus
 from drf_spectacular.utils import extend_schema
@@ -16,11 +21,22 @@ class PublicEventListAPIView(CustomAPIView):
      def get(self, request):
           """Get list of published public events with search and filters"""
           
-          # Base queryset - only published, public events
-          queryset = Event.objects.filter(
-               status=EventStatus.PUBLISHED,
-               is_public=True
-          ).order_by('start_datetime')
+          # Anonymous responses are identical for identical query strings
+          cache_key = PublicEventCacheService.build_key('list', request.query_params)
+          data = PublicEventCacheService.get(cache_key)
+          
+          if data is None:
+               data = self._get_events_data(request)
+               PublicEventCacheService.set(cache_key, data)
+          
+          return self.success_response(
+               message="Public events retrieved successfully",
+               data=data
+          )
+
+     def _get_events_data(self, request):
+          # Base queryset - only published, public events with remaining seats annotated
+          queryset = Event.objects.public().with_availability().order_by('start_datetime')
           
           # Search functionality
           search = request.query_params.get('search', '').strip()
@@ -67,8 +83,7 @@ class PublicEventListAPIView(CustomAPIView):
           
           if show_full == 'false':
                # Only show events with available spots
-               # This would need raw SQL or annotations for exact implementation
-               pass
+               queryset = queryset.with_open_spots()
           
           # Filter upcoming events only
           upcoming_only = request.query_params.get('upcoming_only', 'true').lower()
@@ -76,9 +91,31 @@ class PublicEventListAPIView(CustomAPIView):
           if upcoming_only == 'true':
                queryset = queryset.filter(start_datetime__gt=timezone.now())
           
-          # Pagination
-          page_size = min(int(request.query_params.get('page_size', 20)), 100)
-          page = int(request.query_params.get('page', 1))
+          page, page_size = PageUtil.get_page_params(request.query_params)
+          
+          # Cursor (keyset) pagination on (start_datetime, id) - no OFFSET and no COUNT
+          cursor = request.query_params.get('cursor')
+          
+          if cursor is not None or request.query_params.get('pagination') == 'cursor':
+               events, next_cursor = CursorUtil.paginate(
+                    queryset,
+                    ordering=['start_datetime', 'id'],
+                    cursor=cursor,
+                    page_size=page_size
+               )
+               
+               serializer = PublicEventSerializer(events, many=True)
+               
+               return {
+                    'events': serializer.data,
+                    'pagination': {
+                         'page_size': page_size,
+                         'next_cursor': next_cursor,
+                         'has_next': next_cursor is not None
+                    }
+               }
+          
+          # Page number pagination
           start = (page - 1) * page_size
           end = start + page_size
           
@@ -87,19 +124,16 @@ class PublicEventListAPIView(CustomAPIView):
           
           serializer = PublicEventSerializer(events, many=True)
           
-          return self.success_response(
-               message="Public events retrieved successfully",
-               data={
-                    'events': serializer.data,
-                    'pagination': {
-                         'total_count': total_count,
-                         'page': page,
-                         'page_size': page_size,
-                         'has_next': end < total_count,
-                         'has_previous': page > 1
-                    }
+          return {
+               'events': serializer.data,
+               'pagination': {
+                    'total_count': total_count,
+                    'page': page,
+                    'page_size': page_size,
+                    'has_next': end < total_count,
+                    'has_previous': page > 1
                }
-          )
+          }
 
 @extend_schema(tags=["Public Events"])
 class PublicEventDetailAPIView(CustomAPIView):
@@ -110,20 +144,40 @@ class PublicEventDetailAPIView(CustomAPIView):
      def get(self, request, event_id):
           """Get public event details with sessions and speakers"""
           
-          # Get published, public event
-          event = get_object_or_404(
-               Event,
-               id=event_id,
-               status=EventStatus.PUBLISHED,
-               is_public=True
-          )
-          
-          serializer = EventSerializer(event)
+          # Answer If-None-Match / If-Modified-Since before loading the payload
+          validators = PublicEventCacheService.get_event_validators(event_id, 'detail')
+          
+          if validators:
+               not_modified = get_conditional_response(request, etag=validators[0], last_modified=int(validators[1].timestamp()))
+               if not_modified is not None:
+                    PublicEventCacheService.set_validator_headers(not_modified, *validators)
+                    return not_modified
+          
+          cache_key = PublicEventCacheService.build_key('detail', request.query_params, event_id=event_id)
+          data = PublicEventCacheService.get(cache_key)
+          
+          if data is None:
+               # Get published, public event
+               event = get_object_or_404(
+                    Event,
+                    id=event_id,
+                    status=EventStatus.PUBLISHED,
+                    is_public=True
+               )
+               
+               serializer = EventSerializer(event)
+               data = serializer.data
+               PublicEventCacheService.set(cache_key, data)
           
-          return self.success_response(
+          response = self.success_response(
                message="Event details retrieved successfully",
-               data=serializer.data
+               data=data
           )
+          
+          if validators:
+               PublicEventCacheService.set_validator_headers(response, *validators)
+          
+          return response
 
 
 @extend_schema(tags=["Public Events"])
@@ -135,6 +189,33 @@ class PublicEventScheduleAPIView(CustomAPIView):
      def get(self, request, event_id):
           """Get public event schedule (sessions grouped by day)"""
           
+          # Answer If-None-Match / If-Modified-Since before loading the sessions
+          validators = PublicEventCacheService.get_event_validators(event_id, 'schedule')
+          
+          if validators:
+               not_modified = get_conditional_response(request, etag=validators[0], last_modified=int(validators[1].timestamp()))
+               if not_modified is not None:
+                    PublicEventCacheService.set_validator_headers(not_modified, *validators)
+                    return not_modified
+          
+          cache_key = PublicEventCacheService.build_key('schedule', request.query_params, event_id=event_id)
+          data = PublicEventCacheService.get(cache_key)
+          
+          if data is None:
+               data = self._get_schedule_data(event_id)
+               PublicEventCacheService.set(cache_key, data)
+          
+          response = self.success_response(
+               message="Event schedule retrieved successfully",
+               data=data
+          )
+          
+          if validators:
+               PublicEventCacheService.set_validator_headers(response, *validators)
+          
+          return response
+
+     def _get_schedule_data(self, event_id):
           # Get published, public event
           event = get_object_or_404(
                Event,
@@ -159,20 +240,17 @@ class PublicEventScheduleAPIView(CustomAPIView):
                date_str = start_time.split('T')[0]  # Get YYYY-MM-DD part
                schedule_by_day[date_str].append(session_data)
           
-          return self.success_response(
-               message="Event schedule retrieved successfully",
-               data={
-                    'event': {
-                         'id': event.id,
-                         'name': event.name,
-                         'start_datetime': event.start_datetime,
-                         'end_datetime': event.end_datetime,
-                         'venue_name': event.venue_name,
-                         'venue_address': event.venue_address
-                    },
-                    'schedule': dict(schedule_by_day)
-               }
-          )
+          return {
+               'event': {
+                    'id': event.id,
+                    'name': event.name,
+                    'start_datetime': event.start_datetime,
+                    'end_datetime': event.end_datetime,
+                    'venue_name': event.venue_name,
+                    'venue_address': event.venue_address
+               },
+               'schedule': dict(schedule_by_day)
+          }
 
 @extend_schema(tags=["Public Events"])
 class EventSearchAPIView(CustomAPIView):
@@ -184,22 +262,16 @@ class EventSearchAPIView(CustomAPIView):
           """Advanced search for events with multiple filters"""
           
           # Base queryset
-          queryset = Event.objects.filter(
-               status=EventStatus.PUBLISHED,
-               is_public=True,
+          queryset = Event.objects.public().with_availability().filter(
                start_datetime__gt=timezone.now()  # Only upcoming events
           )
           
-          # Text search across multiple fields
+          # Full-text search over name, description, venue, speakers and sessions
           q = request.query_params.get('q', '').strip()
+          ranked_ids = []
           if q:
-               queryset = queryset.filter(
-                    Q(name__icontains=q) |
-                    Q(description__icontains=q) |
-                    Q(venue_name__icontains=q) |
-                    Q(speakers__full_name__icontains=q) |
-                    Q(sessions__title__icontains=q)
-               ).distinct()
+               ranked_ids = EventSearchService.search(q)
+               queryset = queryset.filter(id__in=ranked_ids)
           
           # Category/type filtering (could be added as a field later)
           event_type = request.query_params.get('type')
@@ -226,9 +298,12 @@ class EventSearchAPIView(CustomAPIView):
                except ValueError:
                     pass
           
-          # Sort options
-          sort_by = request.query_params.get('sort_by', 'date')
-          if sort_by == 'date':
+          # Sort options (search results default to relevance)
+          sort_by = request.query_params.get('sort_by', 'relevance' if q else 'date')
+          if sort_by == 'relevance' and q:
+               ranks = {event_id: position for position, event_id in enumerate(ranked_ids)}
+               queryset = sorted(queryset, key=lambda event: ranks[event.id])
+          elif sort_by == 'date':
                queryset = queryset.order_by('start_datetime')
           elif sort_by == 'name':
                queryset = queryset.order_by('name')
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from apps.notifications.models import Notification, NotificationTemplate
+from apps.notifications.models import Notification, NotificationTemplate, ReminderCheckpoint, NotificationArchive
 
 
 @admin.register(NotificationTemplate)
@@ -31,7 +31,7 @@ class NotificationAdmin(admin.ModelAdmin):
                'classes': ('collapse',)
           }),
           ('Status & Timing', {
-               'fields': ('sent_at', 'delivered_at', 'error_message')
+               'fields': ('sent_at', 'delivered_at', 'error_message', 'attempts', 'next_retry_at')
           }),
           ('Metadata', {
                'fields': ('metadata',),
@@ -42,3 +42,17 @@ class NotificationAdmin(admin.ModelAdmin):
                'classes': ('collapse',)
           })
      )
+
+
+@admin.register(ReminderCheckpoint)
+class ReminderCheckpointAdmin(admin.ModelAdmin):
+     list_display = ['event', 'type', 'start_datetime', 'last_attendee_id', 'sent_count', 'completed_at', 'updated_at']
+     list_filter = ['type', 'completed_at']
+     readonly_fields = ['created_at', 'updated_at']
+
+
+@admin.register(NotificationArchive)
+class NotificationArchiveAdmin(admin.ModelAdmin):
+     list_display = ['type', 'recipient_email', 'status', 'sent_at', 'created_at', 'archived_at']
+     list_filter = ['type', 'channel', 'status']
+     search_fields = ['recipient_email', 'subject']
@@ -0,0 +1,137 @@
+import asyncio
+import time
+from channels.db import database_sync_to_async
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
+from django.conf import settings
+from apps.notifications.models import Notification, NotificationChannel, NotificationStatus
+from services.notification.notification_service import NotificationService
+from services.notification.notification_delivery_service import NotificationDeliveryService
+
+
+class NotificationConsumer(AsyncJsonWebsocketConsumer):
+     """
+     Per-user notification stream
+
+     Clients connect to ws/notifications/?token=<access token> and receive every
+     WebSocket notification of their user, plus every other notification of the
+     user as soon as it is created (so the inbox doesn't have to be polled). They
+     acknowledge with {"type": "ack", "ids": [...]} (received) or
+     {"type": "read", "ids": [...]}; acknowledgements are buffered and written in
+     batches. The connection is closed with 4401 when the access token expires;
+     clients reconnect with a fresh token.
+     """
+
+     # Undelivered notifications replayed on connect
+     REPLAY_LIMIT = 50
+
+     async def connect(self):
+          user = self.scope.get('user')
+
+          if user is None or not user.is_authenticated:
+               await self.close(code=4401)
+               return
+
+          self.user_id = user.id
+          self.group_name = NotificationService.get_user_group(user.id)
+          self.delivered_ids = set()
+          self.read_ids = set()
+          self.flush_task = None
+          self.expiry_task = None
+
+          await self.channel_layer.group_add(self.group_name, self.channel_name)
+          await self.accept()
+
+          token_exp = self.scope.get('token_exp')
+          if token_exp is not None:
+               self.expiry_task = asyncio.ensure_future(self._close_on_expiry(token_exp - time.time()))
+
+          # Pushed while the user was offline
+          for notification in await self._get_undelivered():
+               await self.send_json({'type': 'notification', 'notification': notification})
+
+     async def disconnect(self, code):
+          if not hasattr(self, 'group_name'):
+               return
+
+          if self.flush_task:
+               self.flush_task.cancel()
+          if self.expiry_task:
+               self.expiry_task.cancel()
+
+          await self._flush_acknowledgements()
+          await self.channel_layer.group_discard(self.group_name, self.channel_name)
+
+     async def receive(self, text_data=None, bytes_data=None, **kwargs):
+          # Malformed frames get an error reply instead of tearing down the connection
+          try:
+               content = await self.decode_json(text_data) if text_data else None
+          except ValueError:
+               content = None
+
+          if content is None:
+               await self.send_json({'type': 'error', 'message': 'Messages must be JSON objects'})
+               return
+
+          await self.receive_json(content, **kwargs)
+
+     async def receive_json(self, content, **kwargs):
+          if not isinstance(content, dict):
+               await self.send_json({'type': 'error', 'message': 'Messages must be JSON objects'})
+               return
+
+          message_type = content.get('type')
+          ids = content.get('ids', [])
+
+          if not isinstance(ids, list) or not all(
+               isinstance(notification_id, int) and not isinstance(notification_id, bool) for notification_id in ids
+          ):
+               await self.send_json({'type': 'error', 'message': 'ids must be a list of notification ids'})
+               return
+
+          if message_type == 'ack':
+               self.delivered_ids.update(ids)
+          elif message_type == 'read':
+               self.read_ids.update(ids)
+          else:
+               await self.send_json({'type': 'error', 'message': 'Unsupported message type'})
+               return
+
+          if len(self.delivered_ids) + len(self.read_ids) >= settings.NOTIFICATION_ACK_BATCH_SIZE:
+               await self._flush_acknowledgements()
+          elif self.flush_task is None:
+               self.flush_task = asyncio.ensure_future(self._flush_later())
+
+     async def notification_message(self, event):
+          """Handler of group messages sent by NotificationService"""
+          await self.send_json({'type': 'notification', 'notification': event['notification']})
+
+     async def _close_on_expiry(self, delay):
+          await asyncio.sleep(max(delay, 0))
+          await self.send_json({'type': 'error', 'message': 'Access token expired'})
+          await self.close(code=4401)
+
+     async def _flush_later(self):
+          await asyncio.sleep(settings.NOTIFICATION_ACK_FLUSH_INTERVAL)
+          self.flush_task = None
+          await self._flush_acknowledgements()
+
+     async def _flush_acknowledgements(self):
+          if not self.delivered_ids and not self.read_ids:
+               return
+
+          delivered_ids, self.delivered_ids = list(self.delivered_ids), set()
+          read_ids, self.read_ids = list(self.read_ids), set()
+
+          await database_sync_to_async(NotificationDeliveryService.record_acknowledgements)(
+               self.user_id, delivered_ids, read_ids
+          )
+
+     @database_sync_to_async
+     def _get_undelivered(self):
+          notifications = Notification.objects.filter(
+               recipient_user_id=self.user_id,
+               channel=NotificationChannel.WEBSOCKET,
+               status=NotificationStatus.SENT
+          ).order_by('-created_at')[:self.REPLAY_LIMIT]
+
+          return [NotificationService.serialize_for_websocket(notification) for notification in reversed(notifications)]
@@ -0,0 +1,61 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from services.notification.retention_service import NotificationRetentionService
+
+
+class Command(BaseCommand):
+     help = 'Archive finished notifications older than the retention period'
+
+     def add_arguments(self, parser):
+          parser.add_argument(
+               '--days',
+               type=int,
+               help='Retention period in days (default NOTIFICATION_RETENTION_DAYS)'
+          )
+          parser.add_argument(
+               '--chunk-size',
+               type=int,
+               help='Notifications moved per transaction (default NOTIFICATION_ARCHIVE_CHUNK_SIZE)'
+          )
+          parser.add_argument(
+               '--strip-bodies',
+               action='store_true',
+               help='Keep the notifications and only drop their message and metadata'
+          )
+          parser.add_argument(
+               '--pause',
+               type=float,
+               default=0,
+               help='Seconds to sleep between chunks'
+          )
+          parser.add_argument(
+               '--dry-run',
+               action='store_true',
+               help='Only count the notifications that would be archived'
+          )
+
+     def handle(self, *args, **options):
+          days = options['days'] if options['days'] is not None else settings.NOTIFICATION_RETENTION_DAYS
+          
+          if options['dry_run']:
+               count = NotificationRetentionService.get_expired(days).count()
+               self.stdout.write(
+                    self.style.WARNING(f'DRY RUN - {count} notifications older than {days} days would be archived')
+               )
+               return
+          
+          expired = NotificationRetentionService.expire_unread(chunk_size=options['chunk_size'])
+          if expired:
+               self.stdout.write(f'Marked {expired} notifications unread for over {settings.NOTIFICATION_UNREAD_DAYS} days as read')
+          
+          processed = NotificationRetentionService.archive(
+               days=days,
+               chunk_size=options['chunk_size'],
+               strip_bodies=options['strip_bodies'],
+               pause=options['pause']
+          )
+          
+          action = 'stripped' if options['strip_bodies'] else 'archived'
+          self.stdout.write(
+               self.style.SUCCESS(f'Successfully {action} {processed} notifications older than {days} days')
+          )
@@ -0,0 +1,86 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.core.mail import EmailMessage
+from django.core.management.base import BaseCommand
+from services.mail.mail_transport import StubSMTPTransport
+
+
+class Command(BaseCommand):
+     help = 'Benchmark email throughput against an in-process stub SMTP server (no network needed)'
+
+     def add_arguments(self, parser):
+          parser.add_argument(
+               '--messages',
+               type=int,
+               default=1000,
+               help='Number of emails to send'
+          )
+          parser.add_argument(
+               '--threads',
+               type=int,
+               default=4,
+               help='Number of sending threads'
+          )
+          parser.add_argument(
+               '--pool-size',
+               type=int,
+               help='Pooled SMTP connections (default MAIL_POOL_SIZE)'
+          )
+          parser.add_argument(
+               '--latency',
+               type=float,
+               default=0,
+               help='Seconds the stub server spends on each message'
+          )
+          parser.add_argument(
+               '--compare',
+               action='store_true',
+               help='Also run with a new connection per email, as sending without a pool does'
+          )
+
+     def handle(self, *args, **options):
+          runs = [('pooled', {})]
+          if options['compare']:
+               runs.append(('connection per email', {'max_messages': 1}))
+
+          for label, transport_options in runs:
+               transport = StubSMTPTransport(
+                    latency=options['latency'],
+                    pool_size=options['pool_size'],
+                    **transport_options
+               )
+
+               try:
+                    elapsed, results = self._run(transport, options['messages'], options['threads'])
+                    received = transport.server.message_count
+               finally:
+                    transport.close()
+
+               failed = sum(1 for error in results if error is not None)
+               self.stdout.write(
+                    f"{label}: {len(results) - failed} sent, {failed} failed, {received} received by the stub "
+                    f"in {elapsed:.2f}s ({len(results) / elapsed:.0f} emails/s, "
+                    f"{transport.stats['connections']} connections)"
+               )
+
+          self.stdout.write(self.style.SUCCESS('Benchmark complete'))
+
+     def _run(self, transport, count, threads):
+          messages = [
+               EmailMessage(
+                    f'Benchmark {i}',
+                    'Mail transport benchmark message.',
+                    from_email=settings.EMAIL_FROM,
+                    to=[f'benchmark{i}@example.com']
+               )
+               for i in range(count)
+          ]
+          # Each thread sends its share in one call, like a notification worker batch
+          shares = [messages[i::threads] for i in range(threads)]
+
+          started = time.perf_counter()
+          with ThreadPoolExecutor(max_workers=threads) as executor:
+               results = [error for share in executor.map(transport.send_messages, shares) for error in share]
+
+          return time.perf_counter() - started, results
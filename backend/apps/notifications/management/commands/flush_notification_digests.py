@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from services.notification.digest_service import NotificationDigestService
+
+
+class Command(BaseCommand):
+     help = 'Send digests of buffered notifications whose window has elapsed'
+
+     def add_arguments(self, parser):
+          parser.add_argument(
+               '--window',
+               type=int,
+               help='Seconds to buffer before sending a digest (default NOTIFICATION_DIGEST_WINDOW)'
+          )
+
+     def handle(self, *args, **options):
+          result = NotificationDigestService.flush_due(window=options['window'])
+          
+          self.stdout.write(
+               self.style.SUCCESS(
+                    f"Successfully queued {result['messages']} messages carrying {result['notifications']} buffered notifications"
+               )
+          )
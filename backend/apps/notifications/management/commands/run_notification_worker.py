@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand
+from services.notification.notification_delivery_service import NotificationDeliveryService
+
+
+class Command(BaseCommand):
+     help = 'Deliver queued notifications from the database outbox'
+
+     def add_arguments(self, parser):
+          parser.add_argument(
+               '--concurrency',
+               type=int,
+               default=4,
+               help='Number of notifications delivered in parallel'
+          )
+          parser.add_argument(
+               '--batch-size',
+               type=int,
+               help='Notifications claimed per poll (default NOTIFICATION_WORKER_BATCH_SIZE)'
+          )
+          parser.add_argument(
+               '--poll-interval',
+               type=float,
+               help='Seconds to wait when the outbox is empty (default NOTIFICATION_WORKER_POLL_INTERVAL)'
+          )
+          parser.add_argument(
+               '--retries-only',
+               action='store_true',
+               help='Only re-deliver failed notifications whose retry is due'
+          )
+          parser.add_argument(
+               '--once',
+               action='store_true',
+               help='Drain the outbox and exit instead of polling forever'
+          )
+
+     def handle(self, *args, **options):
+          self.stdout.write(f"Notification worker started (concurrency={options['concurrency']})")
+          
+          try:
+               processed = NotificationDeliveryService.run_worker(
+                    concurrency=options['concurrency'],
+                    batch_size=options['batch_size'],
+                    poll_interval=options['poll_interval'],
+                    once=options['once'],
+                    retries_only=options['retries_only']
+               )
+          except KeyboardInterrupt:
+               self.stdout.write(self.style.WARNING('Notification worker stopped'))
+               return
+          
+          self.stdout.write(
+               self.style.SUCCESS(f'Successfully processed {processed} notifications')
+          )
@@ -0,0 +1,36 @@
+# Generated by Django 5.1.1 on 2026-10-18 05:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0010_eventregistrationrollup'),
+        ('notifications', '0002_auto_20250714_1614'),
+        ('organizations', '0004_remove_organizationinvitation_is_registration_approved'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='notification',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('sent', 'Sent'), ('failed', 'Failed'), ('delivered', 'Delivered')], default='pending', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='notification',
+            name='type',
+            field=models.CharField(choices=[('org_invitation_sent', 'Organization Invitation Sent'), ('org_invitation_accepted', 'Organization Invitation Accepted'), ('org_invitation_rejected', 'Organization Invitation Rejected'), ('event_created', 'Event Created'), ('event_updated', 'Event Updated'), ('event_cancelled', 'Event Cancelled'), ('event_published', 'Event Published'), ('attendee_registered', 'Attendee Registered'), ('attendee_invited', 'Attendee Invited'), ('attendee_confirmed', 'Registration Confirmed'), ('attendee_rejected', 'Registration Rejected'), ('attendee_waitlisted', 'Added to Waitlist'), ('attendee_promoted', 'Promoted from Waitlist'), ('event_reminder_24h', 'Event Reminder (24 hours)'), ('event_reminder_1h', 'Event Reminder (1 hour)')], max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='notificationtemplate',
+            name='type',
+            field=models.CharField(choices=[('org_invitation_sent', 'Organization Invitation Sent'), ('org_invitation_accepted', 'Organization Invitation Accepted'), ('org_invitation_rejected', 'Organization Invitation Rejected'), ('event_created', 'Event Created'), ('event_updated', 'Event Updated'), ('event_cancelled', 'Event Cancelled'), ('event_published', 'Event Published'), ('attendee_registered', 'Attendee Registered'), ('attendee_invited', 'Attendee Invited'), ('attendee_confirmed', 'Registration Confirmed'), ('attendee_rejected', 'Registration Rejected'), ('attendee_waitlisted', 'Added to Waitlist'), ('attendee_promoted', 'Promoted from Waitlist'), ('event_reminder_24h', 'Event Reminder (24 hours)'), ('event_reminder_1h', 'Event Reminder (1 hour)')], max_length=50),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['status', 'created_at'], name='notificatio_status_9a4505_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.1 on 2026-10-18 05:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0010_eventregistrationrollup'),
+        ('notifications', '0003_notification_outbox'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReminderCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('status', models.BooleanField(default=True)),
+                ('type', models.CharField(choices=[('org_invitation_sent', 'Organization Invitation Sent'), ('org_invitation_accepted', 'Organization Invitation Accepted'), ('org_invitation_rejected', 'Organization Invitation Rejected'), ('event_created', 'Event Created'), ('event_updated', 'Event Updated'), ('event_cancelled', 'Event Cancelled'), ('event_published', 'Event Published'), ('attendee_registered', 'Attendee Registered'), ('attendee_invited', 'Attendee Invited'), ('attendee_confirmed', 'Registration Confirmed'), ('attendee_rejected', 'Registration Rejected'), ('attendee_waitlisted', 'Added to Waitlist'), ('attendee_promoted', 'Promoted from Waitlist'), ('event_reminder_24h', 'Event Reminder (24 hours)'), ('event_reminder_1h', 'Event Reminder (1 hour)')], max_length=50)),
+                ('last_attendee_id', models.PositiveBigIntegerField(default=0)),
+                ('sent_count', models.PositiveIntegerField(default=0)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reminder_checkpoints', to='events.event')),
+            ],
+            options={
+                'unique_together': {('event', 'type')},
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.1 on 2026-10-18 05:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0004_reminder_checkpoint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='dedupe_key',
+            field=models.CharField(blank=True, max_length=64, null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.1.1 on 2026-10-18 05:13
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0010_eventregistrationrollup'),
+        ('notifications', '0005_notification_dedupe_key'),
+        ('organizations', '0004_remove_organizationinvitation_is_registration_approved'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='attempts',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='next_retry_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='notification',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('sent', 'Sent'), ('failed', 'Failed'), ('delivered', 'Delivered'), ('dead_letter', 'Dead Letter')], default='pending', max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['status', 'next_retry_at'], name='notificatio_status_6bb0bf_idx'),
+        ),
+    ]
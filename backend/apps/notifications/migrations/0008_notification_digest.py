@@ -0,0 +1,39 @@
+# Generated by Django 5.1.1 on 2026-10-18 05:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0007_notification_read_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='digest',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='digested_notifications', to='notifications.notification'),
+        ),
+        migrations.AlterField(
+            model_name='notification',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('sent', 'Sent'), ('failed', 'Failed'), ('delivered', 'Delivered'), ('dead_letter', 'Dead Letter'), ('buffered', 'Buffered'), ('digested', 'Sent in Digest')], default='pending', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='notification',
+            name='type',
+            field=models.CharField(choices=[('org_invitation_sent', 'Organization Invitation Sent'), ('org_invitation_accepted', 'Organization Invitation Accepted'), ('org_invitation_rejected', 'Organization Invitation Rejected'), ('event_created', 'Event Created'), ('event_updated', 'Event Updated'), ('event_cancelled', 'Event Cancelled'), ('event_published', 'Event Published'), ('attendee_registered', 'Attendee Registered'), ('attendee_invited', 'Attendee Invited'), ('attendee_confirmed', 'Registration Confirmed'), ('attendee_rejected', 'Registration Rejected'), ('attendee_waitlisted', 'Added to Waitlist'), ('attendee_promoted', 'Promoted from Waitlist'), ('event_reminder_24h', 'Event Reminder (24 hours)'), ('event_reminder_1h', 'Event Reminder (1 hour)'), ('digest', 'Notification Digest')], max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='notificationtemplate',
+            name='type',
+            field=models.CharField(choices=[('org_invitation_sent', 'Organization Invitation Sent'), ('org_invitation_accepted', 'Organization Invitation Accepted'), ('org_invitation_rejected', 'Organization Invitation Rejected'), ('event_created', 'Event Created'), ('event_updated', 'Event Updated'), ('event_cancelled', 'Event Cancelled'), ('event_published', 'Event Published'), ('attendee_registered', 'Attendee Registered'), ('attendee_invited', 'Attendee Invited'), ('attendee_confirmed', 'Registration Confirmed'), ('attendee_rejected', 'Registration Rejected'), ('attendee_waitlisted', 'Added to Waitlist'), ('attendee_promoted', 'Promoted from Waitlist'), ('event_reminder_24h', 'Event Reminder (24 hours)'), ('event_reminder_1h', 'Event Reminder (1 hour)'), ('digest', 'Notification Digest')], max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='remindercheckpoint',
+            name='type',
+            field=models.CharField(choices=[('org_invitation_sent', 'Organization Invitation Sent'), ('org_invitation_accepted', 'Organization Invitation Accepted'), ('org_invitation_rejected', 'Organization Invitation Rejected'), ('event_created', 'Event Created'), ('event_updated', 'Event Updated'), ('event_cancelled', 'Event Cancelled'), ('event_published', 'Event Published'), ('attendee_registered', 'Attendee Registered'), ('attendee_invited', 'Attendee Invited'), ('attendee_confirmed', 'Registration Confirmed'), ('attendee_rejected', 'Registration Rejected'), ('attendee_waitlisted', 'Added to Waitlist'), ('attendee_promoted', 'Promoted from Waitlist'), ('event_reminder_24h', 'Event Reminder (24 hours)'), ('event_reminder_1h', 'Event Reminder (1 hour)'), ('digest', 'Notification Digest')], max_length=50),
+        ),
+    ]
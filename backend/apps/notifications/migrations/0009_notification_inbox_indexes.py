@@ -0,0 +1,25 @@
+# Generated by Django 5.1.1 on 2026-10-18 05:17
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0010_eventregistrationrollup'),
+        ('notifications', '0008_notification_digest'),
+        ('organizations', '0004_remove_organizationinvitation_is_registration_approved'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['recipient_user', '-created_at', '-id'], name='notification_inbox_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('read_at__isnull', True), models.Q(('type', 'digest'), _negated=True)), fields=['recipient_user'], name='notification_unread_idx'),
+        ),
+    ]
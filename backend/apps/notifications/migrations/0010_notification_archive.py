@@ -0,0 +1,36 @@
+# Generated by Django 5.1.1 on 2026-10-18 05:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0009_notification_inbox_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationArchive',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('original_id', models.BigIntegerField(unique=True)),
+                ('type', models.CharField(choices=[('org_invitation_sent', 'Organization Invitation Sent'), ('org_invitation_accepted', 'Organization Invitation Accepted'), ('org_invitation_rejected', 'Organization Invitation Rejected'), ('event_created', 'Event Created'), ('event_updated', 'Event Updated'), ('event_cancelled', 'Event Cancelled'), ('event_published', 'Event Published'), ('attendee_registered', 'Attendee Registered'), ('attendee_invited', 'Attendee Invited'), ('attendee_confirmed', 'Registration Confirmed'), ('attendee_rejected', 'Registration Rejected'), ('attendee_waitlisted', 'Added to Waitlist'), ('attendee_promoted', 'Promoted from Waitlist'), ('event_reminder_24h', 'Event Reminder (24 hours)'), ('event_reminder_1h', 'Event Reminder (1 hour)'), ('digest', 'Notification Digest')], max_length=50)),
+                ('channel', models.CharField(choices=[('email', 'Email'), ('websocket', 'WebSocket'), ('sms', 'SMS')], max_length=20)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('sent', 'Sent'), ('failed', 'Failed'), ('delivered', 'Delivered'), ('dead_letter', 'Dead Letter'), ('buffered', 'Buffered'), ('digested', 'Sent in Digest')], max_length=20)),
+                ('recipient_email', models.EmailField(max_length=254)),
+                ('recipient_user_id', models.BigIntegerField(blank=True, null=True)),
+                ('event_id', models.BigIntegerField(blank=True, null=True)),
+                ('organization_id', models.BigIntegerField(blank=True, null=True)),
+                ('subject', models.CharField(blank=True, max_length=255)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('created_at', models.DateTimeField()),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['recipient_email', 'created_at'], name='notificatio_recipie_b11f19_idx'), models.Index(fields=['event_id', 'type'], name='notificatio_event_i_b67c5f_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.1.1 on 2026-10-18 09:20
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_start_datetime(apps, schema_editor):
+    ReminderCheckpoint = apps.get_model('notifications', 'ReminderCheckpoint')
+    Event = apps.get_model('events', 'Event')
+
+    # Existing checkpoints belong to the event's current start time
+    ReminderCheckpoint.objects.update(
+        start_datetime=Subquery(Event.objects.filter(pk=OuterRef('event_id')).values('start_datetime')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0010_eventregistrationrollup'),
+        ('notifications', '0010_notification_archive'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='remindercheckpoint',
+            name='start_datetime',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.RunPython(backfill_start_datetime, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='remindercheckpoint',
+            name='start_datetime',
+            field=models.DateTimeField(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='remindercheckpoint',
+            unique_together={('event', 'type', 'start_datetime')},
+        ),
+    ]
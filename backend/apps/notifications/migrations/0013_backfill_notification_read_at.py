@@ -0,0 +1,31 @@
+# Generated by Django 5.1.1 on 2026-10-18 11:02
+
+from datetime import timedelta
+from django.db import migrations
+from django.db.models import Q
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+# NOTIFICATION_UNREAD_DAYS when this migration was written
+UNREAD_DAYS = 30
+
+
+def backfill_read_at(apps, schema_editor):
+    Notification = apps.get_model('notifications', 'Notification')
+    cutoff = timezone.now() - timedelta(days=UNREAD_DAYS)
+
+    # Only recent inbox rows start unread; everything else counts as read when it was sent
+    Notification.objects.filter(read_at__isnull=True).filter(
+        Q(recipient_user__isnull=True) | Q(type='digest') | Q(created_at__lt=cutoff)
+    ).update(read_at=Coalesce('sent_at', 'created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0012_notification_attendee_activity'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_read_at, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,6 @@
 from enum import Enum
 from django.db import models
+from django.db.models import Q
 from core.abstract_models import TimeStampModel
 
 
@@ -26,6 +27,9 @@ class NotificationType(models.TextChoices):
      # Event reminders
      EVENT_REMINDER_24H = 'event_reminder_24h', 'Event Reminder (24 hours)'
      EVENT_REMINDER_1H = 'event_reminder_1h', 'Event Reminder (1 hour)'
+     
+     # Combined message for buffered notifications
+     DIGEST = 'digest', 'Notification Digest'
 
 
 class NotificationChannel(models.TextChoices):
@@ -36,9 +40,13 @@ class NotificationChannel(models.TextChoices):
 
 class NotificationStatus(models.TextChoices):
      PENDING = 'pending', 'Pending'
+     PROCESSING = 'processing', 'Processing'
      SENT = 'sent', 'Sent'
      FAILED = 'failed', 'Failed'
      DELIVERED = 'delivered', 'Delivered'
+     DEAD_LETTER = 'dead_letter', 'Dead Letter'  # Gave up after NOTIFICATION_MAX_ATTEMPTS
+     BUFFERED = 'buffered', 'Buffered'  # Waiting for the next digest of its recipient
+     DIGESTED = 'digested', 'Sent in Digest'
 
 
 class NotificationTemplate(TimeStampModel):
@@ -105,22 +113,109 @@ class Notification(TimeStampModel):
           related_name='notifications'
      )
      
+     # Digest that carried this notification (for notifications sent with digest=True)
+     digest = models.ForeignKey(
+          'self',
+          on_delete=models.SET_NULL,
+          null=True,
+          blank=True,
+          related_name='digested_notifications'
+     )
+     
      # Status tracking
      status = models.CharField(max_length=20, choices=NotificationStatus.choices, default=NotificationStatus.PENDING)
      sent_at = models.DateTimeField(null=True, blank=True)
      delivered_at = models.DateTimeField(null=True, blank=True)
+     read_at = models.DateTimeField(null=True, blank=True)
      error_message = models.TextField(blank=True)
      
+     # Retries (FAILED rows are picked up again once next_retry_at has passed)
+     attempts = models.PositiveSmallIntegerField(default=0)
+     next_retry_at = models.DateTimeField(null=True, blank=True)
+     
      # Metadata
      metadata = models.JSONField(default=dict, blank=True)  # For additional context data
      
+     # Hash of (type, event, recipient, bucket) for notifications that must be sent only once
+     dedupe_key = models.CharField(max_length=64, null=True, blank=True, unique=True)
+     
      class Meta:
           ordering = ['-created_at']
           indexes = [
                models.Index(fields=['type', 'status']),
                models.Index(fields=['recipient_email', 'created_at']),
                models.Index(fields=['event', 'type']),
+               # Outbox claim query of the delivery worker
+               models.Index(fields=['status', 'created_at']),
+               # Due retries of the retry sweeper
+               models.Index(fields=['status', 'next_retry_at']),
+               # Inbox pages, newest first
+               models.Index(fields=['recipient_user', '-created_at', '-id'], name='notification_inbox_idx'),
+               # Unread counts only touch unread rows
+               models.Index(
+                    fields=['recipient_user'],
+                    condition=Q(read_at__isnull=True) & ~Q(type='digest'),
+                    name='notification_unread_idx'
+               ),
           ]
      
      def __str__(self):
           return f"{self.get_type_display()} to {self.recipient_email}"
+
+
+class ReminderCheckpoint(TimeStampModel):
+     """Progress of one reminder run over the attendees of an event"""
+     event = models.ForeignKey(
+          'events.Event',
+          on_delete=models.CASCADE,
+          related_name='reminder_checkpoints'
+     )
+     type = models.CharField(max_length=50, choices=NotificationType.choices)
+     # Event start the run reminded about; a rescheduled event gets a new run
+     start_datetime = models.DateTimeField()
+     
+     # Attendees are processed in id order; a resumed run continues after this id
+     last_attendee_id = models.PositiveBigIntegerField(default=0)
+     sent_count = models.PositiveIntegerField(default=0)
+     completed_at = models.DateTimeField(null=True, blank=True)
+     
+     class Meta:
+          unique_together = ['event', 'type', 'start_datetime']
+     
+     def __str__(self):
+          return f"{self.get_type_display()} - {self.event_id} (after attendee {self.last_attendee_id})"
+
+
+class NotificationArchive(models.Model):
+     """
+     Compact copy of a notification past its retention period.
+     
+     Keeps what audits need (who got what and when) without the rendered body,
+     metadata or foreign key constraints, so archived rows stay small and
+     deleting events or users never has to touch them.
+     """
+     original_id = models.BigIntegerField(unique=True)
+     type = models.CharField(max_length=50, choices=NotificationType.choices)
+     channel = models.CharField(max_length=20, choices=NotificationChannel.choices)
+     status = models.CharField(max_length=20, choices=NotificationStatus.choices)
+     
+     recipient_email = models.EmailField()
+     recipient_user_id = models.BigIntegerField(null=True, blank=True)
+     event_id = models.BigIntegerField(null=True, blank=True)
+     organization_id = models.BigIntegerField(null=True, blank=True)
+     
+     subject = models.CharField(max_length=255, blank=True)
+     attempts = models.PositiveSmallIntegerField(default=0)
+     created_at = models.DateTimeField()
+     sent_at = models.DateTimeField(null=True, blank=True)
+     archived_at = models.DateTimeField(auto_now_add=True)
+     
+     class Meta:
+          ordering = ['-created_at']
+          indexes = [
+               models.Index(fields=['recipient_email', 'created_at']),
+               models.Index(fields=['event_id', 'type']),
+          ]
+     
+     def __str__(self):
+          return f"{self.get_type_display()} to {self.recipient_email} (archived)"
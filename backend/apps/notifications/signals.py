@@ -0,0 +1,17 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from apps.notifications.models import NotificationTemplate
+from services.notification.template_cache_service import NotificationTemplateCacheService
+
+
+@receiver(post_save, sender=NotificationTemplate)
+@receiver(post_delete, sender=NotificationTemplate)
+def invalidate_compiled_templates(sender, instance, **kwargs):
+     """
+     Drop compiled templates in every process when a template changes
+
+     The version is bumped after commit; bumping it earlier would let another
+     process cache the old row under the new version.
+     """
+     transaction.on_commit(NotificationTemplateCacheService.invalidate)
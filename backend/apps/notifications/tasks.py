@@ -0,0 +1,33 @@
+from celery import shared_task
+from services.notification.notification_delivery_service import NotificationDeliveryService
+from services.notification.digest_service import NotificationDigestService
+
+
+@shared_task(ignore_result=True)
+def deliver_notification(notification_id):
+     """Deliver one outbox notification (queued after the creating transaction commits)"""
+     NotificationDeliveryService.deliver_notification(notification_id)
+
+
+@shared_task(ignore_result=True)
+def deliver_notification_batch(notification_ids):
+     """Deliver a batch of outbox notifications over shared mail connections"""
+     NotificationDeliveryService.deliver_many(notification_ids)
+
+
+@shared_task(ignore_result=True)
+def drain_notification_outbox():
+     """Deliver notifications whose task was lost (e.g. broker down at commit time)"""
+     NotificationDeliveryService.run_worker(once=True)
+
+
+@shared_task(ignore_result=True)
+def retry_failed_notifications():
+     """Re-deliver FAILED notifications whose backoff has elapsed"""
+     NotificationDeliveryService.run_worker(once=True, retries_only=True)
+
+
+@shared_task(ignore_result=True)
+def flush_notification_digests():
+     """Send digests of buffered notifications whose window has elapsed"""
+     NotificationDigestService.flush_due()
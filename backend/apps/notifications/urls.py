@@ -2,6 +2,8 @@ from django.urls import path
 from apps.notifications.views import (
     NotificationTestAPIView,
     NotificationListAPIView,
+    NotificationUnreadCountAPIView,
+    NotificationMarkReadAPIView,
     NotificationTemplateListAPIView
 )
 
@@ -10,6 +12,8 @@ app_name = 'notifications'
 urlpatterns = [
     # Notification management
     path('', NotificationListAPIView.as_view(), name='notification-list'),
+    path('unread-count/', NotificationUnreadCountAPIView.as_view(), name='notification-unread-count'),
+    path('read/', NotificationMarkReadAPIView.as_view(), name='notification-mark-read'),
     path('test/', NotificationTestAPIView.as_view(), name='notification-test'),
     path('templates/', NotificationTemplateListAPIView.as_view(), name='template-list'),
 ]
@@ -1,10 +1,12 @@
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from drf_spectacular.utils import extend_schema
-from apps.notifications.models import Notification, NotificationTemplate
+from apps.notifications.models import NotificationTemplate, NotificationChannel
 from services.notification.notification_service import NotificationService, NotificationType
 from utils.view.custom_api_views import CustomAPIView
 from core.middleware.authentication import TokenAuthentication
+from services.notification.inbox_service import NotificationInboxService
+from utils.pagination.page import PageUtil
 
 
 @extend_schema(tags=["Notifications"])
@@ -18,7 +20,15 @@ class NotificationTestAPIView(CustomAPIView):
           responses={200: {"type": "object", "properties": {"message": {"type": "string"}}}}
      )
      def post(self, request):
-          """Send a test email notification"""
+          """Send a test email notification (or a WebSocket push with channel=websocket)"""
+          channel = request.data.get('channel', NotificationChannel.EMAIL)
+          
+          if channel not in (NotificationChannel.EMAIL, NotificationChannel.WEBSOCKET):
+               return self.error_response(
+                    message="Unsupported channel",
+                    status_code=status.HTTP_400_BAD_REQUEST
+               )
+          
           try:
                # Test context data
                context = {
@@ -36,11 +46,12 @@ class NotificationTestAPIView(CustomAPIView):
                     notification_type=NotificationType.ORGANIZATION_INVITATION_SENT,
                     recipient_email=request.user.email,
                     context=context,
-                    recipient_user=request.user
+                    recipient_user=request.user,
+                    channel=channel
                )
                
                return self.success_response(
-                    message="Test email sent successfully",
+                    message="Test notification queued successfully",
                     data={
                          'notification_id': notification.id,
                          'status': notification.status,
@@ -63,27 +74,21 @@ class NotificationListAPIView(CustomAPIView):
 
      @extend_schema(
           summary="Get user notifications",
-          responses={200: {"type": "array", "items": {"type": "object"}}}
+          responses={200: {"type": "object"}}
      )
      def get(self, request):
-          """Get notifications for the current user"""
-          notifications = Notification.objects.filter(
-               recipient_user=request.user
-          ).order_by('-created_at')[:20]  # Last 20 notifications
+          """Get notifications for the current user (cursor paginated, newest first)"""
+          _, page_size = PageUtil.get_page_params(
+               request.query_params,
+               max_page_size=NotificationInboxService.MAX_PAGE_SIZE
+          )
           
-          data = []
-          for notification in notifications:
-               data.append({
-                    'id': notification.id,
-                    'type': notification.get_type_display(),
-                    'subject': notification.subject,
-                    'message': notification.message[:100] + '...' if len(notification.message) > 100 else notification.message,
-                    'status': notification.get_status_display(),
-                    'sent_at': notification.sent_at,
-                    'created_at': notification.created_at,
-                    'event_name': notification.event.name if notification.event else None,
-                    'organization_name': notification.organization.name if notification.organization else None
-               })
+          data = NotificationInboxService.get_inbox(
+               request.user,
+               cursor=request.query_params.get('cursor'),
+               page_size=page_size,
+               unread_only=request.query_params.get('unread_only', 'false').lower() == 'true'
+          )
           
           return self.success_response(
                message="Notifications retrieved successfully",
@@ -91,6 +96,55 @@ class NotificationListAPIView(CustomAPIView):
           )
 
 
+@extend_schema(tags=["Notifications"])
+class NotificationUnreadCountAPIView(CustomAPIView):
+     """Unread notification counter of the current user"""
+     authentication_classes = [TokenAuthentication]
+     permission_classes = [IsAuthenticated]
+
+     @extend_schema(
+          summary="Get unread notification count",
+          responses={200: {"type": "object", "properties": {"unread_count": {"type": "integer"}}}}
+     )
+     def get(self, request):
+          """Get the number of unread notifications"""
+          return self.success_response(
+               message="Unread count retrieved successfully",
+               data={'unread_count': NotificationInboxService.get_unread_count(request.user)}
+          )
+
+
+@extend_schema(tags=["Notifications"])
+class NotificationMarkReadAPIView(CustomAPIView):
+     """Mark notifications of the current user as read"""
+     authentication_classes = [TokenAuthentication]
+     permission_classes = [IsAuthenticated]
+
+     @extend_schema(
+          summary="Mark notifications as read",
+          request={"application/json": {"type": "object", "properties": {
+               "ids": {"type": "array", "items": {"type": "integer"}},
+               "all": {"type": "boolean"}
+          }}},
+          responses={200: {"type": "object"}}
+     )
+     def post(self, request):
+          """Mark the given notifications (or all of them) as read"""
+          updated = NotificationInboxService.mark_read(
+               request.user,
+               notification_ids=request.data.get('ids'),
+               mark_all=request.data.get('all') is True
+          )
+          
+          return self.success_response(
+               message="Notifications marked as read",
+               data={
+                    'updated': updated,
+                    'unread_count': NotificationInboxService.get_unread_count(request.user)
+               }
+          )
+
+
 @extend_schema(tags=["Notifications"])
 class NotificationTemplateListAPIView(CustomAPIView):
      """List notification templates (admin only)"""
@@ -11,4 +11,25 @@ def chunked_queryset(queryset: QuerySet, chunk_size: int):
                break
           yield chunk
           start = end
-          end += chunk_size
\ No newline at end of file
+          end += chunk_size
+
+def chunked_pks(queryset: QuerySet, chunk_size: int):
+     """
+     Yield primary keys of a queryset in ascending chunks using keyset pagination.
+     
+     Unlike chunked_queryset, every chunk is fetched with pk > last seen pk instead
+     of an OFFSET, so it is safe to delete or update the yielded rows while
+     iterating and each chunk costs the same.
+     """
+     last_pk = None
+     
+     while True:
+          chunk_queryset = queryset.order_by('pk')
+          if last_pk is not None:
+               chunk_queryset = chunk_queryset.filter(pk__gt=last_pk)
+          
+          pks = list(chunk_queryset.values_list('pk', flat=True)[:chunk_size])
+          if not pks:
+               break
+          yield pks
+          last_pk = pks[-1]
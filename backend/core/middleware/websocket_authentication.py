@@ -0,0 +1,37 @@
+from urllib.parse import parse_qs
+from channels.db import database_sync_to_async
+from channels.middleware import BaseMiddleware
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from utils.token.jwt import TokenUtil
+
+User = get_user_model()
+
+
+@database_sync_to_async
+def get_user_from_token(token):
+    """Return the token's user and expiry timestamp, or an anonymous user and None"""
+    try:
+        decoded_token = TokenUtil.decode_access_token(token)
+        return User.objects.get(pk=decoded_token['user_id']), decoded_token['exp']
+    except Exception:
+        return AnonymousUser(), None
+
+
+class TokenAuthMiddleware(BaseMiddleware):
+    """
+    Authenticate WebSocket connections with the access token.
+
+    Browsers can't set an Authorization header on a WebSocket handshake, so the
+    token is read from the query string (ws/notifications/?token=<access token>).
+    The token's expiry is put in scope['token_exp'] so consumers can close the
+    connection once it is no longer valid.
+    """
+
+    async def __call__(self, scope, receive, send):
+        query = parse_qs(scope.get('query_string', b'').decode())
+        token = query.get('token', [None])[0]
+
+        scope['user'], scope['token_exp'] = await get_user_from_token(token) if token else (AnonymousUser(), None)
+
+        return await super().__call__(scope, receive, send)
@@ -4,4 +4,14 @@ from decouple import config
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', config('DJANGO_SETTINGS_MODULE', default='event_planner.settings.development'))
 
-application = get_asgi_application()
+# Load Django (apps, models) before importing consumers
+django_asgi_application = get_asgi_application()
+
+from channels.routing import ProtocolTypeRouter, URLRouter
+from core.middleware.websocket_authentication import TokenAuthMiddleware
+from apps.notifications.routing import websocket_urlpatterns
+
+application = ProtocolTypeRouter({
+    'http': django_asgi_application,
+    'websocket': TokenAuthMiddleware(URLRouter(websocket_urlpatterns)),
+})
@@ -0,0 +1,11 @@
+import os
+from celery import Celery
+from decouple import config
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', config('DJANGO_SETTINGS_MODULE', default='event_planner.settings.development'))
+
+app = Celery('event_planner')
+
+# Read CELERY_* settings (broker, result backend) from the Django settings
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
@@ -24,6 +24,7 @@ INSTALLED_APPS = [
     'rest_framework',
     'drf_spectacular',
     'corsheaders',
+    'channels',
     'event_planner',
     'apps.events',
     'apps.users',
@@ -60,6 +61,14 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'event_planner.wsgi.application'
+ASGI_APPLICATION = 'event_planner.asgi.application'
+
+# In-memory layer for local testing (single process); development/production use Redis
+CHANNEL_LAYERS = {
+    'default': {
+        'BACKEND': 'channels.layers.InMemoryChannelLayer',
+    }
+}
 
 DATABASES = {
     'default': {
@@ -117,6 +126,69 @@ USE_I18N = True
 USE_TZ = True
 
 
+# Cache (per-process in the base settings, Redis in deployed environments). Deployments need a
+# shared cache: public event ETag/Last-Modified versions and the compiled notification template
+# version live here, and with LocMemCache every worker has its own (check events.W001)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# Seconds a public event response stays cached (entries are also invalidated by version bumps)
+PUBLIC_EVENT_CACHE_TIMEOUT = 60
+
+
+# Notification delivery: 'database' (run_notification_worker polls the outbox), 'celery' (task queued
+# after commit) or 'sync' (in-process after commit, still inside the HTTP request; for tests only)
+NOTIFICATION_DELIVERY_BACKEND = 'database'
+NOTIFICATION_WORKER_BATCH_SIZE = 50
+NOTIFICATION_SYNC_CONCURRENCY = 4  # Parallel deliveries of a bulk send with the 'sync' backend
+NOTIFICATION_WORKER_POLL_INTERVAL = 2  # Seconds between polls of an empty outbox
+NOTIFICATION_PROCESSING_TIMEOUT = 300  # Seconds before a claimed notification is considered abandoned
+NOTIFICATION_MAX_ATTEMPTS = 5  # Delivery attempts before a notification is dead-lettered
+NOTIFICATION_RETRY_BACKOFF = 60  # Seconds before the first retry, doubled after every failed attempt
+NOTIFICATION_RETRY_BACKOFF_MAX = 3600  # Upper bound of the retry delay in seconds
+MAIL_BATCH_SIZE = 100  # Emails sent over one mail connection before it is reopened
+# Mail transport: 'backend' (EMAIL_BACKEND, a connection per MAIL_BATCH_SIZE emails), 'smtp_pool'
+# (bounded pool of long-lived SMTP connections) or 'stub' (in-process stub SMTP server, for load tests)
+MAIL_TRANSPORT = 'backend'
+MAIL_POOL_SIZE = 4  # SMTP connections open at once per process
+MAIL_SEND_TIMEOUT = 10  # Socket timeout in seconds of every SMTP operation
+MAIL_POOL_ACQUIRE_TIMEOUT = 30  # Seconds a sender waits for a free pooled connection
+MAIL_POOL_HEALTH_CHECK_INTERVAL = 30  # Idle seconds after which a pooled connection is checked with NOOP
+MAIL_STUB_LATENCY = 0  # Seconds the stub SMTP server spends on each message
+REMINDER_CHUNK_SIZE = 500  # Attendees reminded per transaction (and checkpoint)
+REMINDER_DAEMON_INTERVAL = 60  # Seconds between reminder runs in --daemon mode
+NOTIFICATION_DIGEST_WINDOW = 300  # Seconds buffered notifications wait before they are combined into a digest
+# Notification types that are always buffered for the digest: attendee status changes, which busy events
+# send in bursts (a promotion is often followed by a confirmation for the same recipient)
+NOTIFICATION_DIGEST_TYPES = ['attendee_confirmed', 'attendee_rejected', 'attendee_waitlisted', 'attendee_promoted']
+NOTIFICATION_RETENTION_DAYS = 180  # Finished notifications older than this are archived by archive_notifications
+NOTIFICATION_ARCHIVE_CHUNK_SIZE = 1000  # Rows moved per (short) transaction
+NOTIFICATION_UNREAD_DAYS = 30  # Inbox notifications still unread after this many days are marked read by archive_notifications
+NOTIFICATION_ACK_BATCH_SIZE = 100  # WebSocket acknowledgements buffered before they are written
+NOTIFICATION_ACK_FLUSH_INTERVAL = 2  # Seconds an acknowledgement may wait in the buffer
+
+# Periodic tasks run by `celery beat` (make run-celery-beat)
+CELERY_BEAT_SCHEDULE = {
+    # Outbox rows whose delivery task was lost (e.g. broker down at commit time)
+    'drain-notification-outbox': {
+        'task': 'apps.notifications.tasks.drain_notification_outbox',
+        'schedule': 60.0,
+    },
+    # FAILED rows whose retry backoff has elapsed
+    'retry-failed-notifications': {
+        'task': 'apps.notifications.tasks.retry_failed_notifications',
+        'schedule': 30.0,
+    },
+    'flush-notification-digests': {
+        'task': 'apps.notifications.tasks.flush_notification_digests',
+        'schedule': 60.0,
+    },
+}
+
+
 # Static files (CSS, JavaScript, Images)
 STATIC_URL = 'static/'
 STATICFILES_DIRS = [BASE_DIR / 'static']
@@ -22,6 +22,7 @@ EMAIL_HOST_USER = ""
 EMAIL_HOST_PASSWORD = ""
 EMAIL_USE_TLS = False
 EMAIL_FROM = "admin@evp.org"
+MAIL_TRANSPORT = "smtp_pool"
 
 # Whitenoise Compressed Storage
 STORAGES = {
@@ -30,5 +31,23 @@ STORAGES = {
     },
 }
 
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': config('REDIS_CACHE_URL', default='redis://localhost:6379/1'),
+    }
+}
+
+CHANNEL_LAYERS = {
+    'default': {
+        'BACKEND': 'channels_redis.core.RedisChannelLayer',
+        'CONFIG': {
+            'hosts': [config('REDIS_CHANNEL_URL', default='redis://localhost:6379/2')],
+        },
+    }
+}
+
+NOTIFICATION_DELIVERY_BACKEND = config('NOTIFICATION_DELIVERY_BACKEND', default='celery')
+
 CELERY_BROKER_URL = 'redis://localhost:6379/0'
 CELERY_RESULT_BACKEND = 'redis://localhost:6379/0'
\ No newline at end of file
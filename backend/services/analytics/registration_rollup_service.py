@@ -0,0 +1,211 @@
+from datetime import datetime
+from django.db import transaction
+from django.db.models import F, Q, Sum, Count
+from django.db.models.functions import TruncHour, TruncDay
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from apps.events.models import Event, Attendee, AttendeeStatus, EventRegistrationRollup
+
+
+class RegistrationRollupService:
+     """
+     Service class for the hourly registration rollups
+
+     Every attendee status transition applied through Event.apply_attendee_transitions
+     is added to the rollup row of the current hour, inside the same transaction.
+     Time-series reads only touch rollup rows, so their cost depends on the
+     time range and not on the number of attendees.
+     """
+
+     INTERVALS = {
+          'hour': TruncHour,
+          'day': TruncDay,
+     }
+     FLOW_FIELDS = ['registrations', 'cancellations', 'pending_entries', 'approvals', 'promotions', 'rejections']
+     DELTA_FIELDS = {
+          AttendeeStatus.CONFIRMED: 'confirmed_delta',
+          AttendeeStatus.PENDING: 'pending_delta',
+          AttendeeStatus.WAITLISTED: 'waitlisted_delta',
+     }
+
+     @staticmethod
+     def record_transitions(event_id: int, transitions: dict, at: datetime = None) -> None:
+          """
+          Add attendee status transitions to the rollup of the current hour
+
+          Args:
+               event_id: The ID of the event
+               transitions: Mapping of (old_status, new_status) to number of attendees,
+                    as passed to Event.apply_attendee_transitions
+               at: Time of the transitions (defaults to now)
+          """
+          increments = RegistrationRollupService._transition_increments(transitions)
+
+          if not increments:
+               return
+
+          bucket_start = (at or timezone.now()).replace(minute=0, second=0, microsecond=0)
+
+          with transaction.atomic():
+               rollup, _ = EventRegistrationRollup.objects.get_or_create(
+                    event_id=event_id,
+                    bucket_start=bucket_start
+               )
+               EventRegistrationRollup.objects.filter(pk=rollup.pk).update(
+                    **{field: F(field) + value for field, value in increments.items()}
+               )
+
+     @staticmethod
+     def _transition_increments(transitions: dict) -> dict:
+          increments = {}
+
+          def add(field, value):
+               increments[field] = increments.get(field, 0) + value
+
+          for (old_status, new_status), count in transitions.items():
+               if old_status == new_status or not count:
+                    continue
+
+               if old_status is None:
+                    add('registrations', count)
+               if new_status is None:
+                    add('cancellations', count)
+               if new_status == AttendeeStatus.PENDING:
+                    add('pending_entries', count)
+               if new_status == AttendeeStatus.REJECTED:
+                    add('rejections', count)
+               if new_status == AttendeeStatus.CONFIRMED and old_status == AttendeeStatus.PENDING:
+                    add('approvals', count)
+               if new_status == AttendeeStatus.CONFIRMED and old_status == AttendeeStatus.WAITLISTED:
+                    add('promotions', count)
+
+               if old_status in RegistrationRollupService.DELTA_FIELDS:
+                    add(RegistrationRollupService.DELTA_FIELDS[old_status], -count)
+               if new_status in RegistrationRollupService.DELTA_FIELDS:
+                    add(RegistrationRollupService.DELTA_FIELDS[new_status], count)
+
+          return {field: value for field, value in increments.items() if value}
+
+     @staticmethod
+     def backfill_event(event_id: int) -> int:
+          """
+          Rebuild the rollups of one event from its attendee rows
+
+          Status history before rollups existed is not stored anywhere, so every
+          attendee is counted as registering in its current status at registered_at.
+
+          Args:
+               event_id: The ID of the event
+
+          Returns:
+               int: Number of rollup rows written
+          """
+          buckets = (
+               Attendee.objects.filter(event_id=event_id)
+               .annotate(bucket_start=TruncHour('registered_at'))
+               .values('bucket_start')
+               .annotate(
+                    registrations=Count('id'),
+                    confirmed=Count('id', filter=Q(status=AttendeeStatus.CONFIRMED)),
+                    pending=Count('id', filter=Q(status=AttendeeStatus.PENDING)),
+                    waitlisted=Count('id', filter=Q(status=AttendeeStatus.WAITLISTED)),
+                    rejected=Count('id', filter=Q(status=AttendeeStatus.REJECTED)),
+               )
+               .order_by('bucket_start')
+          )
+
+          rollups = [
+               EventRegistrationRollup(
+                    event_id=event_id,
+                    bucket_start=bucket['bucket_start'],
+                    registrations=bucket['registrations'],
+                    pending_entries=bucket['pending'],
+                    rejections=bucket['rejected'],
+                    confirmed_delta=bucket['confirmed'],
+                    pending_delta=bucket['pending'],
+                    waitlisted_delta=bucket['waitlisted'],
+               )
+               for bucket in buckets
+          ]
+
+          with transaction.atomic():
+               # Lock the event so live transitions don't interleave with the rebuild
+               Event.objects.select_for_update().filter(pk=event_id).first()
+               EventRegistrationRollup.objects.filter(event_id=event_id).delete()
+               EventRegistrationRollup.objects.bulk_create(rollups)
+
+          return len(rollups)
+
+     @staticmethod
+     def get_timeseries(event: Event, interval: str = 'hour', date_from: datetime = None, date_to: datetime = None) -> dict:
+          """
+          Get the registration time series of an event from the rollups
+
+          Args:
+               event: The event object
+               interval: Bucket size, 'hour' or 'day'
+               date_from: Only buckets starting at or after this time
+               date_to: Only buckets starting at or before this time
+
+          Returns:
+               dict: Buckets with flows and running status totals, plus a summary
+
+          Raises:
+               ValidationError: If the interval is not supported
+          """
+          if interval not in RegistrationRollupService.INTERVALS:
+               raise ValidationError(
+                    f"Unsupported interval. Choose one of: {', '.join(RegistrationRollupService.INTERVALS)}."
+               )
+
+          rollups = EventRegistrationRollup.objects.filter(event=event)
+          sum_fields = RegistrationRollupService.FLOW_FIELDS + list(RegistrationRollupService.DELTA_FIELDS.values())
+
+          # Status totals before the requested range, so running totals start from the right base
+          totals = {'confirmed_delta': 0, 'pending_delta': 0, 'waitlisted_delta': 0}
+          if date_from:
+               base = rollups.filter(bucket_start__lt=date_from).aggregate(
+                    **{field: Sum(field) for field in totals}
+               )
+               totals.update({field: value or 0 for field, value in base.items()})
+               rollups = rollups.filter(bucket_start__gte=date_from)
+
+          if date_to:
+               rollups = rollups.filter(bucket_start__lte=date_to)
+
+          rows = (
+               rollups.annotate(bucket=RegistrationRollupService.INTERVALS[interval]('bucket_start'))
+               .values('bucket')
+               .annotate(**{field: Sum(field) for field in sum_fields})
+               .order_by('bucket')
+          )
+
+          buckets = []
+          summary = {field: 0 for field in RegistrationRollupService.FLOW_FIELDS}
+
+          for row in rows:
+               for field in totals:
+                    totals[field] += row[field]
+               for field in summary:
+                    summary[field] += row[field]
+
+               bucket = {'bucket_start': row['bucket']}
+               bucket.update({field: row[field] for field in RegistrationRollupService.FLOW_FIELDS})
+               bucket.update({
+                    'confirmed_total': totals['confirmed_delta'],
+                    'pending_total': totals['pending_delta'],
+                    'waitlisted_total': totals['waitlisted_delta'],
+               })
+               buckets.append(bucket)
+
+          pending_entries = summary['pending_entries']
+          summary['pending_to_confirmed_rate'] = (
+               round((summary['approvals'] / pending_entries) * 100, 2) if pending_entries else 0.00
+          )
+
+          return {
+               'event_id': event.id,
+               'interval': interval,
+               'buckets': buckets,
+               'summary': summary
+          }
@@ -14,11 +14,17 @@ from services.notification.notification_service import EventNotificationService
 class AttendeeInvitationService:
     """Service for handling attendee invitation logic"""
     
+    BULK_CREATE_BATCH_SIZE = 500
+    
     @staticmethod
     def send_invitations(event: Event, inviter, validated_data: dict) -> dict:
         """
         Send invitations to multiple email addresses
         
+        Existing invitations and attendees of the whole list are looked up with one
+        query each and the new invitations are inserted with bulk_create. The emails
+        go out as one bulk notification send after the transaction commits.
+        
         Args:
             event: The event to invite attendees to
             inviter: User sending the invitations
@@ -32,39 +38,60 @@ class AttendeeInvitationService:
             raise PermissionDenied("You don't have permission to send invitations for this event.")
         
         emails = validated_data.pop('emails')
-        sent_count = 0
-        skipped_count = 0
+        lowered = [email.lower() for email in emails]
         errors = []
         
         with transaction.atomic():
-            for email in emails:
-                try:
-                    # Check if already invited or registered
-                    if AttendeeInvitationService._is_already_invited_or_registered(event, email):
-                        skipped_count += 1
-                        errors.append(f"{email}: Already invited or registered")
-                        continue
-                    
-                    # Create invitation
-                    invitation = AttendeeInvitation.objects.create(
-                        event=event,
-                        email=email.lower(),
-                        invited_by=inviter,
-                        expires_at=timezone.now() + timedelta(days=7),  # 7 days to respond
-                        **validated_data
-                    )
-                    
-                    # Send invitation email
-                    AttendeeInvitationService._send_invitation_email(invitation)
-                    sent_count += 1
-                    
-                except Exception as e:
-                    errors.append(f"{email}: {str(e)}")
-                    skipped_count += 1
+            # Any invitation blocks a new one: (event, email) is unique
+            invited = dict(
+                event.invitations.filter(email__in=lowered).values_list('email', 'status')
+            )
+            registered = set(event.attendees.filter(email__in=lowered).values_list('email', flat=True))
+            
+            expires_at = timezone.now() + timedelta(days=7)  # 7 days to respond
+            new_invitations = []
+            
+            for email, email_lower in zip(emails, lowered):
+                if email_lower in registered or invited.get(email_lower) == AttendeeInvitationStatus.PENDING:
+                    errors.append(f"{email}: Already invited or registered")
+                    continue
+                
+                if email_lower in invited:
+                    errors.append(f"{email}: Invitation already {invited[email_lower]}")
+                    continue
+                
+                new_invitations.append(AttendeeInvitation(
+                    event=event,
+                    email=email_lower,
+                    invited_by=inviter,
+                    expires_at=expires_at,
+                    **validated_data
+                ))
+            
+            # Rows inserted meanwhile by a concurrent request are skipped by the unique constraint
+            AttendeeInvitation.objects.bulk_create(
+                new_invitations,
+                batch_size=AttendeeInvitationService.BULK_CREATE_BATCH_SIZE,
+                ignore_conflicts=True
+            )
+            invitations = list(
+                AttendeeInvitation.objects.filter(
+                    token__in=[invitation.token for invitation in new_invitations]
+                ).select_related('invited_by').order_by('id')
+            )
+            
+            created_emails = {invitation.email for invitation in invitations}
+            errors.extend(
+                f"{invitation.email}: Already invited or registered"
+                for invitation in new_invitations if invitation.email not in created_emails
+            )
+            
+            if invitations:
+                AttendeeInvitationService._send_invitation_emails(event, invitations)
         
         return {
-            'sent_count': sent_count,
-            'skipped_count': skipped_count,
+            'sent_count': len(invitations),
+            'skipped_count': len(emails) - len(invitations),
             'total_attempted': len(emails),
             'errors': errors
         }
@@ -112,11 +139,14 @@ class AttendeeInvitationService:
         if not invitation.can_accept():
             raise ValidationError("Invitation cannot be accepted.")
         
-        # Check if event is at capacity (unless invitation bypasses capacity)
-        if not invitation.bypass_capacity and invitation.event.is_full:
-            raise ValidationError("Event is at full capacity.")
-        
         with transaction.atomic():
+            # Lock the event row so the capacity check and the insert are race-free
+            event = Event.objects.select_for_update().get(pk=invitation.event_id)
+            
+            # Check if event is at capacity (unless invitation bypasses capacity)
+            if not invitation.bypass_capacity and event.is_full:
+                raise ValidationError("Event is at full capacity.")
+            
             # Create attendee
             attendee_status = AttendeeStatus.CONFIRMED if invitation.is_vip else AttendeeStatus.CONFIRMED
             
@@ -204,25 +234,34 @@ class AttendeeInvitationService:
         if not AttendeeInvitationService._can_manage_invitations(event, user):
             raise PermissionDenied("You don't have permission to view invitation stats.")
         
-        invitations = event.invitations.all()
-        total = invitations.count()
+        event_stats = Event.objects.with_invitation_stats().get(pk=event.pk)
+        return AttendeeInvitationService._build_invitation_stats(event_stats)
+    
+    @staticmethod
+    def get_invitation_stats_for_events(event_ids: list) -> dict:
+        """
+        Get invitation statistics for many events with a single query
         
-        if total == 0:
-            return {
-                'total_invitations': 0,
-                'pending_invitations': 0,
-                'accepted_invitations': 0,
-                'rejected_invitations': 0,
-                'expired_invitations': 0,
-                'response_rate': 0.00
-            }
+        Args:
+            event_ids: IDs of the events (permissions are checked by the caller)
+            
+        Returns:
+            dict: Invitation statistics keyed by event ID
+        """
+        events = Event.objects.filter(id__in=event_ids).with_invitation_stats()
+        return {event.id: AttendeeInvitationService._build_invitation_stats(event) for event in events}
+    
+    @staticmethod
+    def _build_invitation_stats(event: Event) -> dict:
+        """Build the statistics payload from an event annotated with with_invitation_stats()"""
+        total = event.invitation_total
         
         stats = {
             'total_invitations': total,
-            'pending_invitations': invitations.filter(status=AttendeeInvitationStatus.PENDING).count(),
-            'accepted_invitations': invitations.filter(status=AttendeeInvitationStatus.ACCEPTED).count(),
-            'rejected_invitations': invitations.filter(status=AttendeeInvitationStatus.REJECTED).count(),
-            'expired_invitations': invitations.filter(status=AttendeeInvitationStatus.EXPIRED).count(),
+            'pending_invitations': event.invitation_pending,
+            'accepted_invitations': event.invitation_accepted,
+            'rejected_invitations': event.invitation_rejected,
+            'expired_invitations': event.invitation_expired,
         }
         
         # Calculate response rate (accepted + rejected / total)
@@ -244,37 +283,17 @@ class AttendeeInvitationService:
         """Check if user can manage invitations for event"""
         return AttendeeInvitationService._can_send_invitations(event, user)
     
-    @staticmethod
-    def _is_already_invited_or_registered(event: Event, email: str) -> bool:
-        """Check if email is already invited or registered for event"""
-        return (
-            event.invitations.filter(email=email.lower(), status=AttendeeInvitationStatus.PENDING).exists() or
-            event.attendees.filter(email=email.lower()).exists()
-        )
-    
     @staticmethod
     def _send_invitation_email(invitation: AttendeeInvitation) -> None:
         """Send invitation email notification"""
-        from django.conf import settings
+        from services.notification.notification_service import NotificationService, NotificationType
         
         context = {
-            'recipient_name': invitation.full_name or invitation.email.split('@')[0].title(),
-            'inviter_name': invitation.invited_by.full_name if invitation.invited_by else 'Event Organizer',
-            'event_name': invitation.event.name,
+            **EventNotificationService.build_event_context(invitation.event),
             'event_description': invitation.event.description,
-            'event_date': invitation.event.start_datetime.strftime('%B %d, %Y'),
-            'event_time': invitation.event.start_datetime.strftime('%I:%M %p'),
-            'venue_name': invitation.event.venue_name,
-            'venue_address': invitation.event.venue_address,
-            'organization_name': 'Event Organization',  # Simplified for now
-            'invitation_url': f"{settings.FRONTEND_BASE_URL}/invitations/attendee/accept?token={invitation.token}",
-            'personal_message': invitation.message,
-            'expires_at': invitation.expires_at.strftime('%B %d, %Y at %I:%M %p'),
-            'is_vip': invitation.is_vip
+            **AttendeeInvitationService._build_invitation_context(invitation),
         }
         
-        from services.notification.notification_service import NotificationService, NotificationType
-        
         NotificationService.send_notification(
             notification_type=NotificationType.ATTENDEE_INVITED,
             recipient_email=invitation.email,
@@ -282,3 +301,35 @@ class AttendeeInvitationService:
             event=invitation.event
             # Note: Not passing invitation parameter as it's for OrganizationInvitation only
         )
+    
+    @staticmethod
+    def _send_invitation_emails(event: Event, invitations: list) -> dict:
+        """Queue the invitation emails of many invitations as one bulk send (delivered after commit)"""
+        from services.notification.notification_service import NotificationService, NotificationType
+        
+        return NotificationService.send_bulk_notifications(
+            notification_type=NotificationType.ATTENDEE_INVITED,
+            recipients=[
+                {'email': invitation.email, 'context': AttendeeInvitationService._build_invitation_context(invitation)}
+                for invitation in invitations
+            ],
+            shared_context={
+                **EventNotificationService.build_event_context(event),
+                'event_description': event.description,
+            },
+            event=event
+        )
+    
+    @staticmethod
+    def _build_invitation_context(invitation: AttendeeInvitation) -> dict:
+        """Build the per-invitation part of the invitation email context"""
+        from django.conf import settings
+        
+        return {
+            'recipient_name': invitation.full_name or invitation.email.split('@')[0].title(),
+            'inviter_name': invitation.invited_by.full_name if invitation.invited_by else 'Event Organizer',
+            'invitation_url': f"{settings.FRONTEND_BASE_URL}/invitations/attendee/accept?token={invitation.token}",
+            'personal_message': invitation.message,
+            'expires_at': invitation.expires_at.strftime('%B %d, %Y at %I:%M %p'),
+            'is_vip': invitation.is_vip
+        }
@@ -1,8 +1,19 @@
+import csv
+import json
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import transaction
 from rest_framework.exceptions import ValidationError, NotFound
 from apps.events.models import Event, Attendee, AttendeeStatus
 from apps.events.serializers.event_serializer import AttendeeRegistrationSerializer, AttendeeSerializer, AttendeeStatusUpdateSerializer
 from services.notification.notification_service import EventNotificationService
+from services.attendee.waitlist_service import WaitlistService
+
+
+class _EchoBuffer:
+     """File-like object that hands back whatever is written, used to stream csv rows"""
+     
+     def write(self, value):
+          return value
 
 
 class AttendeeService:
@@ -10,6 +21,14 @@ class AttendeeService:
      Service class for handling attendee-related business logic
      """
      
+     EXPORT_FORMATS = {
+          'csv': 'text/csv',
+          'ndjson': 'application/x-ndjson',
+     }
+     EXPORT_FIELDS = ['id', 'full_name', 'email', 'phone', 'status', 'registered_at', 'confirmed_at']
+     EXPORT_CHUNK_SIZE = 2000
+     IMPORT_BATCH_SIZE = 500
+     
      @staticmethod
      def register_attendee(event: Event, validated_data: dict) -> dict:
           """
@@ -29,6 +48,9 @@ class AttendeeService:
           AttendeeService._validate_attendee_registration_rules(event, validated_data)
           
           with transaction.atomic():
+               # Lock the event row so concurrent registrations see each other's seats
+               event = Event.objects.select_for_update().get(pk=event.pk)
+               
                # Check if already registered
                existing_attendee = event.attendees.filter(email=validated_data['email']).first()
                
@@ -76,19 +98,21 @@ class AttendeeService:
                raise ValidationError("Attendee is already registered for this event")
      
      @staticmethod
-     def _determine_attendee_status(event: Event) -> str:
+     def _determine_attendee_status(event: Event, confirmed_count: int = None) -> str:
           """
           Determine the status for a new attendee based on event registration type and capacity
           
           Args:
-               event: The event to check
+               event: The event to check (should be locked with select_for_update)
+               confirmed_count: Confirmed seats to assume instead of the event counter (optional)
                
           Returns:
                str: The status for the new attendee
           """
           from apps.events.models import RegistrationType
           
-          confirmed_count = event.attendees.filter(status=AttendeeStatus.CONFIRMED).count()
+          if confirmed_count is None:
+               confirmed_count = event.confirmed_count
           
           # Check registration type and approval requirements
           if event.registration_type == RegistrationType.APPROVAL_REQUIRED or event.requires_approval:
@@ -110,6 +134,123 @@ class AttendeeService:
           # Default fallback
           return AttendeeStatus.PENDING
      
+     @staticmethod
+     def bulk_import_attendees(event: Event, rows: list, send_notifications: bool = True) -> dict:
+          """
+          Import many attendees at once (for organizers migrating from other systems)
+          
+          Rows are validated in memory, duplicates are found with a single query,
+          and new attendees are inserted with bulk_create in batches. Notifications
+          are sent only after the transaction commits.
+          
+          Args:
+               event: The event object (passed from view)
+               rows: List of dicts with full_name, email and optional phone
+               send_notifications: Whether to email each imported attendee
+               
+          Returns:
+               dict: Import summary with a per-row result report
+               
+          Raises:
+               ValidationError: If the event no longer accepts attendees
+          """
+          from apps.events.models import EventStatus
+          
+          if event.status in [EventStatus.CANCELLED, EventStatus.COMPLETED]:
+               raise ValidationError("Cannot import attendees into a cancelled or completed event")
+          
+          report = []
+          valid_rows = []
+          seen_emails = set()
+          
+          # Validate every row in memory
+          for row_number, row in enumerate(rows, start=1):
+               serializer = AttendeeRegistrationSerializer(data=row)
+               
+               if not serializer.is_valid():
+                    report.append({
+                         'row': row_number,
+                         'email': row.get('email'),
+                         'result': 'invalid',
+                         'errors': serializer.errors
+                    })
+                    continue
+               
+               email = serializer.validated_data['email']
+               
+               if email in seen_emails:
+                    report.append({'row': row_number, 'email': email, 'result': 'duplicate', 'errors': 'Duplicate email in import'})
+                    continue
+               
+               seen_emails.add(email)
+               valid_rows.append((row_number, serializer.validated_data))
+          
+          created_attendees = []
+          
+          with transaction.atomic():
+               # Lock the event row so imported seats and live registrations don't overlap
+               event = Event.objects.select_for_update().get(pk=event.pk)
+               
+               # Find already registered emails with one query
+               existing_emails = set(
+                    event.attendees.filter(email__in=seen_emails).values_list('email', flat=True)
+               )
+               
+               from django.utils import timezone
+               now = timezone.now()
+               confirmed_count = event.confirmed_count
+               new_attendees = []
+               transitions = {}
+               
+               for row_number, data in valid_rows:
+                    if data['email'] in existing_emails:
+                         report.append({'row': row_number, 'email': data['email'], 'result': 'duplicate', 'errors': 'Already registered for this event'})
+                         continue
+                    
+                    attendee_status = AttendeeService._determine_attendee_status(event, confirmed_count)
+                    
+                    if attendee_status == AttendeeStatus.CONFIRMED:
+                         confirmed_count += 1
+                    
+                    new_attendees.append(Attendee(
+                         event=event,
+                         status=attendee_status,
+                         confirmed_at=now if attendee_status == AttendeeStatus.CONFIRMED else None,
+                         **data
+                    ))
+                    transitions[(None, attendee_status)] = transitions.get((None, attendee_status), 0) + 1
+                    report.append({'row': row_number, 'email': data['email'], 'result': 'created', 'status': attendee_status})
+               
+               for start in range(0, len(new_attendees), AttendeeService.IMPORT_BATCH_SIZE):
+                    created_attendees.extend(
+                         Attendee.objects.bulk_create(new_attendees[start:start + AttendeeService.IMPORT_BATCH_SIZE])
+                    )
+               
+               Event.apply_attendee_transitions(event.id, transitions)
+               
+               if send_notifications and created_attendees:
+                    transaction.on_commit(
+                         lambda: AttendeeService._send_import_notifications(event, created_attendees)
+                    )
+          
+          report.sort(key=lambda item: item['row'])
+          
+          return {
+               'total_rows': len(rows),
+               'created_count': len(created_attendees),
+               'duplicate_count': sum(1 for item in report if item['result'] == 'duplicate'),
+               'invalid_count': sum(1 for item in report if item['result'] == 'invalid'),
+               'rows': report
+          }
+     
+     @staticmethod
+     def _send_import_notifications(event: Event, attendees: list) -> None:
+          """Send registration emails for imported attendees (runs after commit)"""
+          event_context = EventNotificationService.build_event_context(event)
+          
+          for attendee in attendees:
+               EventNotificationService.send_attendee_registration_notification(attendee, event, event_context)
+     
      @staticmethod
      def _is_event_at_capacity(event: Event) -> bool:
           """
@@ -121,9 +262,7 @@ class AttendeeService:
           Returns:
                bool: True if at capacity, False otherwise
           """
-          confirmed_attendees = event.attendees.filter(status='confirmed').count()
-          
-          return confirmed_attendees >= event.capacity
+          return event.confirmed_count >= event.capacity
      
      @staticmethod
      def _is_attendee_already_registered(event: Event, email: str) -> bool:
@@ -164,6 +303,58 @@ class AttendeeService:
           
           return serializer.data
      
+     @staticmethod
+     def export_event_attendees(event: Event, export_format: str = 'csv'):
+          """
+          Stream all attendees of an event as CSV or NDJSON
+          
+          Rows are read with a server-side cursor and encoded one at a time,
+          so memory use does not grow with the size of the event.
+          
+          Args:
+               event: The event object
+               export_format: Either 'csv' or 'ndjson'
+               
+          Returns:
+               tuple: (iterator of encoded rows, content type)
+               
+          Raises:
+               ValidationError: If the export format is not supported
+          """
+          if export_format not in AttendeeService.EXPORT_FORMATS:
+               raise ValidationError(
+                    f"Unsupported export format. Choose one of: {', '.join(AttendeeService.EXPORT_FORMATS)}"
+               )
+          
+          rows = Attendee.objects.filter(event_id=event.id).order_by('-registered_at').values_list(
+               *AttendeeService.EXPORT_FIELDS
+          ).iterator(chunk_size=AttendeeService.EXPORT_CHUNK_SIZE)
+          
+          if export_format == 'csv':
+               stream = AttendeeService._stream_csv_rows(rows)
+          else:
+               stream = AttendeeService._stream_ndjson_rows(rows)
+          
+          return stream, AttendeeService.EXPORT_FORMATS[export_format]
+     
+     @staticmethod
+     def _stream_csv_rows(rows):
+          """Encode attendee rows as CSV lines, header first"""
+          writer = csv.writer(_EchoBuffer())
+          yield writer.writerow(AttendeeService.EXPORT_FIELDS)
+          
+          for row in rows:
+               yield writer.writerow([
+                    value.isoformat() if hasattr(value, 'isoformat') else value
+                    for value in row
+               ])
+     
+     @staticmethod
+     def _stream_ndjson_rows(rows):
+          """Encode attendee rows as newline-delimited JSON objects"""
+          for row in rows:
+               yield json.dumps(dict(zip(AttendeeService.EXPORT_FIELDS, row)), cls=DjangoJSONEncoder) + '\n'
+     
      @staticmethod
      def update_attendee_status(event: Event, attendee_id: int, validated_data: dict) -> dict:
           """
@@ -180,21 +371,29 @@ class AttendeeService:
           Raises:
                NotFound: If attendee doesn't exist
           """
-          try:
-               attendee = event.attendees.get(id=attendee_id)
-          except Attendee.DoesNotExist:
-               raise NotFound("Attendee not found")
-          
-          # Store old status for notification
-          old_status = attendee.status
-          
-          # Update status
-          attendee.status = validated_data['status']
-          attendee.save()
+          with transaction.atomic():
+               # Event first, then attendee: the same lock order as registration and waitlist
+               # promotion, so concurrent status changes apply their counter transitions in turn
+               Event.objects.select_for_update().get(pk=event.pk)
+               try:
+                    attendee = event.attendees.select_for_update().get(id=attendee_id)
+               except Attendee.DoesNotExist:
+                    raise NotFound("Attendee not found")
+               
+               # Store old status for notification
+               old_status = attendee.status
+               
+               # Update status
+               attendee.status = validated_data['status']
+               attendee.save()
           
           # Send status update email to attendee
           EventNotificationService.send_attendee_status_update_notification(attendee, event, old_status)
           
+          # A confirmed seat was released, hand it to the waitlist
+          if old_status == AttendeeStatus.CONFIRMED and attendee.status != AttendeeStatus.CONFIRMED:
+               WaitlistService.promote_waitlisted_attendees(event.id)
+          
           serializer = AttendeeSerializer(attendee)
           return serializer.data
      
@@ -215,8 +414,13 @@ class AttendeeService:
           except Attendee.DoesNotExist:
                raise NotFound("Registration not found")
           
+          released_seat = attendee.status == AttendeeStatus.CONFIRMED
           attendee.delete()
           
+          # A confirmed seat was released, hand it to the waitlist
+          if released_seat:
+               WaitlistService.promote_waitlisted_attendees(event.id)
+          
           # TODO: Send cancellation confirmation email
      
      @staticmethod
@@ -253,20 +457,36 @@ class AttendeeService:
           Returns:
                dict: Registration statistics
           """
-          total_registrations = event.attendees.count()
-          confirmed = event.attendees.filter(status=AttendeeStatus.CONFIRMED).count()
-          pending = event.attendees.filter(status=AttendeeStatus.PENDING).count()
-          rejected = event.attendees.filter(status=AttendeeStatus.REJECTED).count()
-          waitlisted = event.attendees.filter(status=AttendeeStatus.WAITLISTED).count()
+          event_stats = Event.objects.with_attendee_stats().get(pk=event.pk)
           
+          return AttendeeService._build_registration_stats(event_stats)
+     
+     @staticmethod
+     def get_registration_stats_for_events(event_ids: list) -> dict:
+          """
+          Get registration statistics for many events with a single query
+          
+          Args:
+               event_ids: IDs of the events
+               
+          Returns:
+               dict: Registration statistics keyed by event ID
+          """
+          events = Event.objects.filter(id__in=event_ids).with_attendee_stats()
+          
+          return {event.id: AttendeeService._build_registration_stats(event) for event in events}
+     
+     @staticmethod
+     def _build_registration_stats(event: Event) -> dict:
+          """Build the statistics payload from an event annotated with with_attendee_stats()"""
           return {
-               'total_registrations': total_registrations,
-               'confirmed': confirmed,
-               'pending': pending,
-               'rejected': rejected,
-               'waitlisted': waitlisted,
+               'total_registrations': event.attendee_total,
+               'confirmed': event.attendee_confirmed,
+               'pending': event.attendee_pending,
+               'rejected': event.attendee_rejected,
+               'waitlisted': event.attendee_waitlisted,
                'capacity': event.capacity,
-               'available_spots': max(0, event.capacity - confirmed) if event.capacity else None
+               'available_spots': max(0, event.capacity - event.attendee_confirmed) if event.capacity else None
           }
      
      @staticmethod
@@ -0,0 +1,69 @@
+from django.db import transaction
+from django.utils import timezone
+from apps.events.models import Event, Attendee, AttendeeStatus, EventStatus
+from services.notification.notification_service import EventNotificationService
+
+
+class WaitlistService:
+     """
+     Service class for promoting waitlisted attendees into freed seats
+     """
+     
+     @staticmethod
+     def promote_waitlisted_attendees(event_id: int, send_notifications: bool = True) -> list:
+          """
+          Fill free seats with waitlisted attendees in FIFO order
+          
+          The event row is locked while seats are counted and assigned, and all
+          promoted attendees are confirmed with a single UPDATE.
+          
+          Args:
+               event_id: The ID of the event
+               send_notifications: Whether to email promoted attendees after commit
+               
+          Returns:
+               list: Promoted attendees
+          """
+          with transaction.atomic():
+               event = Event.objects.select_for_update().select_related(
+                    'created_by__organization'
+               ).get(pk=event_id)
+               
+               if event.status not in [EventStatus.PUBLISHED, EventStatus.ONGOING]:
+                    return []
+               
+               free_spots = event.capacity - event.confirmed_count
+               
+               if free_spots <= 0 or event.waitlisted_count == 0:
+                    return []
+               
+               attendee_ids = list(
+                    Attendee.objects.filter(
+                         event_id=event_id,
+                         status=AttendeeStatus.WAITLISTED
+                    ).order_by('registered_at', 'id').values_list('id', flat=True)[:free_spots]
+               )
+               
+               if not attendee_ids:
+                    return []
+               
+               now = timezone.now()
+               Attendee.objects.filter(id__in=attendee_ids).update(
+                    status=AttendeeStatus.CONFIRMED,
+                    confirmed_at=now,
+                    updated_at=now
+               )
+               Event.apply_attendee_transitions(
+                    event_id, {(AttendeeStatus.WAITLISTED, AttendeeStatus.CONFIRMED): len(attendee_ids)}
+               )
+               
+               promoted = list(
+                    Attendee.objects.filter(id__in=attendee_ids).select_related('user').order_by('registered_at', 'id')
+               )
+               
+               if send_notifications:
+                    transaction.on_commit(
+                         lambda: EventNotificationService.send_attendee_promoted_notifications(event, promoted)
+                    )
+          
+          return promoted
@@ -0,0 +1,158 @@
+import time
+import hashlib
+from datetime import datetime, timezone as dt_timezone
+from urllib.parse import urlencode
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.http import quote_etag, http_date
+from apps.events.models import Event
+
+
+class PublicEventCacheService:
+     """
+     Service class for the public event response cache
+
+     Cache keys embed a version number: one per event and scope (detail and
+     schedule responses) and one for the public listing. Signals bump the
+     versions of the scopes whose payload changed (attendee counters only touch
+     the detail scope), so old entries are never read again and simply expire.
+     Every bump also records its time, which is the scope's Last-Modified.
+
+     The versions are the ETags, so all workers must share the cache (Redis in
+     development and production); the events.W001 check warns otherwise.
+     """
+
+     KEY_PREFIX = 'public_events'
+     LIST_VERSION_KEY = f'{KEY_PREFIX}:list:version'
+     EVENT_SCOPES = ['detail', 'schedule']
+
+     @staticmethod
+     def _event_version_key(event_id: int, scope: str) -> str:
+          return f'{PublicEventCacheService.KEY_PREFIX}:event:{event_id}:{scope}:version'
+
+     @staticmethod
+     def _get_version(version_key: str) -> int:
+          version = cache.get(version_key)
+          if version is None:
+               # Start from the clock so a lost version key can't collide with older entries
+               version = time.time_ns()
+               if not cache.add(version_key, version, timeout=None):
+                    version = cache.get(version_key, version)
+          return version
+
+     @staticmethod
+     def _bump_version(version_key: str) -> None:
+          try:
+               cache.incr(version_key)
+          except ValueError:
+               cache.set(version_key, time.time_ns(), timeout=None)
+          cache.set(f'{version_key}:modified', time.time(), timeout=None)
+
+     @staticmethod
+     def _get_modified(version_key: str) -> float:
+          modified = cache.get(f'{version_key}:modified')
+          if modified is None:
+               # Unknown (new or evicted key): treat it as modified now
+               modified = time.time()
+               if not cache.add(f'{version_key}:modified', modified, timeout=None):
+                    modified = cache.get(f'{version_key}:modified', modified)
+          return modified
+
+     @staticmethod
+     def build_key(scope: str, query_params, event_id: int = None) -> str:
+          """
+          Build the cache key for a public endpoint response
+
+          Args:
+               scope: Endpoint name (e.g. 'list', 'detail', 'schedule')
+               query_params: Request query parameters (QueryDict)
+               event_id: The ID of the event for per-event endpoints
+
+          Returns:
+               str: Versioned cache key
+          """
+          params = urlencode(sorted(query_params.lists()), doseq=True) if query_params else ''
+          params_hash = hashlib.md5(params.encode()).hexdigest()
+
+          if event_id is None:
+               version = PublicEventCacheService._get_version(PublicEventCacheService.LIST_VERSION_KEY)
+               return f'{PublicEventCacheService.KEY_PREFIX}:{scope}:v{version}:{params_hash}'
+
+          version = PublicEventCacheService._get_version(PublicEventCacheService._event_version_key(event_id, scope))
+          return f'{PublicEventCacheService.KEY_PREFIX}:{scope}:{event_id}:v{version}:{params_hash}'
+
+     @staticmethod
+     def get(cache_key: str):
+          """Return the cached response data or None"""
+          return cache.get(cache_key)
+
+     @staticmethod
+     def set(cache_key: str, data) -> None:
+          """Store response data for the configured timeout"""
+          cache.set(cache_key, data, timeout=settings.PUBLIC_EVENT_CACHE_TIMEOUT)
+
+     @staticmethod
+     def invalidate_event(event_id: int, scopes: list = None) -> None:
+          """
+          Invalidate the cached responses of one event
+
+          Args:
+               event_id: The ID of the event
+               scopes: Per-event scopes whose payload changed (default: all)
+          """
+          for scope in scopes or PublicEventCacheService.EVENT_SCOPES:
+               PublicEventCacheService._bump_version(PublicEventCacheService._event_version_key(event_id, scope))
+
+     @staticmethod
+     def invalidate_list() -> None:
+          """Invalidate all cached public listing pages"""
+          PublicEventCacheService._bump_version(PublicEventCacheService.LIST_VERSION_KEY)
+
+     @staticmethod
+     def get_event_validators(event_id: int, scope: str):
+          """
+          Compute the conditional GET validators of a public event response
+
+          Both come from the scope's cache version, so only changes to that
+          representation (including deleted sessions and speakers) produce a new
+          ETag and advance Last-Modified. One small query checks the event is
+          public; 304 answers never load or serialize the payload.
+
+          Args:
+               event_id: The ID of the event
+               scope: Endpoint name ('detail' or 'schedule')
+
+          Returns:
+               tuple: (etag, last_modified) or None if the event is not public
+          """
+          event = Event.objects.public().filter(pk=event_id).only(
+               'id', 'start_datetime', 'registration_opens', 'registration_closes'
+          ).first()
+
+          if event is None:
+               return None
+
+          version_key = PublicEventCacheService._event_version_key(event_id, scope)
+          version = PublicEventCacheService._get_version(version_key)
+          last_modified = datetime.fromtimestamp(PublicEventCacheService._get_modified(version_key), tz=dt_timezone.utc)
+          parts = [scope, event.id, version]
+
+          if scope == 'detail':
+               # The registration window opens and closes with time alone
+               parts.append(event.is_registration_open)
+               now = timezone.now()
+               passed = [
+                    boundary for boundary in (event.registration_opens, event.registration_closes, event.start_datetime)
+                    if boundary and boundary <= now
+               ]
+               last_modified = max([last_modified, *passed])
+
+          etag = quote_etag(hashlib.sha256('|'.join(str(part) for part in parts).encode()).hexdigest())
+          return etag, last_modified
+
+     @staticmethod
+     def set_validator_headers(response, etag: str, last_modified) -> None:
+          """Attach ETag and Last-Modified headers to a response"""
+          response['ETag'] = etag
+          response['Last-Modified'] = http_date(last_modified.timestamp())
@@ -2,11 +2,14 @@ from django.db import transaction
 from django.utils.text import slugify
 from rest_framework.exceptions import ValidationError
 from django.shortcuts import get_object_or_404
-from apps.events.models import Event
+from django.db.models import Prefetch
+from apps.events.models import Event, Session
 from apps.events.serializers.event_serializer import EventSerializer, EventCreateSerializer
 
 
 class EventService:
+     MAX_STATS_EVENTS = 100
+
      @staticmethod
      def create_event(user, validated_data: dict) -> dict:
           """
@@ -42,18 +45,105 @@ class EventService:
                return serializer.data
 
      @staticmethod
-     def get_event_list_for_each_organization(user):
+     def _with_event_relations(queryset):
+          """
+          Load everything EventSerializer nests with a fixed number of queries
+          
+          Speakers and sessions (with their speaker) are fetched in one query each
+          for the whole page; the availability fields read the event's counters.
+          """
+          return queryset.prefetch_related(
+               'speakers',
+               Prefetch('sessions', queryset=Session.objects.select_related('speaker'))
+          )
+
+     @staticmethod
+     def get_event_list_for_each_organization(user, page: int = 1, page_size: int = 20) -> dict:
+          """
+          Get one page of the events of the user's organization
+          
+          Args:
+               user: The requesting user
+               page: Page number (1-based)
+               page_size: Number of events per page
+               
+          Returns:
+               dict: Serialized events and pagination info
+          """
           try:
-               events = Event.objects.filter(created_by__organization = user.organization)
+               events = EventService._with_event_relations(
+                    Event.objects.filter(created_by__organization = user.organization)
+               ).order_by('-start_datetime', '-id')
                
-               return EventSerializer(events, many=True).data
+               start = (page - 1) * page_size
+               end = start + page_size
+               total_count = events.count()
+               
+               return {
+                    'events': EventSerializer(events[start:end], many=True).data,
+                    'pagination': {
+                         'total_count': total_count,
+                         'page': page,
+                         'page_size': page_size,
+                         'has_next': end < total_count,
+                         'has_previous': page > 1
+                    }
+               }
           except:
                raise ValidationError("Something went wrong in getting events list.")
      
+     @staticmethod
+     def get_event_stats_for_organization(user, event_ids: list) -> list:
+          """
+          Get registration and invitation statistics for many events at once
+          
+          Args:
+               user: The requesting user (only events of their organization are returned)
+               event_ids: IDs of the events
+               
+          Returns:
+               list: Statistics per event, a fixed number of queries regardless of the number of events
+               
+          Raises:
+               ValidationError: If the IDs are missing, malformed or too many
+          """
+          from services.attendee.attendee_service import AttendeeService
+          from services.attendee.attendee_invitation_service import AttendeeInvitationService
+          
+          if not event_ids:
+               raise ValidationError("event_ids is required.")
+          
+          if len(event_ids) > EventService.MAX_STATS_EVENTS:
+               raise ValidationError(f"At most {EventService.MAX_STATS_EVENTS} events can be requested at once.")
+          
+          try:
+               event_ids = [int(event_id) for event_id in event_ids]
+          except (TypeError, ValueError):
+               raise ValidationError("event_ids must be a comma separated list of integers.")
+          
+          allowed_ids = list(
+               Event.objects.filter(
+                    id__in=event_ids,
+                    created_by__organization=user.organization
+               ).values_list('id', flat=True)
+          )
+          
+          registration_stats = AttendeeService.get_registration_stats_for_events(allowed_ids)
+          invitation_stats = AttendeeInvitationService.get_invitation_stats_for_events(allowed_ids)
+          
+          return [
+               {
+                    'event_id': event_id,
+                    'registrations': registration_stats[event_id],
+                    'invitations': invitation_stats[event_id]
+               }
+               for event_id in event_ids if event_id in registration_stats
+          ]
+     
      @staticmethod
      def get_event_details_by_id(event_id):
           try:
-               event = get_object_or_404(Event, id=event_id)
+               event = get_object_or_404(EventService._with_event_relations(Event.objects.all()), id=event_id)
                
                return EventSerializer(event).data
           except:
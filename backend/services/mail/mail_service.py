@@ -1,8 +1,12 @@
+import logging
 from django.conf import settings
-from django.core.mail import send_mail as django_send_mail
+from django.core.mail import EmailMessage
 from utils.token.jwt import TokenUtil
 from apps.users.models import VerifyRegisteredUser
-from core.middleware.exception_handler import CustomAPIException
+from services.mail.mail_transport import MailSendError, get_mail_transport
+
+logger = logging.getLogger(__name__)
+
 
 class MailService:
      @staticmethod
@@ -36,20 +40,38 @@ class MailService:
      
      @staticmethod
      def _send_mail(subject, message, recipient_list):
-          """ Sending email with no template design using django 
-          email backend.
+          """ Sending email with no template design through the
+          configured mail transport (MAIL_TRANSPORT).
           Args:
           subject 
           message
           recipient_list
+          Raises:
+          MailSendError: with the transport's error if the email wasn't sent
           """
           try:
-               django_send_mail(
-                    subject,
-                    message,
-                    from_email=settings.EMAIL_FROM,
-                    recipient_list=recipient_list
-               )
+               error = get_mail_transport().send_messages([
+                    EmailMessage(subject, message, from_email=settings.EMAIL_FROM, to=recipient_list)
+               ])[0]
           except Exception as e:
-               print(f"Error sending mail {str(e)}")
-               raise CustomAPIException(detail="Error Sending Email")
\ No newline at end of file
+               logger.error(f"Error sending mail: {str(e)}")
+               error = str(e)
+          
+          # The transport already logged the error of the message itself
+          if error is not None:
+               raise MailSendError(error)
+
+     @staticmethod
+     def _send_mass_mail(messages):
+          """ Sending many emails while reusing mail connections.
+          The transport (MAIL_TRANSPORT) carries up to MAIL_BATCH_SIZE messages
+          over one connection instead of one connection per email.
+          Args:
+          messages: list of (subject, message, recipient_list) tuples
+          Returns:
+          list of None (sent) or error string, in the order of messages
+          """
+          return get_mail_transport().send_messages([
+               EmailMessage(subject, message, from_email=settings.EMAIL_FROM, to=recipient_list)
+               for subject, message, recipient_list in messages
+          ])
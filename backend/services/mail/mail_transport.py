@@ -0,0 +1,386 @@
+import logging
+import smtplib
+import socketserver
+import threading
+import time
+from abc import ABC, abstractmethod
+from django.conf import settings
+from django.core.mail import get_connection
+from core.middleware.exception_handler import CustomAPIException
+
+logger = logging.getLogger(__name__)
+
+
+class MailTransportError(Exception):
+     """Raised when a transport can't provide a mail connection"""
+
+
+class MailSendError(CustomAPIException):
+     """
+     Raised when an email could not be sent
+
+     API clients get the generic detail; str() and error carry the transport's
+     error so callers can record why delivery failed.
+     """
+     default_detail = 'Error Sending Email'
+
+     def __init__(self, error):
+          super().__init__()
+          self.error = error
+
+     def __str__(self):
+          return self.error
+
+
+class MailTransport(ABC):
+     """
+     Base class of the transports MailService sends through
+
+     send_messages never raises for a single failed message; it reports the error
+     in the position of that message so callers can attribute it to its recipient.
+     """
+
+     def __init__(self):
+          self._stats_lock = threading.Lock()
+          self.stats = {'connections': 0, 'sent': 0, 'failed': 0}
+
+     @abstractmethod
+     def send_messages(self, messages: list) -> list:
+          """
+          Send email messages
+
+          Args:
+               messages: List of EmailMessage objects
+
+          Returns:
+               list: None (sent) or error string per message, in order
+          """
+
+     def close(self) -> None:
+          """Close every connection held by the transport"""
+
+     def _count(self, key: str, value: int = 1) -> None:
+          with self._stats_lock:
+               self.stats[key] += value
+
+
+class BackendMailTransport(MailTransport):
+     """
+     Sends through settings.EMAIL_BACKEND
+
+     One connection carries up to MAIL_BATCH_SIZE messages (SMTP servers limit
+     messages per session) and is closed afterwards.
+     """
+
+     def __init__(self, batch_size: int = None):
+          super().__init__()
+          self.batch_size = batch_size or settings.MAIL_BATCH_SIZE
+
+     def send_messages(self, messages: list) -> list:
+          results = []
+
+          for start in range(0, len(messages), self.batch_size):
+               batch = messages[start:start + self.batch_size]
+               connection = get_connection()
+
+               try:
+                    connection.open()
+                    self._count('connections')
+               except Exception as e:
+                    logger.error(f"Error opening mail connection: {str(e)}")
+                    results.extend([str(e)] * len(batch))
+                    self._count('failed', len(batch))
+                    continue
+
+               try:
+                    for email_message in batch:
+                         try:
+                              # One message per call so a failure is attributed to its recipient only
+                              connection.send_messages([email_message])
+                              results.append(None)
+                              self._count('sent')
+                         except Exception as e:
+                              logger.error(f"Error sending mail: {str(e)}")
+                              results.append(str(e))
+                              self._count('failed')
+               finally:
+                    connection.close()
+
+          return results
+
+
+class _PooledConnection:
+     def __init__(self, backend):
+          self.backend = backend
+          self.sent = 0
+          self.last_used = time.monotonic()
+
+
+class PooledSMTPTransport(MailTransport):
+     """
+     Keeps a bounded pool of long-lived SMTP connections
+
+     At most pool_size connections exist at once; senders wait up to
+     acquire_timeout seconds for a free one. A connection idle for longer than
+     health_check_interval is checked with NOOP before reuse and replaced when the
+     server dropped it. Connections are recycled after max_messages messages, and
+     every SMTP operation is bounded by the socket timeout.
+     """
+
+     def __init__(
+          self,
+          host: str = None,
+          port: int = None,
+          username: str = None,
+          password: str = None,
+          use_tls: bool = None,
+          pool_size: int = None,
+          timeout: float = None,
+          acquire_timeout: float = None,
+          health_check_interval: float = None,
+          max_messages: int = None
+     ):
+          super().__init__()
+          self.host = host if host is not None else settings.EMAIL_HOST
+          self.port = int(port if port is not None else settings.EMAIL_PORT)
+          self.username = username if username is not None else settings.EMAIL_HOST_USER
+          self.password = password if password is not None else settings.EMAIL_HOST_PASSWORD
+          self.use_tls = use_tls if use_tls is not None else settings.EMAIL_USE_TLS
+          self.pool_size = pool_size or settings.MAIL_POOL_SIZE
+          self.timeout = timeout or settings.MAIL_SEND_TIMEOUT
+          self.acquire_timeout = acquire_timeout or settings.MAIL_POOL_ACQUIRE_TIMEOUT
+          self.health_check_interval = (
+               health_check_interval if health_check_interval is not None else settings.MAIL_POOL_HEALTH_CHECK_INTERVAL
+          )
+          self.max_messages = max_messages or settings.MAIL_BATCH_SIZE
+
+          self._slots = threading.BoundedSemaphore(self.pool_size)
+          self._idle_lock = threading.Lock()
+          self._idle = []
+
+     def send_messages(self, messages: list) -> list:
+          results = []
+          pooled = None
+
+          try:
+               for index, email_message in enumerate(messages):
+                    if pooled is None:
+                         try:
+                              pooled = self._acquire()
+                         except Exception as e:
+                              # Pool exhausted or server down: the remaining messages would each
+                              # wait out the same timeout, so fail them all now
+                              error = MailSendError(str(e))
+                              logger.error(f"Error opening mail connection: {error}")
+                              remaining = len(messages) - index
+                              results.extend([str(error)] * remaining)
+                              self._count('failed', remaining)
+                              break
+
+                    try:
+                         pooled.backend.send_messages([email_message])
+                    except Exception as e:
+                         logger.error(f"Error sending mail: {str(e)}")
+                         results.append(str(e))
+                         self._count('failed')
+
+                         # A refused message leaves the session usable; anything else doesn't
+                         if not isinstance(e, (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused)):
+                              self._release(pooled, broken=True)
+                              pooled = None
+                         continue
+
+                    results.append(None)
+                    self._count('sent')
+                    pooled.sent += 1
+
+                    if pooled.sent >= self.max_messages:
+                         self._release(pooled, broken=True)
+                         pooled = None
+          finally:
+               if pooled is not None:
+                    self._release(pooled)
+
+          return results
+
+     def close(self) -> None:
+          with self._idle_lock:
+               idle, self._idle = self._idle, []
+
+          for pooled in idle:
+               pooled.backend.close()
+
+     def _acquire(self) -> _PooledConnection:
+          if not self._slots.acquire(timeout=self.acquire_timeout):
+               raise MailTransportError(f"No mail connection free after {self.acquire_timeout} seconds")
+
+          try:
+               while True:
+                    with self._idle_lock:
+                         pooled = self._idle.pop() if self._idle else None
+
+                    if pooled is None:
+                         return self._open()
+
+                    if self._is_healthy(pooled):
+                         return pooled
+
+                    pooled.backend.close()
+          except Exception:
+               self._slots.release()
+               raise
+
+     def _release(self, pooled: _PooledConnection, broken: bool = False) -> None:
+          if broken:
+               pooled.backend.close()
+          else:
+               pooled.last_used = time.monotonic()
+               with self._idle_lock:
+                    self._idle.append(pooled)
+
+          self._slots.release()
+
+     def _open(self) -> _PooledConnection:
+          backend = get_connection(
+               'django.core.mail.backends.smtp.EmailBackend',
+               host=self.host,
+               port=self.port,
+               username=self.username,
+               password=self.password,
+               use_tls=self.use_tls,
+               timeout=self.timeout
+          )
+          backend.open()
+          self._count('connections')
+
+          return _PooledConnection(backend)
+
+     def _is_healthy(self, pooled: _PooledConnection) -> bool:
+          if time.monotonic() - pooled.last_used < self.health_check_interval:
+               return True
+
+          try:
+               return pooled.backend.connection.noop()[0] == 250
+          except Exception:
+               return False
+
+
+class _StubSMTPHandler(socketserver.StreamRequestHandler):
+     """Speaks just enough SMTP for smtplib; accepts and discards every message"""
+
+     def handle(self):
+          self._reply('220 stub ESMTP ready')
+
+          while True:
+               line = self.rfile.readline()
+               if not line:
+                    return
+
+               verb = line.decode('utf-8', 'replace').strip()[:4].upper()
+
+               if verb == 'EHLO':
+                    self._reply('250-stub', '250 8BITMIME')
+               elif verb in ('HELO', 'MAIL', 'RCPT', 'RSET', 'NOOP'):
+                    self._reply('250 OK')
+               elif verb == 'DATA':
+                    self._reply('354 End data with <CR><LF>.<CR><LF>')
+                    while True:
+                         data = self.rfile.readline()
+                         if not data:
+                              return
+                         if data in (b'.\r\n', b'.\n'):
+                              break
+                    self.server.accept_message()
+                    self._reply('250 OK')
+               elif verb == 'QUIT':
+                    self._reply('221 Bye')
+                    return
+               else:
+                    self._reply('502 Command not implemented')
+
+     def _reply(self, *lines):
+          self.wfile.write(''.join(f"{line}\r\n" for line in lines).encode())
+
+
+class StubSMTPServer(socketserver.ThreadingTCPServer):
+     """
+     In-process SMTP server for load tests
+
+     Listens on a free local port, waits latency seconds per message to imitate a
+     real server and only counts what it receives.
+     """
+
+     daemon_threads = True
+     block_on_close = False
+     allow_reuse_address = True
+
+     def __init__(self, host: str = '127.0.0.1', port: int = 0, latency: float = 0):
+          super().__init__((host, port), _StubSMTPHandler)
+          self.latency = latency
+          self.message_count = 0
+          self._count_lock = threading.Lock()
+          self._thread = None
+
+     @property
+     def port(self) -> int:
+          return self.server_address[1]
+
+     def accept_message(self) -> None:
+          if self.latency:
+               time.sleep(self.latency)
+
+          with self._count_lock:
+               self.message_count += 1
+
+     def start(self) -> 'StubSMTPServer':
+          self._thread = threading.Thread(target=self.serve_forever, name='stub-smtp', daemon=True)
+          self._thread.start()
+          return self
+
+     def stop(self) -> None:
+          self.shutdown()
+          self.server_close()
+
+
+class StubSMTPTransport(PooledSMTPTransport):
+     """Pooled SMTP transport connected to its own in-process StubSMTPServer"""
+
+     def __init__(self, latency: float = None, **kwargs):
+          self.server = StubSMTPServer(
+               latency=latency if latency is not None else settings.MAIL_STUB_LATENCY
+          ).start()
+          super().__init__(
+               host='127.0.0.1',
+               port=self.server.port,
+               username='',
+               password='',
+               use_tls=False,
+               **kwargs
+          )
+
+     def close(self) -> None:
+          super().close()
+          self.server.stop()
+
+
+TRANSPORTS = {
+     'backend': BackendMailTransport,
+     'smtp_pool': PooledSMTPTransport,
+     'stub': StubSMTPTransport,
+}
+
+_transport_lock = threading.Lock()
+_transports = {}
+
+
+def get_mail_transport() -> MailTransport:
+     """Get the process-wide transport selected by settings.MAIL_TRANSPORT"""
+     name = settings.MAIL_TRANSPORT
+
+     with _transport_lock:
+          if name not in _transports:
+               if name not in TRANSPORTS:
+                    raise MailTransportError(f"Unknown MAIL_TRANSPORT '{name}'. Choose one of: {', '.join(TRANSPORTS)}.")
+               _transports[name] = TRANSPORTS[name]()
+
+          return _transports[name]
@@ -0,0 +1,132 @@
+import logging
+from datetime import datetime, timedelta
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Min
+from django.utils import timezone
+from apps.notifications.models import Notification, NotificationStatus, NotificationType
+from services.notification.notification_service import NotificationService
+from services.notification.notification_delivery_service import NotificationDeliveryService
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationDigestService:
+     """
+     Combines buffered notifications into one message per recipient and channel
+
+     Notifications sent with digest=True are stored as BUFFERED. Once the oldest
+     buffered notification of a recipient is NOTIFICATION_DIGEST_WINDOW seconds
+     old, all of that recipient's buffered notifications on the channel are sent
+     as one DIGEST notification and linked to it (status DIGESTED).
+     """
+
+     @staticmethod
+     def flush_due(window: int = None, now: datetime = None) -> dict:
+          """
+          Send the digests whose window has elapsed
+
+          Args:
+               window: Seconds to buffer (default NOTIFICATION_DIGEST_WINDOW)
+               now: Reference time (defaults to now)
+
+          Returns:
+               dict: Number of messages queued (digests, or the original when a recipient
+                    had a single buffered notification) and of buffered notifications they carry
+          """
+          window = window if window is not None else settings.NOTIFICATION_DIGEST_WINDOW
+          cutoff = (now or timezone.now()) - timedelta(seconds=window)
+          result = {'messages': 0, 'notifications': 0}
+
+          groups = (
+               Notification.objects.filter(status=NotificationStatus.BUFFERED)
+               .values('recipient_email', 'channel')
+               .annotate(oldest=Min('created_at'))
+               .filter(oldest__lte=cutoff)
+               .order_by('oldest')
+          )
+
+          for group in groups:
+               try:
+                    flushed = NotificationDigestService.flush_recipient(group['recipient_email'], group['channel'])
+               except Exception as e:
+                    logger.error(f"Failed to flush digest for {group['recipient_email']}: {str(e)}")
+                    continue
+
+               if flushed:
+                    result['messages'] += 1
+                    result['notifications'] += flushed
+
+          return result
+
+     @staticmethod
+     def flush_recipient(recipient_email: str, channel: str) -> int:
+          """
+          Send all buffered notifications of one recipient and channel now
+
+          Args:
+               recipient_email: Email address of the recipient
+               channel: Notification channel
+
+          Returns:
+               int: Number of buffered notifications that were sent
+          """
+          with transaction.atomic():
+               # Skip rows another flusher is already working on
+               buffered = list(
+                    Notification.objects.filter(
+                         status=NotificationStatus.BUFFERED,
+                         recipient_email=recipient_email,
+                         channel=channel
+                    ).select_for_update(skip_locked=True).order_by('created_at', 'id')
+               )
+
+               if not buffered:
+                    return 0
+
+               if len(buffered) == 1:
+                    # Nothing to combine; send the original as it is
+                    notification = buffered[0]
+                    notification.status = NotificationStatus.PENDING
+                    notification.save(update_fields=['status', 'updated_at'])
+                    NotificationDeliveryService.schedule(notification)
+                    return 1
+
+               digest = NotificationDigestService._create_digest(buffered)
+
+               Notification.objects.filter(id__in=[notification.id for notification in buffered]).update(
+                    status=NotificationStatus.DIGESTED,
+                    digest=digest,
+                    updated_at=timezone.now()
+               )
+
+               NotificationDeliveryService.schedule(digest)
+
+          return len(buffered)
+
+     @staticmethod
+     def _create_digest(buffered: list) -> Notification:
+          first = buffered[0]
+          context = {
+               'count': len(buffered),
+               'since': timezone.localtime(first.created_at).strftime('%B %d, %Y at %I:%M %p'),
+               'items': [
+                    {'subject': notification.subject, 'message': notification.message}
+                    for notification in buffered
+               ]
+          }
+
+          template = NotificationService._get_template(NotificationType.DIGEST, first.channel)
+          subject, message = NotificationService._render_content(template, context, NotificationType.DIGEST, first.channel)
+
+          # Notifications of one recipient may belong to different events, so the digest links none
+          return Notification.objects.create(
+               type=NotificationType.DIGEST,
+               channel=first.channel,
+               recipient_email=first.recipient_email,
+               recipient_user_id=first.recipient_user_id,
+               subject=subject,
+               message=message,
+               metadata={'notification_ids': [notification.id for notification in buffered]},
+               read_at=timezone.now()  # Digests never show in the inbox; their originals do
+          )
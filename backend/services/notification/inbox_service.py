@@ -0,0 +1,133 @@
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from apps.notifications.models import Notification, NotificationType
+from utils.pagination.cursor import CursorUtil
+
+
+class NotificationInboxService:
+     """
+     Service class for the in-app notification inbox of a user
+
+     A notification is unread while read_at is NULL. Only inbox rows (with a
+     recipient user, not a digest) start unread; every other row is created read
+     (see initial_read_at). Rows left unread for NOTIFICATION_UNREAD_DAYS are
+     marked read by archive_notifications, so unread counts, served by a partial
+     index that only holds unread rows, don't grow with the user's history.
+     Digest rows are only a delivery vehicle for their originals and are left
+     out of the inbox.
+     """
+
+     MAX_PAGE_SIZE = 100
+     INBOX_FIELDS = [
+          'id', 'type', 'subject', 'message', 'status', 'sent_at', 'read_at', 'created_at',
+          'event__id', 'event__name', 'organization__id', 'organization__name'
+     ]
+
+     @staticmethod
+     def initial_read_at(recipient_user, notification_type: str):
+          """
+          read_at of a new notification
+
+          Args:
+               recipient_user: Recipient user of the notification (None for plain emails)
+               notification_type: Type of the notification
+
+          Returns:
+               datetime: None for rows that start unread in the inbox, else the current time
+          """
+          if recipient_user is None or notification_type == NotificationType.DIGEST:
+               return timezone.now()
+          return None
+
+     @staticmethod
+     def _inbox_queryset(user):
+          return Notification.objects.filter(recipient_user=user).exclude(type=NotificationType.DIGEST)
+
+     @staticmethod
+     def get_inbox(user, cursor: str = None, page_size: int = 20, unread_only: bool = False) -> dict:
+          """
+          Get one page of a user's notifications, newest first
+
+          Args:
+               user: The recipient user
+               cursor: Cursor returned by the previous page (optional)
+               page_size: Number of notifications per page (max 100)
+               unread_only: Only return unread notifications
+
+          Returns:
+               dict: Notifications, unread count and pagination info
+
+          Raises:
+               ValidationError: If the cursor is invalid
+          """
+          page_size = min(page_size, NotificationInboxService.MAX_PAGE_SIZE)
+          queryset = NotificationInboxService._inbox_queryset(user)
+
+          if unread_only:
+               queryset = queryset.filter(read_at__isnull=True)
+
+          notifications, next_cursor = CursorUtil.paginate(
+               queryset.select_related('event', 'organization').only(*NotificationInboxService.INBOX_FIELDS),
+               ordering=['-created_at', '-id'],
+               cursor=cursor,
+               page_size=page_size
+          )
+
+          return {
+               'notifications': [NotificationInboxService._serialize(notification) for notification in notifications],
+               'unread_count': NotificationInboxService.get_unread_count(user),
+               'pagination': {
+                    'page_size': page_size,
+                    'next_cursor': next_cursor,
+                    'has_next': next_cursor is not None
+               }
+          }
+
+     @staticmethod
+     def get_unread_count(user) -> int:
+          """Number of unread notifications of a user (served by the partial unread index)"""
+          return NotificationInboxService._inbox_queryset(user).filter(read_at__isnull=True).count()
+
+     @staticmethod
+     def mark_read(user, notification_ids: list = None, mark_all: bool = False) -> int:
+          """
+          Mark notifications of a user as read
+
+          Args:
+               user: The recipient user
+               notification_ids: IDs of the notifications to mark
+               mark_all: Mark every unread notification instead
+
+          Returns:
+               int: Number of notifications that were unread
+
+          Raises:
+               ValidationError: If neither ids nor mark_all are given
+          """
+          queryset = NotificationInboxService._inbox_queryset(user).filter(read_at__isnull=True)
+
+          if not mark_all:
+               if not notification_ids or not all(isinstance(notification_id, int) for notification_id in notification_ids):
+                    raise ValidationError("Provide a list of notification ids or set all to true.")
+               queryset = queryset.filter(id__in=notification_ids)
+
+          now = timezone.now()
+          return queryset.update(read_at=now, updated_at=now)
+
+     @staticmethod
+     def _serialize(notification: Notification) -> dict:
+          message = notification.message
+          return {
+               'id': notification.id,
+               'type': notification.get_type_display(),
+               'subject': notification.subject,
+               'message': message[:100] + '...' if len(message) > 100 else message,
+               'status': notification.get_status_display(),
+               'is_read': notification.read_at is not None,
+               'read_at': notification.read_at,
+               'sent_at': notification.sent_at,
+               'created_at': notification.created_at,
+               'event_id': notification.event.id if notification.event else None,
+               'event_name': notification.event.name if notification.event else None,
+               'organization_name': notification.organization.name if notification.organization else None
+          }
@@ -0,0 +1,366 @@
+import time
+import random
+import logging
+from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+from apps.notifications.models import Notification, NotificationChannel, NotificationStatus
+from services.mail.mail_service import MailService
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationDeliveryService:
+     """
+     Delivery side of the notification outbox
+
+     NotificationService.send_notification stores every notification as a PENDING
+     row in the caller's transaction. Depending on NOTIFICATION_DELIVERY_BACKEND the
+     row is then delivered in-process after commit ('sync'), by a Celery task queued
+     after commit ('celery'), or by the run_notification_worker command polling the
+     table ('database'). Every path claims the row (PENDING -> PROCESSING) first, so
+     a notification is sent at most once even when several paths race.
+
+     A failed delivery is retried with exponential backoff: the row stays FAILED
+     with next_retry_at set, and the worker (or the retry sweeper) claims it again
+     once that time has passed. After NOTIFICATION_MAX_ATTEMPTS it is moved to
+     DEAD_LETTER and left for manual inspection.
+     """
+
+     BACKEND_SYNC = 'sync'
+     BACKEND_DATABASE = 'database'
+     BACKEND_CELERY = 'celery'
+
+     # Channels with a sender; SMS rows stay PENDING until one exists
+     DELIVERABLE_CHANNELS = [NotificationChannel.EMAIL, NotificationChannel.WEBSOCKET]
+
+     @staticmethod
+     def schedule(notification: Notification) -> None:
+          """
+          Schedule delivery of a PENDING notification once the current transaction commits
+
+          Args:
+               notification: The notification to deliver
+          """
+          backend = settings.NOTIFICATION_DELIVERY_BACKEND
+          notification_id = notification.id
+
+          if backend == NotificationDeliveryService.BACKEND_SYNC:
+               transaction.on_commit(lambda: NotificationDeliveryService.deliver_notification(notification_id))
+          elif backend == NotificationDeliveryService.BACKEND_CELERY:
+               from apps.notifications.tasks import deliver_notification
+               transaction.on_commit(lambda: deliver_notification.delay(notification_id))
+          # 'database': the worker picks the committed row up on its next poll
+
+     @staticmethod
+     def schedule_many(notification_ids: list) -> None:
+          """
+          Schedule delivery of many PENDING notifications once the current transaction commits
+
+          Args:
+               notification_ids: IDs of the notifications to deliver
+          """
+          backend = settings.NOTIFICATION_DELIVERY_BACKEND
+          batch_size = settings.NOTIFICATION_WORKER_BATCH_SIZE
+
+          if backend == NotificationDeliveryService.BACKEND_SYNC:
+               # Threads only pay off for sends larger than one worker batch
+               concurrency = settings.NOTIFICATION_SYNC_CONCURRENCY if len(notification_ids) > batch_size else 1
+               transaction.on_commit(
+                    lambda: NotificationDeliveryService.deliver_many(notification_ids, concurrency=concurrency)
+               )
+          elif backend == NotificationDeliveryService.BACKEND_CELERY:
+               from apps.notifications.tasks import deliver_notification_batch
+
+               def enqueue():
+                    for start in range(0, len(notification_ids), batch_size):
+                         deliver_notification_batch.delay(notification_ids[start:start + batch_size])
+
+               transaction.on_commit(enqueue)
+
+     @staticmethod
+     def deliver_many(notification_ids: list, concurrency: int = 1) -> int:
+          """
+          Claim and deliver many notifications, reusing mail connections
+
+          Args:
+               notification_ids: IDs of the notifications
+               concurrency: Number of parallel deliveries
+
+          Returns:
+               int: Number of notifications this call delivered (others were already claimed)
+          """
+          claimed_ids = NotificationDeliveryService.claim_batch(len(notification_ids), notification_ids=notification_ids)
+          NotificationDeliveryService._deliver_claimed_parallel(claimed_ids, concurrency)
+          return len(claimed_ids)
+
+     @staticmethod
+     def deliver_notification(notification_id: int) -> bool:
+          """
+          Claim and deliver one notification
+
+          Args:
+               notification_id: The ID of the notification
+
+          Returns:
+               bool: True if this call delivered it, False if it was already claimed
+          """
+          claimed = Notification.objects.filter(
+               pk=notification_id,
+               status=NotificationStatus.PENDING
+          ).update(status=NotificationStatus.PROCESSING, updated_at=timezone.now())
+
+          if not claimed:
+               return False
+
+          NotificationDeliveryService._deliver(Notification.objects.get(pk=notification_id))
+          return True
+
+     @staticmethod
+     def claim_batch(batch_size: int, notification_ids: list = None, retries_only: bool = False) -> list:
+          """
+          Claim a batch of notifications for this worker
+
+          Rows stuck in PROCESSING longer than NOTIFICATION_PROCESSING_TIMEOUT
+          (e.g. the worker died mid-send) and FAILED rows whose retry is due are
+          claimed again. Locked rows are skipped, so several workers can claim in
+          parallel without waiting on each other.
+
+          Args:
+               batch_size: Maximum number of notifications to claim
+               notification_ids: Only claim among these notifications
+               retries_only: Only claim FAILED rows whose retry is due
+
+          Returns:
+               list: IDs of the claimed notifications
+          """
+          now = timezone.now()
+          stale_before = now - timedelta(seconds=settings.NOTIFICATION_PROCESSING_TIMEOUT)
+          due_retries = Q(status=NotificationStatus.FAILED, next_retry_at__lte=now)
+
+          if retries_only:
+               claimable = due_retries
+          else:
+               claimable = (
+                    Q(status=NotificationStatus.PENDING) |
+                    Q(status=NotificationStatus.PROCESSING, updated_at__lt=stale_before) |
+                    due_retries
+               )
+
+          queryset = Notification.objects.filter(claimable, channel__in=NotificationDeliveryService.DELIVERABLE_CHANNELS)
+          if notification_ids is not None:
+               queryset = queryset.filter(id__in=notification_ids)
+
+          with transaction.atomic():
+               notification_ids = list(
+                    queryset
+                    .select_for_update(skip_locked=True)
+                    .order_by('created_at')
+                    .values_list('id', flat=True)[:batch_size]
+               )
+
+               Notification.objects.filter(id__in=notification_ids).update(
+                    status=NotificationStatus.PROCESSING,
+                    updated_at=timezone.now()
+               )
+
+          return notification_ids
+
+     @staticmethod
+     def process_batch(batch_size: int, concurrency: int = 1, retries_only: bool = False) -> int:
+          """
+          Claim one batch and deliver it with a pool of threads
+
+          Args:
+               batch_size: Maximum number of notifications to claim
+               concurrency: Number of parallel deliveries
+               retries_only: Only claim FAILED rows whose retry is due
+
+          Returns:
+               int: Number of claimed notifications
+          """
+          notification_ids = NotificationDeliveryService.claim_batch(batch_size, retries_only=retries_only)
+          NotificationDeliveryService._deliver_claimed_parallel(notification_ids, concurrency)
+          return len(notification_ids)
+
+     @staticmethod
+     def run_worker(concurrency: int = 1, batch_size: int = None, poll_interval: float = None, once: bool = False,
+                    retries_only: bool = False) -> int:
+          """
+          Poll the outbox and deliver notifications until stopped
+
+          Args:
+               concurrency: Number of parallel deliveries
+               batch_size: Notifications claimed per poll (default NOTIFICATION_WORKER_BATCH_SIZE)
+               poll_interval: Seconds to sleep when the outbox is empty (default NOTIFICATION_WORKER_POLL_INTERVAL)
+               once: Drain the outbox and return instead of polling forever
+               retries_only: Only sweep FAILED rows whose retry is due
+
+          Returns:
+               int: Number of processed notifications
+          """
+          batch_size = batch_size or settings.NOTIFICATION_WORKER_BATCH_SIZE
+          poll_interval = poll_interval if poll_interval is not None else settings.NOTIFICATION_WORKER_POLL_INTERVAL
+          processed = 0
+
+          while True:
+               claimed = NotificationDeliveryService.process_batch(batch_size, concurrency, retries_only)
+               processed += claimed
+
+               if claimed:
+                    continue
+               if once:
+                    return processed
+
+               time.sleep(poll_interval)
+
+     @staticmethod
+     def _deliver_claimed_many(notification_ids: list) -> None:
+          try:
+               notifications = list(Notification.objects.filter(id__in=notification_ids).order_by('id'))
+               NotificationDeliveryService._deliver_many(notifications)
+          except Exception as e:
+               logger.error(f"Failed to deliver notifications {notification_ids}: {str(e)}")
+
+     @staticmethod
+     def _deliver_claimed_parallel(notification_ids: list, concurrency: int) -> None:
+          chunks = [chunk for chunk in (notification_ids[index::concurrency] for index in range(concurrency)) if chunk]
+
+          if len(chunks) <= 1:
+               NotificationDeliveryService._deliver_claimed_many(notification_ids)
+               return
+
+          # Each thread delivers its share over its own mail connection
+          with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+               list(executor.map(NotificationDeliveryService._deliver_claimed_in_thread, chunks))
+
+     @staticmethod
+     def _deliver_claimed_in_thread(notification_ids: list) -> None:
+          try:
+               NotificationDeliveryService._deliver_claimed_many(notification_ids)
+          finally:
+               # Each pool thread has its own connection; don't leak it
+               connection.close()
+
+     @staticmethod
+     def _deliver_many(notifications: list) -> None:
+          emails = [notification for notification in notifications if notification.channel == NotificationChannel.EMAIL]
+
+          for notification in notifications:
+               if notification.channel != NotificationChannel.EMAIL:
+                    NotificationDeliveryService._deliver(notification)
+
+          if not emails:
+               return
+
+          errors = MailService._send_mass_mail([
+               (notification.subject, notification.message, [notification.recipient_email])
+               for notification in emails
+          ])
+
+          now = timezone.now()
+          for notification, error in zip(emails, errors):
+               notification.updated_at = now
+               if error is None:
+                    notification.status = NotificationStatus.SENT
+                    notification.sent_at = now
+                    notification.attempts += 1
+                    notification.next_retry_at = None
+               else:
+                    NotificationDeliveryService._apply_failure(notification, error, now)
+
+          Notification.objects.bulk_update(
+               emails, ['status', 'sent_at', 'error_message', 'attempts', 'next_retry_at', 'updated_at']
+          )
+          logger.info(f"Delivered {errors.count(None)} of {len(emails)} emails")
+
+     @staticmethod
+     def record_acknowledgements(user_id: int, delivered_ids: list, read_ids: list) -> int:
+          """
+          Write buffered WebSocket acknowledgements of one user
+
+          Args:
+               user_id: The user that acknowledged (only their notifications are touched)
+               delivered_ids: Notifications the client received
+               read_ids: Notifications the client marked as read (implies delivered)
+
+          Returns:
+               int: Number of updated rows
+          """
+          now = timezone.now()
+          notifications = Notification.objects.filter(recipient_user_id=user_id)
+          updated = 0
+
+          received_ids = set(delivered_ids) | set(read_ids)
+          if received_ids:
+               updated += notifications.filter(
+                    id__in=received_ids,
+                    channel=NotificationChannel.WEBSOCKET,
+                    delivered_at__isnull=True
+               ).update(
+                    status=NotificationStatus.DELIVERED,
+                    delivered_at=now,
+                    updated_at=now
+               )
+
+          if read_ids:
+               updated += notifications.filter(id__in=read_ids, read_at__isnull=True).update(
+                    read_at=now,
+                    updated_at=now
+               )
+
+          return updated
+
+     @staticmethod
+     def mark_failed(notification: Notification, error: str) -> None:
+          """
+          Record a failed delivery attempt and schedule the retry
+
+          Args:
+               notification: The notification that failed
+               error: Error message of the attempt
+          """
+          NotificationDeliveryService._apply_failure(notification, error, timezone.now())
+          notification.save(update_fields=['status', 'error_message', 'attempts', 'next_retry_at', 'updated_at'])
+
+     @staticmethod
+     def get_retry_delay(attempts: int) -> float:
+          """
+          Seconds to wait before the next attempt after `attempts` failed ones
+
+          Exponential backoff capped at NOTIFICATION_RETRY_BACKOFF_MAX, with up to
+          10% jitter so rows that failed together (e.g. an SMTP outage) don't all
+          retry in the same second.
+          """
+          delay = min(
+               settings.NOTIFICATION_RETRY_BACKOFF * (2 ** (attempts - 1)),
+               settings.NOTIFICATION_RETRY_BACKOFF_MAX
+          )
+          return delay + random.uniform(0, delay * 0.1)
+
+     @staticmethod
+     def _apply_failure(notification: Notification, error: str, now) -> None:
+          notification.attempts += 1
+          notification.error_message = error
+
+          if notification.attempts >= settings.NOTIFICATION_MAX_ATTEMPTS:
+               notification.status = NotificationStatus.DEAD_LETTER
+               notification.next_retry_at = None
+               logger.error(f"Notification {notification.id} dead-lettered after {notification.attempts} attempts: {error}")
+          else:
+               notification.status = NotificationStatus.FAILED
+               notification.next_retry_at = now + timedelta(
+                    seconds=NotificationDeliveryService.get_retry_delay(notification.attempts)
+               )
+
+     @staticmethod
+     def _deliver(notification: Notification) -> None:
+          from services.notification.notification_service import NotificationService
+
+          if notification.channel == NotificationChannel.EMAIL:
+               NotificationService._send_email_notification(notification)
+          elif notification.channel == NotificationChannel.WEBSOCKET:
+               NotificationService._send_websocket_notification(notification)
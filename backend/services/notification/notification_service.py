@@ -1,13 +1,20 @@
-from django.template import Template, Context
+import hashlib
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.db import IntegrityError, transaction
+from django.template import Context
 from django.utils import timezone
 from django.conf import settings
-from typing import Dict, Any
+from typing import Dict, Any, List
 import logging
 from apps.notifications.models import (
     Notification, NotificationTemplate, NotificationType, 
     NotificationChannel, NotificationStatus
 )
 from services.mail.mail_service import MailService
+from services.notification.inbox_service import NotificationInboxService
+from services.notification.notification_delivery_service import NotificationDeliveryService
+from services.notification.template_cache_service import NotificationTemplateCacheService, CompiledNotificationTemplate
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +25,8 @@ class NotificationService:
      and can be extended for WebSocket notifications later
      """
      
+     BULK_CREATE_BATCH_SIZE = 500
+     
      @staticmethod
      def send_notification(
           notification_type: str,
@@ -27,10 +36,16 @@ class NotificationService:
           event=None,
           organization=None,
           invitation=None,
-          channel: str = NotificationChannel.EMAIL
+          channel: str = NotificationChannel.EMAIL,
+          dedupe_bucket: str = None,
+          digest: bool = None
      ) -> Notification:
           """
-          Send a notification through the specified channel
+          Queue a notification for delivery through the specified channel
+          
+          The notification is stored as PENDING in the caller's transaction and
+          delivered after commit (see NotificationDeliveryService), so no mail
+          server round trip happens while a transaction or request is held open.
           
           Args:
                notification_type: Type of notification from NotificationType
@@ -41,12 +56,22 @@ class NotificationService:
                organization: Related organization (optional)
                invitation: Related invitation (optional)
                channel: Notification channel (default: email)
+               dedupe_bucket: Send at most once per type, event, recipient and bucket (optional)
+               digest: Buffer the notification and send it combined with the recipient's other
+                    buffered notifications (default: type listed in NOTIFICATION_DIGEST_TYPES)
                
           Returns:
-               Notification: Created notification instance
+               Notification: Created notification instance, or the existing one for a duplicate
           """
+          if digest is None:
+               digest = notification_type in settings.NOTIFICATION_DIGEST_TYPES
+          
+          dedupe_key = None
+          if dedupe_bucket is not None:
+               dedupe_key = NotificationService.build_dedupe_key(notification_type, event, recipient_email, dedupe_bucket)
+          
           try:
-               # Get or create template
+               # Get the compiled template (parsed once per process)
                template = NotificationService._get_template(notification_type, channel)
                
                # Render content
@@ -54,26 +79,35 @@ class NotificationService:
                     template, context, notification_type, channel
                )
                
-               # Create notification record
-               notification = Notification.objects.create(
-                    type=notification_type,
-                    channel=channel,
-                    recipient_email=recipient_email,
-                    recipient_user=recipient_user,
-                    subject=subject,
-                    message=message,
-                    event=event,
-                    organization=organization,
-                    invitation=invitation,
-                    metadata=context
-               )
+               # Create notification record (the unique dedupe key rejects duplicates)
+               try:
+                    with transaction.atomic():
+                         notification = Notification.objects.create(
+                              type=notification_type,
+                              channel=channel,
+                              recipient_email=recipient_email,
+                              recipient_user=recipient_user,
+                              subject=subject,
+                              message=message,
+                              event=event,
+                              organization=organization,
+                              invitation=invitation,
+                              metadata=context,
+                              dedupe_key=dedupe_key,
+                              status=NotificationStatus.BUFFERED if digest else NotificationStatus.PENDING,
+                              read_at=NotificationInboxService.initial_read_at(recipient_user, notification_type)
+                         )
+               except IntegrityError:
+                    if dedupe_key is None:
+                         raise
+                    return Notification.objects.get(dedupe_key=dedupe_key)
+               
+               # Deliver after commit (in-process, Celery or the outbox worker);
+               # buffered rows wait for NotificationDigestService.flush_due
+               if not digest:
+                    NotificationDeliveryService.schedule(notification)
                
-               # Send notification based on channel
-               if channel == NotificationChannel.EMAIL:
-                    NotificationService._send_email_notification(notification)
-               elif channel == NotificationChannel.WEBSOCKET:
-                    # Future WebSocket implementation
-                    NotificationService._send_websocket_notification(notification)
+               NotificationService.push_to_inbox([notification])
                
                return notification
                
@@ -92,45 +126,200 @@ class NotificationService:
                     event=event,
                     organization=organization,
                     invitation=invitation,
-                    metadata=context
+                    metadata=context,
+                    read_at=NotificationInboxService.initial_read_at(recipient_user, notification_type)
                )
                return notification
      
      @staticmethod
-     def _get_template(notification_type: str, channel: str) -> NotificationTemplate:
-          """Get or create notification template"""
-          template, created = NotificationTemplate.objects.get_or_create(
-               type=notification_type,
-               channel=channel,
-               defaults=NotificationService._get_default_template_content(notification_type, channel)
+     def send_bulk_notifications(
+          notification_type: str,
+          recipients: List[Dict[str, Any]],
+          shared_context: Dict[str, Any],
+          event=None,
+          organization=None,
+          channel: str = NotificationChannel.EMAIL,
+          dedupe_bucket: str = None,
+          digest: bool = None
+     ) -> Dict[str, Any]:
+          """
+          Queue one notification type for many recipients at once
+          
+          The template is fetched once, all rows are inserted with bulk_create and
+          delivery is scheduled as batches that share mail connections, instead of
+          one INSERT and one SMTP connection per recipient.
+          
+          Args:
+               notification_type: Type of notification from NotificationType
+               recipients: List of dicts with 'email', optional 'user' and optional
+                    'context' (merged over shared_context for that recipient)
+               shared_context: Context data common to every recipient
+               event: Related event (optional)
+               organization: Related organization (optional)
+               channel: Notification channel (default: email)
+               dedupe_bucket: Send at most once per type, event, recipient and bucket (optional).
+                    Rows that already exist are skipped on insert and reported with their current status.
+               digest: Buffer the notifications for each recipient's digest (default: type listed in
+                    NOTIFICATION_DIGEST_TYPES)
+               
+          Returns:
+               dict: Totals and per-recipient notification id and status
+          """
+          if not recipients:
+               return {'total': 0, 'queued': 0, 'sent': 0, 'failed': 0, 'recipients': []}
+          
+          if digest is None:
+               digest = notification_type in settings.NOTIFICATION_DIGEST_TYPES
+          
+          try:
+               template = NotificationService._get_template(notification_type, channel)
+          except Exception as e:
+               logger.error(f"Failed to load template {notification_type}: {str(e)}")
+               template = None
+          
+          django_context = Context(shared_context)
+          notifications = []
+          
+          for recipient in recipients:
+               recipient_context = recipient.get('context', {})
+               metadata = {**shared_context, **recipient_context}
+               notification = Notification(
+                    type=notification_type,
+                    channel=channel,
+                    recipient_email=recipient['email'],
+                    recipient_user=recipient.get('user'),
+                    event=event,
+                    organization=organization,
+                    metadata=metadata,
+                    status=NotificationStatus.BUFFERED if digest else NotificationStatus.PENDING,
+                    read_at=NotificationInboxService.initial_read_at(recipient.get('user'), notification_type)
+               )
+               
+               # Rows that failed to render carry no key, so a later send can still succeed
+               if dedupe_bucket is not None and template is not None:
+                    notification.dedupe_key = NotificationService.build_dedupe_key(
+                         notification_type, event, recipient['email'], dedupe_bucket
+                    )
+               
+               if template is None:
+                    notification.subject = notification.message = "Failed to generate"
+                    notification.status = NotificationStatus.FAILED
+                    notification.error_message = f"Template for {notification_type} could not be loaded"
+               else:
+                    # Shared values are resolved once; each recipient only pushes its own keys
+                    with django_context.push(recipient_context):
+                         notification.subject, notification.message = NotificationService._render_compiled(
+                              template, django_context, metadata, notification_type
+                         )
+               
+               notifications.append(notification)
+          
+          if dedupe_bucket is None or template is None:
+               notifications = Notification.objects.bulk_create(notifications, batch_size=NotificationService.BULK_CREATE_BATCH_SIZE)
+          else:
+               notifications = NotificationService._bulk_create_deduplicated(notifications)
+          
+          # Buffered rows wait for NotificationDigestService.flush_due
+          pending = [n for n in notifications if n.status == NotificationStatus.PENDING]
+          NotificationDeliveryService.schedule_many([n.id for n in pending])
+          NotificationService.push_to_inbox(
+               [n for n in notifications if n.status in (NotificationStatus.PENDING, NotificationStatus.BUFFERED)]
+          )
+          
+          return NotificationService._build_bulk_report(notifications)
+     
+     @staticmethod
+     def _bulk_create_deduplicated(notifications: List[Notification]) -> List[Notification]:
+          """Insert rows skipping dedupe key conflicts, then load the stored row for every key"""
+          Notification.objects.bulk_create(
+               notifications,
+               batch_size=NotificationService.BULK_CREATE_BATCH_SIZE,
+               ignore_conflicts=True
           )
-          return template
+          
+          # ignore_conflicts doesn't return primary keys, so read them back by key
+          stored = Notification.objects.in_bulk(
+               [n.dedupe_key for n in notifications],
+               field_name='dedupe_key'
+          )
+          
+          # Recipients listed twice in one call share one row
+          unique = {}
+          for notification in notifications:
+               unique.setdefault(notification.dedupe_key, stored[notification.dedupe_key])
+          return list(unique.values())
      
      @staticmethod
-     def _render_content(template: NotificationTemplate, context: Dict[str, Any], 
+     def build_dedupe_key(notification_type: str, event, recipient_email: str, bucket: str) -> str:
+          """
+          Build the unique key of a notification that must be sent only once
+          
+          Args:
+               notification_type: Type of notification from NotificationType
+               event: Related event or None
+               recipient_email: Email address of the recipient
+               bucket: Distinguishes legitimate repeats (e.g. the event start time for reminders)
+               
+          Returns:
+               str: Hex digest stored in Notification.dedupe_key
+          """
+          event_id = event.id if event is not None else ''
+          raw = f"{notification_type}|{event_id}|{recipient_email.strip().lower()}|{bucket}"
+          return hashlib.sha256(raw.encode()).hexdigest()
+     
+     @staticmethod
+     def _build_bulk_report(notifications: List[Notification]) -> Dict[str, Any]:
+          """Per-recipient status of a bulk send, read back in one query"""
+          statuses = dict(
+               Notification.objects.filter(id__in=[n.id for n in notifications]).values_list('id', 'status')
+          )
+          
+          report = {'total': len(notifications), 'queued': 0, 'sent': 0, 'failed': 0, 'recipients': []}
+          
+          for notification in notifications:
+               status = statuses.get(notification.id, notification.status)
+               
+               if status in (NotificationStatus.SENT, NotificationStatus.DELIVERED):
+                    report['sent'] += 1
+               elif status in (NotificationStatus.FAILED, NotificationStatus.DEAD_LETTER):
+                    report['failed'] += 1
+               else:
+                    report['queued'] += 1
+               
+               report['recipients'].append({
+                    'email': notification.recipient_email,
+                    'notification_id': notification.id,
+                    'status': status
+               })
+          
+          return report
+     
+     @staticmethod
+     def _get_template(notification_type: str, channel: str) -> CompiledNotificationTemplate:
+          """Get or create notification template, compiled and cached per process"""
+          return NotificationTemplateCacheService.get_compiled(
+               notification_type,
+               channel,
+               NotificationService._get_default_template_content
+          )
+     
+     @staticmethod
+     def _render_content(template: CompiledNotificationTemplate, context: Dict[str, Any], 
                          notification_type: str, channel: str) -> tuple:
           """Render notification content using templates"""
+          if channel in (NotificationChannel.EMAIL, NotificationChannel.WEBSOCKET):
+               return NotificationService._render_compiled(template, Context(context), context, notification_type)
+     
+     @staticmethod
+     def _render_compiled(template: CompiledNotificationTemplate, django_context: Context,
+                          context: Dict[str, Any], notification_type: str) -> tuple:
+          """Render subject/title and body/message, falling back to basic content on errors"""
           try:
-               if channel == NotificationChannel.EMAIL:
-                    subject_template = Template(template.subject_template)
-                    body_template = Template(template.body_template)
-                    
-                    django_context = Context(context)
-                    subject = subject_template.render(django_context)
-                    message = body_template.render(django_context)
-                    
-                    return subject, message
-                    
-               elif channel == NotificationChannel.WEBSOCKET:
-                    title_template = Template(template.title_template)
-                    message_template = Template(template.message_template)
-                    
-                    django_context = Context(context)
-                    title = title_template.render(django_context)
-                    message = message_template.render(django_context)
-                    
-                    return title, message
-                    
+               subject = template.subject.render(django_context)
+               message = template.body.render(django_context)
+               
+               return subject, message
+               
           except Exception as e:
                logger.error(f"Template rendering failed for {notification_type}: {str(e)}")
                # Fallback to basic content
@@ -149,23 +338,104 @@ class NotificationService:
                # Update notification status
                notification.status = NotificationStatus.SENT
                notification.sent_at = timezone.now()
-               notification.save(update_fields=['status', 'sent_at'])
+               notification.attempts += 1
+               notification.next_retry_at = None
+               notification.save(update_fields=['status', 'sent_at', 'attempts', 'next_retry_at'])
                
                logger.info(f"Email sent successfully to {notification.recipient_email}")
                
           except Exception as e:
                logger.error(f"Failed to send email to {notification.recipient_email}: {str(e)}")
+               # Schedules a retry with backoff, or dead-letters after the last attempt
+               NotificationDeliveryService.mark_failed(notification, str(e))
+     
+     @staticmethod
+     def _send_websocket_notification(notification: Notification) -> None:
+          """Push a notification to the recipient's open WebSocket connections"""
+          if notification.recipient_user_id is None:
                notification.status = NotificationStatus.FAILED
-               notification.error_message = str(e)
+               notification.error_message = "WebSocket notifications need a recipient user"
                notification.save(update_fields=['status', 'error_message'])
+               return
+          
+          try:
+               async_to_sync(get_channel_layer().group_send)(
+                    NotificationService.get_user_group(notification.recipient_user_id),
+                    {
+                         'type': 'notification.message',
+                         'notification': NotificationService.serialize_for_websocket(notification)
+                    }
+               )
+               
+               # SENT until a client acknowledges it (DELIVERED); offline users get it on connect
+               notification.status = NotificationStatus.SENT
+               notification.sent_at = timezone.now()
+               notification.attempts += 1
+               notification.next_retry_at = None
+               notification.save(update_fields=['status', 'sent_at', 'attempts', 'next_retry_at'])
+               
+               logger.info(f"WebSocket notification pushed to user {notification.recipient_user_id}")
+               
+          except Exception as e:
+               logger.error(f"Failed to push WebSocket notification {notification.id}: {str(e)}")
+               NotificationDeliveryService.mark_failed(notification, str(e))
      
      @staticmethod
-     def _send_websocket_notification(notification: Notification) -> None:
-          """Send WebSocket notification (placeholder for future implementation)"""
-          # TODO: Implement WebSocket notification
-          logger.info(f"WebSocket notification queued for {notification.recipient_email}")
-          notification.status = NotificationStatus.PENDING  # Keep as pending for now
-          notification.save(update_fields=['status'])
+     def push_to_inbox(notifications: List[Notification]) -> None:
+          """
+          Push new notifications to their recipient user's open WebSocket connections
+          
+          Runs after commit. Covers the channels that aren't delivered over WebSocket
+          themselves (e.g. email), so clients see inbox changes without polling
+          NotificationListAPIView. Users without an open connection lose nothing:
+          the inbox endpoint still lists the notification.
+          
+          Args:
+               notifications: Newly created notifications
+          """
+          notifications = [
+               n for n in notifications
+               if n.recipient_user_id is not None and n.channel != NotificationChannel.WEBSOCKET
+          ]
+          
+          if not notifications:
+               return
+          
+          def push():
+               group_send = async_to_sync(get_channel_layer().group_send)
+               
+               for notification in notifications:
+                    try:
+                         group_send(
+                              NotificationService.get_user_group(notification.recipient_user_id),
+                              {
+                                   'type': 'notification.message',
+                                   'notification': NotificationService.serialize_for_websocket(notification)
+                              }
+                         )
+                    except Exception as e:
+                         logger.warning(f"Failed to push notification {notification.id} to the inbox: {str(e)}")
+          
+          transaction.on_commit(push)
+     
+     @staticmethod
+     def get_user_group(user_id: int) -> str:
+          """Channel layer group of all WebSocket connections of a user"""
+          return f"notifications_user_{user_id}"
+     
+     @staticmethod
+     def serialize_for_websocket(notification: Notification) -> Dict[str, Any]:
+          """Payload pushed to WebSocket clients"""
+          return {
+               'id': notification.id,
+               'type': notification.type,
+               'channel': notification.channel,
+               'title': notification.subject,
+               'message': notification.message,
+               'event_id': notification.event_id,
+               'organization_id': notification.organization_id,
+               'created_at': notification.created_at.isoformat(),
+          }
      
      @staticmethod
      def _get_default_template_content(notification_type: str, channel: str) -> dict:
@@ -352,6 +622,27 @@ Best regards,
                               {{ organization_name }}
                               '''.strip()}},
                
+               # Attendee Promoted from Waitlist
+               NotificationType.ATTENDEE_PROMOTED: {
+                    NotificationChannel.EMAIL: {
+                         'subject_template': 'A spot opened up: {{ event_name }}',
+                         'body_template': '''
+                              Dear {{ attendee_name }},
+
+                              Good news! A spot has opened up for {{ event_name }} and you have been moved from the waitlist to confirmed.
+
+                              Event Details:
+                              - Date: {{ event_date }}
+                              - Time: {{ event_time }}
+                              - Venue: {{ venue_name }}
+                              - Address: {{ venue_address }}
+
+                              If you can no longer attend, please cancel your registration so the spot can go to someone else.
+
+                              Best regards,
+                              {{ organization_name }}
+                              '''.strip()}},
+               
                # Event Reminder 24 Hour
                NotificationType.EVENT_REMINDER_24H: {
                     NotificationChannel.EMAIL: {
@@ -391,9 +682,31 @@ Best regards,
 
                               Best regards,
                               {{ organization_name }}
+                              '''.strip()}},
+               
+               # Digest of buffered notifications
+               NotificationType.DIGEST: {
+                    NotificationChannel.EMAIL: {
+                         'subject_template': 'You have {{ count }} new notifications',
+                         'body_template': '''
+                              You have {{ count }} new notifications since {{ since }}.
+                              {% for item in items %}
+                              {{ forloop.counter }}. {{ item.subject }}
+                              {{ item.message }}
+                              {% endfor %}
+                              Best regards,
+                              EVP Team
                               '''.strip()}}
           }
           
+          # WebSocket messages reuse the email wording unless a template row overrides it
+          email_template = templates.get(notification_type, {}).get(NotificationChannel.EMAIL)
+          if channel == NotificationChannel.WEBSOCKET and email_template:
+               return {
+                    'title_template': email_template['subject_template'],
+                    'message_template': email_template['body_template']
+               }
+          
           # Return the template for the specific type and channel, or default empty template
           return templates.get(notification_type, {}).get(channel, {
                'subject_template': 'Notification',
@@ -415,17 +728,51 @@ class EventNotificationService:
      """Event-specific notification helpers"""
      
      @staticmethod
-     def send_attendee_registration_notification(attendee, event):
-          """Send registration confirmation to attendee"""
-          context = {
-               'attendee_name': attendee.full_name,
+     def build_event_context(event) -> Dict[str, Any]:
+          """
+          Build the event-level context shared by every recipient of an event notification
+          
+          Dates are formatted once and the organizer's organization name is resolved
+          in at most one query, so sends to many attendees only merge their own fields.
+          
+          Args:
+               event: The event object
+               
+          Returns:
+               dict: Event name, date, time, venue and organization name
+          """
+          return {
                'event_name': event.name,
                'event_date': event.start_datetime.strftime('%B %d, %Y'),
                'event_time': event.start_datetime.strftime('%I:%M %p'),
                'venue_name': event.venue_name,
                'venue_address': event.venue_address,
+               'organization_name': EventNotificationService._get_organization_name(event) or 'Event Organizer',
+          }
+     
+     @staticmethod
+     def _get_organization_name(event):
+          created_by_loaded = type(event).created_by.is_cached(event)
+          
+          if created_by_loaded and event.created_by is None:
+               return None
+          
+          if created_by_loaded and type(event.created_by).organization.is_cached(event.created_by):
+               organization = event.created_by.organization
+               return organization.name if organization else None
+          
+          # One query instead of lazily loading created_by and then its organization
+          return type(event).objects.filter(pk=event.pk).values_list(
+               'created_by__organization__name', flat=True
+          ).first()
+     
+     @staticmethod
+     def send_attendee_registration_notification(attendee, event, event_context=None):
+          """Send registration confirmation to attendee"""
+          context = {
+               **(event_context or EventNotificationService.build_event_context(event)),
+               'attendee_name': attendee.full_name,
                'registration_status': attendee.status,
-               'organization_name': event.created_by.organization.name if event.created_by and event.created_by.organization else 'Event Organizer',
                'registration_url': f"{settings.FRONTEND_BASE_URL}/events/{event.slug}"
           }
           
@@ -452,13 +799,8 @@ class EventNotificationService:
                return None
                
           context = {
+               **EventNotificationService.build_event_context(event),
                'attendee_name': attendee.full_name,
-               'event_name': event.name,
-               'event_date': event.start_datetime.strftime('%B %d, %Y'),
-               'event_time': event.start_datetime.strftime('%I:%M %p'),
-               'venue_name': event.venue_name,
-               'venue_address': event.venue_address,
-               'organization_name': event.created_by.organization.name if event.created_by and event.created_by.organization else 'Event Organizer',
                'old_status': old_status,
                'new_status': attendee.status
           }
@@ -471,33 +813,41 @@ class EventNotificationService:
                event=event
           )
      
+     @staticmethod
+     def send_attendee_promoted_notifications(event, attendees):
+          """Send promotion notifications to attendees moved from the waitlist"""
+          return NotificationService.send_bulk_notifications(
+               notification_type=NotificationType.ATTENDEE_PROMOTED,
+               recipients=[
+                    {'email': attendee.email, 'user': attendee.user, 'context': {'attendee_name': attendee.full_name}}
+                    for attendee in attendees
+               ],
+               shared_context=EventNotificationService.build_event_context(event),
+               event=event
+          )
+     
      @staticmethod
      def send_event_cancellation_notification(event, attendees_queryset=None):
           """Send cancellation notification to all confirmed attendees"""
           if attendees_queryset is None:
                attendees_queryset = event.attendees.filter(status='confirmed')
           
-          notifications = []
-          for attendee in attendees_queryset:
-               context = {
-                    'attendee_name': attendee.full_name,
-                    'event_name': event.name,
-                    'event_date': event.start_datetime.strftime('%B %d, %Y'),
-                    'venue_name': event.venue_name,
-                    'organization_name': event.created_by.organization.name if event.created_by and event.created_by.organization else 'Event Organizer',
-                    'cancellation_reason': 'The event has been cancelled by the organizer.'
-               }
-               
-               notification = NotificationService.send_notification(
-                    notification_type=NotificationType.EVENT_CANCELLED,
-                    recipient_email=attendee.email,
-                    context=context,
-                    recipient_user=attendee.user,
-                    event=event
-               )
-               notifications.append(notification)
+          shared_context = {
+               **EventNotificationService.build_event_context(event),
+               'cancellation_reason': 'The event has been cancelled by the organizer.'
+          }
+          
+          recipients = [
+               {'email': attendee.email, 'user': attendee.user, 'context': {'attendee_name': attendee.full_name}}
+               for attendee in attendees_queryset.select_related('user')
+          ]
           
-          return notifications
+          return NotificationService.send_bulk_notifications(
+               notification_type=NotificationType.EVENT_CANCELLED,
+               recipients=recipients,
+               shared_context=shared_context,
+               event=event
+          )
 
 
 class OrganizationNotificationService:
@@ -0,0 +1,207 @@
+import logging
+from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Exists, F, OuterRef
+from django.utils import timezone
+from apps.events.models import Event, EventStatus, Attendee, AttendeeStatus
+from apps.notifications.models import Notification, NotificationStatus, NotificationType, ReminderCheckpoint
+from services.notification.notification_service import NotificationService, EventNotificationService
+
+logger = logging.getLogger(__name__)
+
+
+class EventReminderService:
+     """
+     Set-based event reminder job
+
+     Each event's attendees are reminded in id-ordered chunks. Every chunk is
+     queued in one transaction together with its ReminderCheckpoint update, so a
+     crashed run resumes after the last committed attendee instead of re-scanning
+     the event. Checkpoints are kept per event start time: an event with a
+     completed checkpoint is not selected again until it is rescheduled.
+     """
+
+     REMINDER_TYPES = {
+          # reminder type: (notification type, lead time, window around the lead time, label)
+          '24h': (NotificationType.EVENT_REMINDER_24H, timedelta(hours=24), timedelta(hours=1), '24-hour'),
+          '1h': (NotificationType.EVENT_REMINDER_1H, timedelta(hours=1), timedelta(minutes=15), '1-hour'),
+     }
+     SENT_STATUSES = [
+          NotificationStatus.PENDING,
+          NotificationStatus.PROCESSING,
+          NotificationStatus.SENT,
+          NotificationStatus.DELIVERED,
+     ]
+
+     @staticmethod
+     def get_due_events(reminder_type: str, now=None):
+          """
+          Get the events whose reminder window is open and not yet completed
+
+          Args:
+               reminder_type: '24h' or '1h'
+               now: Reference time (defaults to now)
+
+          Returns:
+               QuerySet: Events needing reminders
+          """
+          notification_type, lead_time, window, _ = EventReminderService.REMINDER_TYPES[reminder_type]
+          target_time = (now or timezone.now()) + lead_time
+
+          return Event.objects.filter(
+               status=EventStatus.PUBLISHED,
+               start_datetime__gte=target_time - window,
+               start_datetime__lte=target_time + window
+          ).exclude(
+               Exists(ReminderCheckpoint.objects.filter(
+                    event=OuterRef('pk'),
+                    type=notification_type,
+                    start_datetime=OuterRef('start_datetime'),
+                    completed_at__isnull=False
+               ))
+          ).select_related('created_by', 'created_by__organization').order_by('start_datetime', 'id')
+
+     @staticmethod
+     def send_event_reminders(event: Event, reminder_type: str, chunk_size: int = None) -> dict:
+          """
+          Queue the reminders of one event, resuming from its checkpoint
+
+          Args:
+               event: The event (with created_by and organization loaded)
+               reminder_type: '24h' or '1h'
+               chunk_size: Attendees per transaction (default REMINDER_CHUNK_SIZE)
+
+          Returns:
+               dict: Numbers of queued, skipped and failed reminders
+          """
+          notification_type, _, _, label = EventReminderService.REMINDER_TYPES[reminder_type]
+          chunk_size = chunk_size or settings.REMINDER_CHUNK_SIZE
+          result = {'queued': 0, 'skipped': 0, 'failed': 0}
+
+          checkpoint, _ = ReminderCheckpoint.objects.get_or_create(
+               event=event,
+               type=notification_type,
+               start_datetime=event.start_datetime
+          )
+
+          if checkpoint.completed_at:
+               return result
+
+          # Reminders are deduplicated per event start time, so a rescheduled event
+          # reminds everyone again
+          dedupe_bucket = event.start_datetime.isoformat()
+          
+          # One query for everyone already reminded about this start time; overlapping
+          # runs that race past this are stopped by the unique dedupe key on insert
+          already_sent = set(
+               Notification.objects.filter(
+                    type=notification_type,
+                    event=event,
+                    status__in=EventReminderService.SENT_STATUSES,
+                    dedupe_key__isnull=False
+               ).values_list('dedupe_key', flat=True)
+          )
+
+          shared_context = {
+               **EventNotificationService.build_event_context(event),
+               'reminder_type': label
+          }
+
+          attendees = Attendee.objects.filter(
+               event=event,
+               status=AttendeeStatus.CONFIRMED
+          ).select_related('user').order_by('id')
+
+          last_attendee_id = checkpoint.last_attendee_id
+
+          while True:
+               chunk = list(attendees.filter(id__gt=last_attendee_id)[:chunk_size])
+
+               if not chunk:
+                    break
+
+               recipients = []
+               for attendee in chunk:
+                    dedupe_key = NotificationService.build_dedupe_key(notification_type, event, attendee.email, dedupe_bucket)
+                    
+                    if dedupe_key in already_sent:
+                         result['skipped'] += 1
+                         continue
+
+                    already_sent.add(dedupe_key)
+                    recipients.append({
+                         'email': attendee.email,
+                         'user': attendee.user,
+                         'context': {'attendee_name': attendee.full_name}
+                    })
+
+               last_attendee_id = chunk[-1].id
+
+               with transaction.atomic():
+                    report = NotificationService.send_bulk_notifications(
+                         notification_type=notification_type,
+                         recipients=recipients,
+                         shared_context=shared_context,
+                         event=event,
+                         dedupe_bucket=dedupe_bucket
+                    )
+                    queued = report['total'] - report['failed']
+
+                    ReminderCheckpoint.objects.filter(pk=checkpoint.pk).update(
+                         last_attendee_id=last_attendee_id,
+                         sent_count=F('sent_count') + queued,
+                         updated_at=timezone.now()
+                    )
+
+               result['queued'] += queued
+               result['failed'] += report['failed']
+
+          ReminderCheckpoint.objects.filter(pk=checkpoint.pk).update(completed_at=timezone.now(), updated_at=timezone.now())
+
+          return result
+
+     @staticmethod
+     def run(reminder_type: str, workers: int = 1, chunk_size: int = None, on_event_done=None) -> dict:
+          """
+          Queue reminders for every due event
+
+          Args:
+               reminder_type: '24h' or '1h'
+               workers: Number of events processed in parallel
+               chunk_size: Attendees per transaction (default REMINDER_CHUNK_SIZE)
+               on_event_done: Optional callback(event, result or exception) per event
+
+          Returns:
+               dict: Totals over all events
+          """
+          events = list(EventReminderService.get_due_events(reminder_type))
+          totals = {'events': len(events), 'queued': 0, 'skipped': 0, 'failed': 0}
+
+          def process(event):
+               try:
+                    outcome = EventReminderService.send_event_reminders(event, reminder_type, chunk_size)
+               except Exception as e:
+                    logger.error(f"Failed to send {reminder_type} reminders for event {event.id}: {str(e)}")
+                    outcome = e
+               finally:
+                    if workers > 1:
+                         # Each pool thread has its own connection; don't leak it
+                         connection.close()
+               return event, outcome
+
+          if workers > 1:
+               with ThreadPoolExecutor(max_workers=workers) as executor:
+                    outcomes = list(executor.map(process, events))
+          else:
+               outcomes = [process(event) for event in events]
+
+          for event, outcome in outcomes:
+               if on_event_done:
+                    on_event_done(event, outcome)
+               if isinstance(outcome, dict):
+                    for key in ('queued', 'skipped', 'failed'):
+                         totals[key] += outcome[key]
+
+          return totals
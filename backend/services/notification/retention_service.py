@@ -0,0 +1,138 @@
+import time
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from apps.notifications.models import Notification, NotificationArchive, NotificationStatus
+from core.middleware.chunk_optimizer import chunked_pks
+
+
+class NotificationRetentionService:
+     """
+     Retention policy of the Notification table
+
+     Finished notifications older than the retention period are either moved to
+     NotificationArchive (without body and metadata) or kept in place with their
+     body dropped. Rows are processed in primary-key chunks, each in its own short
+     transaction, and rows that may still change (pending, processing, buffered,
+     waiting for a retry) are never touched, so the job can run next to live traffic.
+     Inbox notifications left unread past NOTIFICATION_UNREAD_DAYS are marked read
+     the same way, which keeps the partial unread index small.
+     """
+
+     FINISHED = (
+          Q(status__in=[
+               NotificationStatus.SENT,
+               NotificationStatus.DELIVERED,
+               NotificationStatus.DIGESTED,
+               NotificationStatus.DEAD_LETTER,
+          ]) |
+          Q(status=NotificationStatus.FAILED, next_retry_at__isnull=True)
+     )
+     ARCHIVE_FIELDS = [
+          'id', 'type', 'channel', 'status', 'recipient_email', 'recipient_user_id',
+          'event_id', 'organization_id', 'subject', 'attempts', 'created_at', 'sent_at'
+     ]
+
+     @staticmethod
+     def get_expired(days: int = None):
+          """
+          Get the finished notifications past the retention period
+
+          Args:
+               days: Retention period in days (default NOTIFICATION_RETENTION_DAYS)
+
+          Returns:
+               QuerySet: Notifications to archive
+          """
+          days = days if days is not None else settings.NOTIFICATION_RETENTION_DAYS
+          cutoff = timezone.now() - timedelta(days=days)
+
+          return Notification.objects.filter(NotificationRetentionService.FINISHED, created_at__lt=cutoff)
+
+     @staticmethod
+     def expire_unread(days: int = None, chunk_size: int = None) -> int:
+          """
+          Mark notifications that stayed unread past the unread period as read
+
+          Args:
+               days: Unread period in days (default NOTIFICATION_UNREAD_DAYS)
+               chunk_size: Rows per transaction (default NOTIFICATION_ARCHIVE_CHUNK_SIZE)
+
+          Returns:
+               int: Number of notifications marked as read
+          """
+          days = days if days is not None else settings.NOTIFICATION_UNREAD_DAYS
+          chunk_size = chunk_size or settings.NOTIFICATION_ARCHIVE_CHUNK_SIZE
+          cutoff = timezone.now() - timedelta(days=days)
+          stale = Notification.objects.filter(read_at__isnull=True, created_at__lt=cutoff)
+          expired = 0
+
+          for pks in chunked_pks(stale, chunk_size):
+               with transaction.atomic():
+                    now = timezone.now()
+                    expired += stale.filter(pk__in=pks).update(read_at=now, updated_at=now)
+
+          return expired
+
+     @staticmethod
+     def archive(days: int = None, chunk_size: int = None, strip_bodies: bool = False, pause: float = 0) -> int:
+          """
+          Archive (or strip the bodies of) expired notifications
+
+          Args:
+               days: Retention period in days (default NOTIFICATION_RETENTION_DAYS)
+               chunk_size: Rows per transaction (default NOTIFICATION_ARCHIVE_CHUNK_SIZE)
+               strip_bodies: Keep the rows and only drop message and metadata
+               pause: Seconds to sleep between chunks to limit load on a live database
+
+          Returns:
+               int: Number of archived (or stripped) notifications
+          """
+          chunk_size = chunk_size or settings.NOTIFICATION_ARCHIVE_CHUNK_SIZE
+          expired = NotificationRetentionService.get_expired(days)
+
+          if strip_bodies:
+               # Stripped rows stay in the table; don't visit them again on the next run
+               expired = expired.exclude(message='')
+
+          processed = 0
+
+          for pks in chunked_pks(expired, chunk_size):
+               if strip_bodies:
+                    processed += NotificationRetentionService._strip_chunk(expired, pks)
+               else:
+                    processed += NotificationRetentionService._archive_chunk(expired, pks)
+
+               if pause:
+                    time.sleep(pause)
+
+          return processed
+
+     @staticmethod
+     def _archive_chunk(expired, pks: list) -> int:
+          with transaction.atomic():
+               # Re-check eligibility under lock; skip rows a live request is updating
+               rows = list(
+                    expired.filter(pk__in=pks)
+                    .select_for_update(skip_locked=True)
+                    .values(*NotificationRetentionService.ARCHIVE_FIELDS)
+               )
+
+               if not rows:
+                    return 0
+
+               archived_ids = [row['id'] for row in rows]
+
+               NotificationArchive.objects.bulk_create(
+                    [NotificationArchive(original_id=row.pop('id'), **row) for row in rows]
+               )
+               Notification.objects.filter(pk__in=archived_ids).delete()
+
+          return len(rows)
+
+     @staticmethod
+     def _strip_chunk(expired, pks: list) -> int:
+          with transaction.atomic():
+               return expired.filter(pk__in=pks).update(message='', metadata={}, updated_at=timezone.now())
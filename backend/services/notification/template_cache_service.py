@@ -0,0 +1,105 @@
+import time
+import threading
+from django.core.cache import cache
+from django.template import Template
+from django.utils.functional import cached_property
+from apps.notifications.models import NotificationTemplate, NotificationChannel
+
+
+class CompiledNotificationTemplate:
+     """Parsed subject/title and body/message templates of one NotificationTemplate row"""
+
+     def __init__(self, template: NotificationTemplate):
+          if template.channel == NotificationChannel.WEBSOCKET:
+               self.subject_source = template.title_template
+               self.body_source = template.message_template
+          else:
+               self.subject_source = template.subject_template
+               self.body_source = template.body_template
+
+     # Parsed on first render, so syntax errors surface where the caller handles rendering errors
+     @cached_property
+     def subject(self) -> Template:
+          return Template(self.subject_source)
+
+     @cached_property
+     def body(self) -> Template:
+          return Template(self.body_source)
+
+
+class NotificationTemplateCacheService:
+     """
+     In-process cache of compiled notification templates
+
+     Entries are keyed by (type, channel), so a template is fetched and parsed once
+     per process instead of once per recipient. Saving or deleting a
+     NotificationTemplate bumps a version number in the Django cache once the
+     transaction commits; every process compares it with the version its entries
+     were loaded under and drops them when it changed.
+
+     Invalidation only reaches other processes through a shared cache (Redis in
+     development and production). With the LocMemCache of the base settings each
+     process has its own version, so only the process that saved the template
+     drops its entries; the others keep theirs until they restart.
+     """
+
+     VERSION_KEY = 'notification_templates:version'
+
+     _lock = threading.Lock()
+     _version = None
+     _templates = {}
+
+     @staticmethod
+     def get_compiled(notification_type: str, channel: str, defaults_factory) -> CompiledNotificationTemplate:
+          """
+          Get the compiled template for a notification type and channel
+
+          Args:
+               notification_type: Type of notification from NotificationType
+               channel: Notification channel
+               defaults_factory: Callable returning the default template fields, used
+                    when the template row doesn't exist yet
+
+          Returns:
+               CompiledNotificationTemplate: Compiled subject and body templates
+          """
+          cls = NotificationTemplateCacheService
+          version = cache.get(cls.VERSION_KEY)
+
+          with cls._lock:
+               if version != cls._version:
+                    cls._templates = {}
+                    cls._version = version
+
+               compiled = cls._templates.get((notification_type, channel))
+
+          if compiled is not None:
+               return compiled
+
+          template, _ = NotificationTemplate.objects.get_or_create(
+               type=notification_type,
+               channel=channel,
+               defaults=defaults_factory(notification_type, channel)
+          )
+          compiled = CompiledNotificationTemplate(template)
+
+          with cls._lock:
+               # Don't store entries loaded under a version that was bumped meanwhile
+               if cls._version == version:
+                    cls._templates[(notification_type, channel)] = compiled
+
+          return compiled
+
+     @staticmethod
+     def invalidate() -> None:
+          """Drop the compiled templates in every process"""
+          cls = NotificationTemplateCacheService
+
+          try:
+               cache.incr(cls.VERSION_KEY)
+          except ValueError:
+               cache.set(cls.VERSION_KEY, time.time_ns(), timeout=None)
+
+          with cls._lock:
+               cls._templates = {}
+               cls._version = None
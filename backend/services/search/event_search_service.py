@@ -0,0 +1,141 @@
+import re
+import logging
+from django.db import connection, DatabaseError
+from django.db.models import Q
+from apps.events.models import Event, EventSearchDocument, EventStatus
+
+logger = logging.getLogger(__name__)
+
+
+class EventSearchService:
+     """
+     Service class for the public event full-text search index
+
+     Search documents are rebuilt per event whenever the event, one of its
+     speakers or one of its sessions changes. Queries go to the vendor index:
+     FTS5 on SQLite, tsvector/GIN on PostgreSQL, and a plain icontains scan
+     over the single document table elsewhere.
+     """
+
+     MAX_RESULTS = 500
+
+     @staticmethod
+     def index_event(event_id: int) -> None:
+          """
+          Rebuild (or drop) the search document for one event
+
+          Args:
+               event_id: The ID of the event
+          """
+          event = Event.objects.filter(pk=event_id).first()
+
+          # Only published public events are searchable
+          if not event or event.status != EventStatus.PUBLISHED or not event.is_public:
+               EventSearchDocument.objects.filter(event_id=event_id).delete()
+               return
+
+          speakers = event.speakers.values_list('full_name', 'title', 'company')
+          sessions = event.sessions.values_list('title', 'description')
+
+          body_parts = [event.description, event.venue_name, event.venue_address]
+          body_parts.extend(' '.join(speaker) for speaker in speakers)
+          body_parts.extend(' '.join(session) for session in sessions)
+
+          EventSearchDocument.objects.update_or_create(
+               event=event,
+               defaults={
+                    'title': event.name,
+                    'body': '\n'.join(part for part in body_parts if part)
+               }
+          )
+
+     @staticmethod
+     def rebuild_index() -> int:
+          """
+          Rebuild the search documents for all events
+
+          Returns:
+               int: Number of indexed events
+          """
+          searchable_ids = set(
+               Event.objects.filter(status=EventStatus.PUBLISHED, is_public=True).values_list('id', flat=True)
+          )
+
+          EventSearchDocument.objects.exclude(event_id__in=searchable_ids).delete()
+
+          for event_id in searchable_ids:
+               EventSearchService.index_event(event_id)
+
+          return len(searchable_ids)
+
+     @staticmethod
+     def search(query: str, limit: int = MAX_RESULTS) -> list:
+          """
+          Search the index and return matching event IDs, best match first
+
+          Args:
+               query: Free text entered by the user
+               limit: Maximum number of results
+
+          Returns:
+               list: Event IDs ordered by relevance
+          """
+          terms = re.findall(r'\w+', query.lower())
+
+          if not terms:
+               return []
+
+          try:
+               if connection.vendor == 'sqlite':
+                    return EventSearchService._search_sqlite(terms, limit)
+               if connection.vendor == 'postgresql':
+                    return EventSearchService._search_postgresql(terms, limit)
+          except DatabaseError as e:
+               # Index not available (e.g. SQLite built without FTS5), use the plain scan
+               logger.warning(f"Full-text search unavailable, falling back to scan: {str(e)}")
+
+          return EventSearchService._search_fallback(terms, limit)
+
+     @staticmethod
+     def _search_sqlite(terms: list, limit: int) -> list:
+          # Quote every term so user input can't inject FTS5 syntax; prefix match each one
+          match = ' '.join(f'"{term}"*' for term in terms)
+
+          with connection.cursor() as cursor:
+               cursor.execute(
+                    """
+                    SELECT rowid FROM events_eventsearch_fts
+                    WHERE events_eventsearch_fts MATCH %s
+                    ORDER BY bm25(events_eventsearch_fts, 10.0, 1.0)
+                    LIMIT %s
+                    """,
+                    [match, limit]
+               )
+               return [row[0] for row in cursor.fetchall()]
+
+     @staticmethod
+     def _search_postgresql(terms: list, limit: int) -> list:
+          # Terms are \w+ only, so they are safe inside a tsquery
+          tsquery = ' & '.join(f'{term}:*' for term in terms)
+
+          with connection.cursor() as cursor:
+               cursor.execute(
+                    """
+                    SELECT event_id FROM events_eventsearchdocument, to_tsquery('english', %s) query
+                    WHERE search_vector @@ query
+                    ORDER BY ts_rank(search_vector, query) DESC
+                    LIMIT %s
+                    """,
+                    [tsquery, limit]
+               )
+               return [row[0] for row in cursor.fetchall()]
+
+     @staticmethod
+     def _search_fallback(terms: list, limit: int) -> list:
+          condition = Q()
+          for term in terms:
+               condition &= Q(title__icontains=term) | Q(body__icontains=term)
+
+          return list(
+               EventSearchDocument.objects.filter(condition).values_list('event_id', flat=True)[:limit]
+          )
@@ -0,0 +1,117 @@
+import base64
+import binascii
+import json
+from django.core.exceptions import FieldDoesNotExist, ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+
+
+class CursorUtil:
+     """
+     Keyset (cursor) pagination helpers.
+     
+     A cursor is an opaque, url-safe token holding the ordering values of the
+     last row on the previous page. The next page is fetched with a WHERE clause
+     on those values instead of an OFFSET, so every page costs the same.
+     """
+
+     @staticmethod
+     def encode_cursor(values: list) -> str:
+          raw = json.dumps(
+               [value.isoformat() if hasattr(value, 'isoformat') else value for value in values],
+               separators=(',', ':')
+          )
+          return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+     @staticmethod
+     def decode_cursor(cursor: str, length: int) -> list:
+          try:
+               padded = cursor + '=' * (-len(cursor) % 4)
+               values = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+          except (ValueError, TypeError, binascii.Error):
+               raise ValidationError("Invalid cursor.")
+          
+          if not isinstance(values, list) or len(values) != length:
+               raise ValidationError("Invalid cursor.")
+          
+          # Only plain scalars are ever encoded
+          if any(isinstance(value, bool) or not isinstance(value, (str, int, float)) for value in values):
+               raise ValidationError("Invalid cursor.")
+          
+          return values
+
+     @staticmethod
+     def _to_python(model, field_path: str, value):
+          """Convert a decoded cursor value to the type of the model field it orders by"""
+          try:
+               for name in field_path.split('__')[:-1]:
+                    model = model._meta.get_field(name).related_model
+               field = model._meta.get_field(field_path.split('__')[-1])
+          except (FieldDoesNotExist, AttributeError):
+               # Annotations have no model field; the database compares the raw value
+               return value
+          
+          try:
+               return field.to_python(value)
+          except (DjangoValidationError, ValueError, TypeError):
+               raise ValidationError("Invalid cursor.")
+
+     @staticmethod
+     def paginate(queryset, ordering: list, cursor: str = None, page_size: int = 20):
+          """
+          Fetch one page of a queryset using keyset pagination
+          
+          Args:
+               queryset: Queryset to paginate
+               ordering: Unique ordering, e.g. ['start_datetime', 'id'] or ['-created_at', '-id'].
+                    All fields must share the same direction and the last one must be unique.
+               cursor: Cursor returned by the previous page (optional)
+               page_size: Number of rows per page
+               
+          Returns:
+               tuple: (list of rows, next cursor or None)
+               
+          Raises:
+               ValidationError: If the cursor is invalid or page_size is below 1
+          """
+          if page_size < 1:
+               raise ValidationError("page_size must be at least 1.")
+          
+          fields = [field.lstrip('-') for field in ordering]
+          descending = ordering[0].startswith('-')
+          lookup = 'lt' if descending else 'gt'
+          
+          queryset = queryset.order_by(*ordering)
+          
+          if cursor:
+               values = [
+                    CursorUtil._to_python(queryset.model, field, value)
+                    for field, value in zip(fields, CursorUtil.decode_cursor(cursor, len(fields)))
+               ]
+               
+               # (f1, f2, ...) > (v1, v2, ...) expanded into OR-ed prefix comparisons
+               condition = Q()
+               for index, field in enumerate(fields):
+                    prefix = {fields[i]: values[i] for i in range(index)}
+                    condition |= Q(**prefix, **{f'{field}__{lookup}': values[index]})
+               
+               queryset = queryset.filter(condition)
+          
+          rows = list(queryset[:page_size + 1])
+          
+          next_cursor = None
+          if len(rows) > page_size:
+               rows = rows[:page_size]
+               last = rows[-1]
+               next_cursor = CursorUtil.encode_cursor([CursorUtil._get_value(last, field) for field in fields])
+          
+          return rows, next_cursor
+
+     @staticmethod
+     def _get_value(row, field: str):
+          if isinstance(row, dict):
+               return row[field]
+          
+          for attr in field.split('__'):
+               row = getattr(row, attr)
+          return row
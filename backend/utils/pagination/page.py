@@ -0,0 +1,29 @@
+from rest_framework.exceptions import ValidationError
+
+
+class PageUtil:
+     """Page number pagination helpers."""
+
+     @staticmethod
+     def get_page_params(query_params, default_page_size: int = 20, max_page_size: int = 100) -> tuple:
+          """
+          Read and validate the page and page_size query parameters
+          
+          Args:
+               query_params: Request query parameters
+               default_page_size: page_size when the parameter is missing
+               max_page_size: Upper bound of page_size
+               
+          Returns:
+               tuple: (page, page_size) with page >= 1 and 1 <= page_size <= max_page_size
+               
+          Raises:
+               ValidationError: If page or page_size is not an integer
+          """
+          try:
+               page = int(query_params.get('page', 1))
+               page_size = int(query_params.get('page_size', default_page_size))
+          except (TypeError, ValueError):
+               raise ValidationError("page and page_size must be integers.")
+          
+          return max(page, 1), min(max(page_size, 1), max_page_size)
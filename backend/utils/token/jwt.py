@@ -37,7 +37,8 @@ class TokenUtil:
                payload = jwt.decode(token, config('ACCESS_SECRET', default='access_secret'), algorithms=config('ENCRYPTION_ALGORITHM', default='HS256'))
                return {
                     'user_id': payload['user_id'],
-                    'role': payload['role']
+                    'role': payload['role'],
+                    'exp': payload['exp']
                }
           except jwt.ExpiredSignatureError:
                raise exceptions.PermissionDenied("Access token is expired.")